@@ -0,0 +1,182 @@
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import List, Optional
+
+from app.core.config import Config
+
+logger = logging.getLogger(__name__)
+
+AUDIO_EXTENSIONS = {".mp3"}
+
+
+@dataclass
+class BatchResult:
+    input: str
+    output: str
+    status: str = "pending"
+    error: Optional[str] = None
+    duration_sec: float = 0.0
+    segments: int = 0
+    elapsed_sec: float = 0.0
+
+
+def collect_inputs(
+    input_dir: Optional[Path] = None,
+    manifest: Optional[Path] = None,
+) -> List[Path]:
+    if input_dir is not None:
+        return sorted(
+            path for path in Path(input_dir).iterdir()
+            if path.is_file() and path.suffix.lower() in AUDIO_EXTENSIONS
+        )
+
+    # One path per line; blank lines and '#' comments are skipped, relative
+    # paths are resolved against the manifest's directory.
+    manifest = Path(manifest)
+    inputs = []
+    for line in manifest.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        path = Path(line)
+        inputs.append(path if path.is_absolute() else manifest.parent / path)
+    return inputs
+
+
+class BatchRunner:
+    def __init__(self, config: Config, inputs: List[Path]):
+        if config.streaming:
+            # Files are prepared whole on the prefetch thread; there is no
+            # streaming path to fall back to.
+            raise ValueError("Batch mode does not support streaming; run files one at a time with --input")
+        self.config = config
+        self.inputs = inputs
+        self.results: List[BatchResult] = []
+
+    def _file_configs(self) -> List[Config]:
+        configs = []
+        used = set()
+        for input_file in self.inputs:
+            name = Path(input_file).stem
+            suffix = 2
+            while name in used:
+                name = f"{Path(input_file).stem}_{suffix}"
+                suffix += 1
+            used.add(name)
+
+            # Separate temp dirs: the next file is decoded while this one is
+            # still being read.
+            configs.append(self.config.derive(
+                input_file=input_file,
+                output_dir=Path(self.config.output_dir) / name,
+                temp_dir=Path(self.config.temp_dir) / name,
+            ))
+        return configs
+
+    def _load_models(self):
+        from app.core.cascade import create_asr_engine
+        from app.core.vad import VADSegmenter
+        from app.core.workers import ASRWorkerPool
+
+        vad_segmenter = VADSegmenter(self.config)
+        if self.config.num_workers > 1 and not self.config.streaming:
+            asr_engine = ASRWorkerPool(self.config)
+        else:
+            asr_engine = create_asr_engine(self.config)
+        return vad_segmenter, asr_engine
+
+    def run(self) -> bool:
+        from app.core.pipeline import DictationPipeline
+
+        start_time = time.time()
+        logger.info(f"Starting batch of {len(self.inputs)} recordings")
+
+        vad_segmenter, asr_engine = self._load_models()
+        pipelines = [
+            DictationPipeline(file_config, vad_segmenter=vad_segmenter, asr_engine=asr_engine)
+            for file_config in self._file_configs()
+        ]
+        self.results = [
+            BatchResult(input=str(p.config.input_file), output=str(p.config.output_dir))
+            for p in pipelines
+        ]
+
+        # One prefetch thread: decoding and VAD for file i+1 run while file
+        # i is in ASR on the main thread.
+        prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        try:
+            future = prefetcher.submit(self._prepare, pipelines[0]) if pipelines else None
+
+            for idx, pipeline in enumerate(pipelines):
+                result = self.results[idx]
+                logger.info(f"[{idx + 1}/{len(pipelines)}] {pipeline.config.input_file}")
+
+                try:
+                    audio, segments, prepare_sec = future.result()
+                except Exception as e:
+                    prepared = None
+                    self._fail(result, e)
+                else:
+                    prepared = (audio, segments)
+                    result.duration_sec = round(audio.duration, 2)
+                    result.segments = len(segments)
+                    result.elapsed_sec = prepare_sec
+
+                if idx + 1 < len(pipelines):
+                    future = prefetcher.submit(self._prepare, pipelines[idx + 1])
+
+                if prepared is None:
+                    continue
+
+                file_start = time.time()
+                try:
+                    pipeline.transcribe_and_export(*prepared)
+                    result.status = "done"
+                except Exception as e:
+                    self._fail(result, e)
+                result.elapsed_sec = round(result.elapsed_sec + time.time() - file_start, 2)
+
+        finally:
+            prefetcher.shutdown(wait=True)
+            if hasattr(asr_engine, "close"):
+                asr_engine.close()
+
+        elapsed = time.time() - start_time
+        self.write_summary(elapsed)
+
+        failed = sum(1 for result in self.results if result.status != "done")
+        logger.info(
+            f"Batch completed in {elapsed:.1f} seconds: "
+            f"{len(self.results) - failed} done, {failed} failed"
+        )
+        return failed == 0
+
+    def _prepare(self, pipeline):
+        start = time.time()
+        audio, segments = pipeline.prepare()
+        return audio, segments, time.time() - start
+
+    def _fail(self, result: BatchResult, error: Exception):
+        logger.error(f"Failed to process {result.input}: {error}", exc_info=True)
+        result.status = "failed"
+        result.error = str(error)
+
+    def write_summary(self, elapsed_sec: float):
+        summary_path = Path(self.config.output_dir) / "batch_summary.json"
+        data = {
+            "total": len(self.results),
+            "done": sum(1 for result in self.results if result.status == "done"),
+            "failed": sum(1 for result in self.results if result.status == "failed"),
+            "audio_duration_sec": round(sum(result.duration_sec for result in self.results), 2),
+            "elapsed_sec": round(elapsed_sec, 2),
+            "files": [asdict(result) for result in self.results],
+        }
+
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+        logger.info(f"Batch summary written to: {summary_path}")
@@ -0,0 +1,101 @@
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import List, Dict, Iterable
+from .config import Config
+from .audio import AudioBuffer, AudioConverter
+from .asr import ASREngine, decode_options
+from .cache import shift_results
+from .cascade import CascadeASREngine
+from .workspace import Workspace
+
+logger = logging.getLogger(__name__)
+
+WORDS_FILE = "words.jsonl"
+
+
+class WordAligner:
+    # Word timestamps for runs made with defer_word_alignment, computed only
+    # for the segments somebody opens. The segment's span is decoded again
+    # with word timestamps on, so the words can differ slightly from the
+    # stored text. Results are appended to words.jsonl in the output folder
+    # and each segment is aligned at most once.
+    def __init__(self, config: Config, engine=None):
+        self.config = config
+        self.output_dir = Path(config.output_dir)
+        self.path = self.output_dir / WORDS_FILE
+        # A cascade aligns with its accurate model; a worker pool cannot take
+        # per-call options, so it gets an in-process engine on first use.
+        if isinstance(engine, CascadeASREngine):
+            engine = engine.final
+        self._engine = engine if isinstance(engine, ASREngine) else None
+        self._audio = None
+        self._segments = None
+        self.lock = threading.Lock()
+        self.words = self._load()
+
+    @property
+    def engine(self) -> ASREngine:
+        if self._engine is None:
+            self._engine = ASREngine(self.config)
+        return self._engine
+
+    @property
+    def segments(self) -> List[Dict]:
+        if self._segments is None:
+            with open(self.output_dir / "transcript.json", 'r', encoding='utf-8') as f:
+                self._segments = json.load(f)["segments"]
+        return self._segments
+
+    @property
+    def audio(self) -> AudioBuffer:
+        if self._audio is None:
+            audio = Workspace(self.config).load_pcm() if self.config.use_workspace else None
+            self._audio = audio if audio is not None else AudioConverter(self.config).decode_pcm()
+        return self._audio
+
+    def align(self, indices: Iterable[int]) -> Dict[int, List[Dict]]:
+        with self.lock:
+            aligned = {}
+            for idx in indices:
+                if idx not in self.words:
+                    self.words[idx] = self._align(idx)
+                    self._append(idx, self.words[idx])
+                aligned[idx] = self.words[idx]
+            return aligned
+
+    def _align(self, idx: int) -> List[Dict]:
+        if not 0 <= idx < len(self.segments):
+            raise IndexError(f"No segment {idx} in {self.output_dir / 'transcript.json'}")
+
+        segment = self.segments[idx]
+        if segment.get("words"):
+            # Aligned during the run already.
+            return segment["words"]
+
+        results = self.engine.backend.transcribe(
+            self.audio.to_float32(segment["start"], segment["end"]),
+            **{**decode_options(self.config), "word_timestamps": True},
+        )
+        words = [word for result in shift_results(results, segment["start"]) for word in result["words"]]
+        logger.info(f"Aligned segment {idx}: {len(words)} words")
+        return words
+
+    def _load(self) -> Dict[int, List[Dict]]:
+        words = {}
+        if not self.path.exists():
+            return words
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                words[record["idx"]] = record["words"]
+        return words
+
+    def _append(self, idx: int, words: List[Dict]):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({"idx": idx, "words": words}, ensure_ascii=False) + "\n")
+
@@ -0,0 +1,247 @@
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Dict, Iterable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Segments are indexed with FTS5's trigram tokenizer: Korean has no spaces
+# between particles and stems ("결정했습니다"), so word tokenizers miss most
+# substring queries while trigrams match any substring of 3+ characters.
+# Two-syllable terms ("명세", "일정") are common in Korean and too short for
+# trigrams, so segment_bigrams maps every two-character substring to its
+# segments. Only one-character terms fall back to scanning.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    id INTEGER PRIMARY KEY,
+    output_dir TEXT NOT NULL UNIQUE,
+    input_file TEXT,
+    title TEXT,
+    date TEXT,
+    attendees TEXT,
+    project TEXT,
+    duration_sec REAL,
+    minutes TEXT,
+    ingested_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS segments (
+    id INTEGER PRIMARY KEY,
+    meeting_id INTEGER NOT NULL REFERENCES meetings(id),
+    start REAL NOT NULL,
+    end REAL NOT NULL,
+    text TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS segments_meeting ON segments(meeting_id);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5(
+    text,
+    content='segments',
+    content_rowid='id',
+    tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS segments_ai AFTER INSERT ON segments BEGIN
+    INSERT INTO segments_fts(rowid, text) VALUES (new.id, new.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS segments_ad AFTER DELETE ON segments BEGIN
+    INSERT INTO segments_fts(segments_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+
+CREATE TABLE IF NOT EXISTS segment_bigrams (
+    bigram TEXT NOT NULL,
+    segment_id INTEGER NOT NULL,
+    meeting_id INTEGER NOT NULL,
+    PRIMARY KEY (bigram, segment_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS segment_bigrams_meeting ON segment_bigrams(meeting_id);
+"""
+
+# Trigram MATCH needs at least three characters per term.
+MIN_MATCH_CHARS = 3
+BIGRAM_CHARS = 2
+
+
+def bigrams(text: str) -> set:
+    # Lowercased like the trigram index; query terms never contain spaces.
+    text = text.lower()
+    return {
+        text[i:i + BIGRAM_CHARS]
+        for i in range(len(text) - 1)
+        if not any(ch.isspace() for ch in text[i:i + BIGRAM_CHARS])
+    }
+
+
+@dataclass
+class SearchHit:
+    meeting_id: int
+    title: Optional[str]
+    date: Optional[str]
+    output_dir: str
+    start: float
+    end: float
+    text: str
+
+
+class TranscriptArchive:
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Batch and server runs may add meetings from several threads or
+        # processes; WAL lets searches run while one of them writes.
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        try:
+            self.conn.executescript(SCHEMA)
+        except sqlite3.OperationalError as e:
+            self.conn.close()
+            raise RuntimeError(
+                f"SQLite {sqlite3.sqlite_version} lacks FTS5 trigram support (3.34+ required): {e}"
+            ) from e
+        self._backfill_bigrams()
+
+    def _backfill_bigrams(self):
+        # Archives created before the bigram table get it filled once.
+        missing = self.conn.execute(
+            "SELECT EXISTS(SELECT 1 FROM segments) AND NOT EXISTS(SELECT 1 FROM segment_bigrams)"
+        ).fetchone()[0]
+        if not missing:
+            return
+        with self.conn:
+            rows = self.conn.execute("SELECT id, meeting_id, text FROM segments").fetchall()
+            self._insert_bigrams(rows)
+        logger.info(f"Indexed two-character terms for {len(rows)} archived segments")
+
+    def _insert_bigrams(self, rows: Iterable):
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO segment_bigrams (bigram, segment_id, meeting_id) VALUES (?, ?, ?)",
+            (
+                (bigram, segment_id, meeting_id)
+                for segment_id, meeting_id, text in rows
+                for bigram in bigrams(text)
+            ),
+        )
+
+    def close(self):
+        self.conn.close()
+
+    def add_meeting(
+        self,
+        output_dir: Union[str, Path],
+        meeting_info: Dict,
+        segments: Iterable,
+        minutes: Optional[str] = None,
+        input_file: Optional[str] = None,
+    ) -> int:
+        # Re-adding the same output directory replaces the earlier entry.
+        output_dir = str(Path(output_dir).resolve())
+        rows = [(seg["start"], seg["end"], seg["text"]) for seg in segments]
+
+        with self.conn:
+            # Segments first, so the delete trigger keeps the index in sync.
+            self.conn.execute(
+                "DELETE FROM segment_bigrams WHERE meeting_id IN (SELECT id FROM meetings WHERE output_dir = ?)",
+                (output_dir,),
+            )
+            self.conn.execute(
+                "DELETE FROM segments WHERE meeting_id IN (SELECT id FROM meetings WHERE output_dir = ?)",
+                (output_dir,),
+            )
+            self.conn.execute("DELETE FROM meetings WHERE output_dir = ?", (output_dir,))
+            cursor = self.conn.execute(
+                "INSERT INTO meetings (output_dir, input_file, title, date, attendees, project,"
+                " duration_sec, minutes, ingested_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    output_dir,
+                    input_file,
+                    meeting_info.get("title"),
+                    meeting_info.get("date"),
+                    meeting_info.get("attendees"),
+                    meeting_info.get("project"),
+                    rows[-1][1] if rows else 0.0,
+                    minutes,
+                    time.time(),
+                ),
+            )
+            meeting_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT INTO segments (meeting_id, start, end, text) VALUES (?, ?, ?, ?)",
+                [(meeting_id, *row) for row in rows],
+            )
+            self._insert_bigrams(self.conn.execute(
+                "SELECT id, meeting_id, text FROM segments WHERE meeting_id = ?",
+                (meeting_id,),
+            ))
+
+        logger.info(f"Archived {len(rows)} segments from {output_dir} into {self.db_path}")
+        return meeting_id
+
+    def add_output_dir(self, output_dir: Union[str, Path]) -> int:
+        output_dir = Path(output_dir)
+        with open(output_dir / "transcript.json", 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        minutes_path = output_dir / "minutes.md"
+        minutes = minutes_path.read_text(encoding="utf-8") if minutes_path.exists() else None
+
+        return self.add_meeting(
+            output_dir,
+            data.get("meeting_info") or {},
+            data.get("segments", []),
+            minutes=minutes,
+        )
+
+    def search(self, query: str, limit: int = 20) -> List[SearchHit]:
+        query = query.strip()
+        if not query:
+            return []
+
+        select = (
+            "SELECT m.id, m.title, m.date, m.output_dir, s.start, s.end, s.text"
+            " FROM segments_fts f"
+            " JOIN segments s ON s.id = f.rowid"
+            " JOIN meetings m ON m.id = s.meeting_id"
+        )
+        terms = query.split()
+        long_terms = [term for term in terms if len(term) >= MIN_MATCH_CHARS]
+        two_char_terms = [term for term in terms if len(term) == BIGRAM_CHARS]
+        short_terms = [term for term in terms if len(term) < BIGRAM_CHARS]
+
+        where = []
+        params = []
+        if long_terms:
+            # Each term as a quoted string, so FTS5 syntax characters in
+            # the query are matched literally.
+            where.append("segments_fts MATCH ?")
+            params.append(" ".join('"' + term.replace('"', '""') + '"' for term in long_terms))
+        for term in two_char_terms:
+            where.append("s.id IN (SELECT segment_id FROM segment_bigrams WHERE bigram = ?)")
+            params.append(term.lower())
+        for term in short_terms:
+            # A single character matches too much to index; LIKE scans the
+            # index content instead.
+            where.append("f.text LIKE ? ESCAPE '\\'")
+            params.append("%" + self._escape_like(term) + "%")
+
+        order = "f.rank" if long_terms else "m.date, s.start"
+        rows = self.conn.execute(
+            select + f" WHERE {' AND '.join(where)} ORDER BY {order} LIMIT ?",
+            (*params, limit),
+        )
+        return [SearchHit(*row) for row in rows]
+
+    def stats(self) -> Dict:
+        meetings, = self.conn.execute("SELECT COUNT(*) FROM meetings").fetchone()
+        segments, = self.conn.execute("SELECT COUNT(*) FROM segments").fetchone()
+        return {"meetings": meetings, "segments": segments}
+
+    @staticmethod
+    def _escape_like(term: str) -> str:
+        return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -1,103 +1,234 @@
 import logging
-from pathlib import Path
-from typing import List, Dict, Optional
-import torch
-from faster_whisper import WhisperModel
+import time
+from itertools import islice
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple
 from .config import Config
+from .audio import AudioBuffer
+from .asr_backends import ASR_BACKENDS
+from .cache import FailedDecode, shift_results
+from .metrics import current_metrics
 
 logger = logging.getLogger(__name__)
 
+FALLBACK_TEMPERATURES = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+
+
+def decode_options(config: Config) -> Dict:
+    # Settings a job may change on a shared engine (the server's). They are
+    # passed with every call rather than read from the engine's own config.
+    return {
+        "initial_prompt": config.initial_prompt,
+        "word_timestamps": config.word_timestamps,
+    }
+
 
 class ASREngine:
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, backend=None):
         self.config = config
-        self.model = None
-        self._load_model()
+        self.backend = backend
+        if self.backend is None:
+            self._load_model()
 
     def _load_model(self):
-        logger.info(f"Loading Whisper model: {self.config.model_name}")
+        logger.info(f"Loading ASR model: {self.config.model_name} ({self.config.asr_backend})")
 
         try:
-            self.model = WhisperModel(
-                model_size_or_path=self.config.get_model_path(),
-                device=self.config.device,
-                compute_type=self.config.compute_type,
-            )
-            logger.info("Whisper model loaded successfully")
+            backend = ASR_BACKENDS[self.config.asr_backend]
+            self.backend = backend(self.config)
+            logger.info("ASR model loaded successfully")
         except Exception as e:
-            logger.error(f"Failed to load Whisper model: {e}")
+            logger.error(f"Failed to load ASR model: {e}")
             raise
 
     def transcribe_segment(
         self,
-        audio_path: Path,
+        audio: AudioBuffer,
         start_sec: float,
         end_sec: float,
         offset_sec: float = 0.0,
+        options: Optional[Dict] = None,
     ) -> List[Dict]:
         logger.debug(f"Transcribing segment [{start_sec:.2f}-{end_sec:.2f}]")
 
+        started = time.perf_counter()
         try:
-            segments, info = self.model.transcribe(
-                str(audio_path),
-                beam_size=5,
-                vad_filter=False,
-                language=self.config.language if self.config.language != "auto" else None,
-                condition_on_previous_text=False,
-                word_timestamps=True,
-                initial_prompt=self.config.initial_prompt,
-                clip_timestamps=[start_sec, end_sec],
-            )
-
-            results = []
-            for segment in segments:
-                results.append({
-                    "start": offset_sec + segment.start,
-                    "end": offset_sec + segment.end,
-                    "text": segment.text.strip(),
-                    "words": [
-                        {
-                            "start": offset_sec + word.start,
-                            "end": offset_sec + word.end,
-                            "word": word.word,
-                            "probability": word.probability,
-                        }
-                        for word in segment.words
-                    ] if hasattr(segment, "words") else [],
-                })
+            results, = self._decode([audio.to_float32(start_sec, end_sec)], batched=False, options=options)
+            results = shift_results(results, offset_sec)
 
             logger.debug(f"Segment transcribed: {len(results)} sub-segments")
             return results
 
         except Exception as e:
             logger.error(f"Failed to transcribe segment: {e}")
-            return []
+            return FailedDecode()
+
+        finally:
+            metrics = current_metrics()
+            if metrics is not None:
+                metrics.observe_segment(end_sec - start_sec, time.perf_counter() - started)
+
+    def transcribe_batch(
+        self,
+        audio: AudioBuffer,
+        segments: List[Dict],
+        options: Optional[Dict] = None,
+    ) -> List[List[Dict]]:
+        logger.debug(f"Transcribing batch of {len(segments)} segments")
+
+        clips = [audio.to_float32(seg["start"], seg["end"]) for seg in segments]
+        results = [FailedDecode() for _ in segments]
+
+        started = time.perf_counter()
+        try:
+            batch_results = self._decode(clips, batched=True, options=options)
+            results = [
+                shift_results(clip_results, seg["start"])
+                for seg, clip_results in zip(segments, batch_results)
+            ]
+
+        except Exception as e:
+            logger.error(f"Failed to transcribe batch: {e}")
+
+        metrics = current_metrics()
+        total_sec = sum(len(clip) for clip in clips) / audio.sample_rate
+        if metrics is not None and total_sec > 0:
+            # Segments share one decode; each is charged its share of the
+            # batch time by audio length.
+            elapsed = time.perf_counter() - started
+            for seg in segments:
+                duration = seg["end"] - seg["start"]
+                metrics.observe_segment(duration, elapsed * duration / total_sec)
+
+        return results
+
+    def _decode(self, clips: List, batched: bool, options: Optional[Dict] = None) -> List[List[Dict]]:
+        def run(clips, batched, **overrides):
+            kwargs = {**(options or {}), **overrides}
+            if batched:
+                return self.backend.transcribe_batch(clips, **kwargs)
+            return [self.backend.transcribe(samples, **kwargs) for samples in clips]
+
+        if not self.config.adaptive_decoding:
+            return run(clips, batched)
+
+        # Greedy first; only windows whose quality signals fail are decoded
+        # again with beam search, falling back through higher temperatures.
+        results = run(clips, batched, beam_size=1, temperature=0.0)
+        reasons = [self.fallback_reason(clip_results) for clip_results in results]
+        retry = [i for i, reason in enumerate(reasons) if reason]
+
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.increment("decode_windows", len(clips))
+            for reason in filter(None, reasons):
+                metrics.increment(f"decode_fallback_{reason}")
+
+        if retry:
+            # Retries are decoded one by one: faster-whisper's batched
+            # pipeline keeps only the first temperature, which would make
+            # the fallback a plain beam search at 0.
+            retried = run(
+                [clips[i] for i in retry],
+                False,
+                beam_size=self.config.beam_size,
+                temperature=FALLBACK_TEMPERATURES,
+                log_prob_threshold=self.config.fallback_min_logprob,
+                compression_ratio_threshold=self.config.fallback_max_compression,
+                no_speech_threshold=self.config.fallback_no_speech_prob,
+            )
+            for i, clip_results in zip(retry, retried):
+                results[i] = clip_results
+        return results
+
+    def fallback_reason(self, results: List[Dict]) -> Optional[str]:
+        for result in results:
+            compression_ratio = result.get("compression_ratio")
+            if compression_ratio is not None and compression_ratio > self.config.fallback_max_compression:
+                return "compression"
+
+            avg_logprob = result.get("avg_logprob")
+            if avg_logprob is not None and avg_logprob < self.config.fallback_min_logprob:
+                # As in Whisper, an unlikely decode of probable silence is
+                # taken as silence rather than retried.
+                if (result.get("no_speech_prob") or 0.0) > self.config.fallback_no_speech_prob:
+                    continue
+                return "logprob"
+        return None
+
+    def iter_transcribe(
+        self,
+        audio: AudioBuffer,
+        indexed_segments: Iterable[Tuple[int, Dict]],
+        options: Optional[Dict] = None,
+    ) -> Iterator[Tuple[int, List[Dict]]]:
+        if self.config.batch_size <= 1:
+            for idx, seg in indexed_segments:
+                yield idx, self.transcribe_segment(
+                    audio,
+                    seg["start"],
+                    seg["end"],
+                    offset_sec=seg["start"],
+                    options=options,
+                )
+            return
+
+        if isinstance(indexed_segments, list):
+            groups = [indexed_segments]
+        else:
+            # Streamed input: bucket within a bounded look-ahead window
+            # instead of waiting for VAD to finish the whole file.
+            iterator = iter(indexed_segments)
+            window = self.config.batch_size * 4
+            groups = iter(lambda: list(islice(iterator, window)), [])
+
+        for group in groups:
+            for batch in self._make_batches(group, self.config.batch_size):
+                batch_results = self.transcribe_batch(audio, [seg for _, seg in batch], options=options)
+                for (idx, _), results in zip(batch, batch_results):
+                    yield idx, results
+
+    @staticmethod
+    def _make_batches(
+        indexed_segments: List[Tuple[int, Dict]],
+        batch_size: int,
+    ) -> List[List[Tuple[int, Dict]]]:
+        # Length bucketing: neighbours in a batch have similar durations, so
+        # the decoder does not idle on short windows waiting for long ones.
+        by_length = sorted(
+            indexed_segments,
+            key=lambda item: item[1]["end"] - item[1]["start"],
+        )
+        return [
+            by_length[i:i + batch_size]
+            for i in range(0, len(by_length), batch_size)
+        ]
 
     def transcribe_all_segments(
         self,
-        audio_path: Path,
+        audio: AudioBuffer,
         segments: List[Dict],
         progress_callback: Optional[callable] = None,
     ) -> List[Dict]:
         logger.info(f"Starting transcription for {len(segments)} segments")
 
-        all_results = []
+        results_by_idx = {}
         total = len(segments)
 
-        for idx, seg in enumerate(segments):
-            if progress_callback:
-                progress_callback(idx, total, f"Transcribing segment {idx + 1}/{total}")
-
-            results = self.transcribe_segment(
-                audio_path,
-                seg["start"],
-                seg["end"],
-                offset_sec=seg["start"],
-            )
+        for done, (idx, results) in enumerate(
+            self.iter_transcribe(audio, list(enumerate(segments))), 1
+        ):
+            results_by_idx[idx] = results
 
-            all_results.extend(results)
+            if progress_callback:
+                progress_callback(done, total, f"Transcribed segment {idx + 1}/{total}")
 
             logger.info(f"Segment {idx + 1}/{total} completed")
 
+        all_results = [
+            result
+            for idx in sorted(results_by_idx)
+            for result in results_by_idx[idx]
+        ]
+
         logger.info(f"Transcription completed: {len(all_results)} total segments")
         return all_results
@@ -0,0 +1,200 @@
+import logging
+import time
+import zlib
+from bisect import bisect_right
+from typing import List, Dict, Optional, Sequence
+import numpy as np
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# An ASR backend turns float32 samples into segment dicts whose times are
+# relative to the start of the samples:
+#
+#   transcribe(samples) -> [{"start", "end", "text", "words": [...],
+#                            "avg_logprob", "compression_ratio", "no_speech_prob"}]
+#   transcribe_batch([samples, ...]) -> one such list per clip
+#
+# Keyword options override the configured decoding settings for one call;
+# they use faster-whisper's names (beam_size, temperature, log_prob_threshold,
+# ...) and backends ignore the ones they have no use for.
+#
+# ASREngine owns everything around that (scheduling, batching, offsets,
+# metrics), so it can be exercised without model weights.
+
+
+class FasterWhisperBackend:
+    def __init__(self, config: Config):
+        from faster_whisper import WhisperModel, BatchedInferencePipeline
+
+        self.config = config
+        self.model = WhisperModel(
+            model_size_or_path=config.get_model_path(),
+            device=config.device,
+            compute_type=config.compute_type,
+            cpu_threads=config.cpu_threads,
+        )
+        self.batched_model = None
+        if config.batch_size > 1:
+            self.batched_model = BatchedInferencePipeline(model=self.model)
+
+    @property
+    def language(self) -> Optional[str]:
+        return self.config.language if self.config.language != "auto" else None
+
+    def transcribe(self, samples: np.ndarray, **options) -> List[Dict]:
+        kwargs = dict(
+            beam_size=self.config.beam_size,
+            vad_filter=False,
+            language=self.language,
+            condition_on_previous_text=False,
+            word_timestamps=self.config.word_timestamps,
+            initial_prompt=self.config.initial_prompt,
+        )
+        kwargs.update(options)
+        segments, info = self.model.transcribe(samples, **kwargs)
+        return [self._segment_to_dict(segment, 0.0) for segment in segments]
+
+    def transcribe_batch(self, clips: Sequence[np.ndarray], **options) -> List[List[Dict]]:
+        # Pack the clips back to back and let the batched pipeline window
+        # them; outputs are mapped back through the packed offsets.
+        # clip_timestamps are sample offsets here (faster-whisper slices the
+        # audio with them), while the segments come back in seconds.
+        packed_starts = []
+        clip_timestamps = []
+        position = 0
+        for samples in clips:
+            packed_starts.append(position / self.config.sample_rate)
+            clip_timestamps.append({"start": position, "end": position + len(samples)})
+            position += len(samples)
+
+        kwargs = dict(
+            batch_size=self.config.batch_size,
+            beam_size=self.config.beam_size,
+            vad_filter=False,
+            clip_timestamps=clip_timestamps,
+            language=self.language,
+            word_timestamps=self.config.word_timestamps,
+            without_timestamps=False,
+            initial_prompt=self.config.initial_prompt,
+        )
+        kwargs.update(options)
+        batch_segments, info = self.batched_model.transcribe(np.concatenate(clips), **kwargs)
+
+        results = [[] for _ in clips]
+        for segment in batch_segments:
+            clip_idx = max(0, bisect_right(packed_starts, segment.start) - 1)
+            results[clip_idx].append(self._segment_to_dict(segment, -packed_starts[clip_idx]))
+        return results
+
+    @staticmethod
+    def _segment_to_dict(segment, offset_sec: float) -> Dict:
+        return {
+            "start": offset_sec + segment.start,
+            "end": offset_sec + segment.end,
+            "text": segment.text.strip(),
+            "avg_logprob": segment.avg_logprob,
+            "compression_ratio": segment.compression_ratio,
+            "no_speech_prob": segment.no_speech_prob,
+            "words": [
+                {
+                    "start": offset_sec + word.start,
+                    "end": offset_sec + word.end,
+                    "word": word.word,
+                    "probability": word.probability,
+                }
+                for word in segment.words
+            ] if getattr(segment, "words", None) else [],
+        }
+
+
+FAKE_VOCABULARY = (
+    "오늘", "EMR", "연동", "일정", "검토", "QC", "결과", "공유", "결정했습니다",
+    "확인", "해주세요", "리스크", "장비", "LIS", "다음", "주", "까지", "HbA1c",
+)
+
+
+class FakeASRBackend:
+    # Deterministic CPU stand-in: one sub-segment per segment_sec of audio,
+    # one word per word_sec, each word picked from the vocabulary by a CRC
+    # of its samples. The same samples give the same output in any process,
+    # alone or in a batch. Latency is simulated with sleep: a fixed cost per
+    # call (shared by a batch) plus a cost per second of audio. About
+    # hard_fraction of the clips, again chosen by CRC, come back with
+    # low-confidence scores. Without word timestamps the text is the same
+    # and the word list is left empty.
+    def __init__(
+        self,
+        config: Config,
+        call_latency_sec: float = 0.0,
+        latency_per_audio_sec: float = 0.0,
+        segment_sec: float = 5.0,
+        word_sec: float = 0.4,
+        vocabulary: Sequence[str] = FAKE_VOCABULARY,
+        probability: float = 0.9,
+        hard_fraction: float = 0.0,
+    ):
+        self.config = config
+        self.call_latency_sec = call_latency_sec
+        self.latency_per_audio_sec = latency_per_audio_sec
+        self.segment_sec = segment_sec
+        self.word_sec = word_sec
+        self.vocabulary = tuple(vocabulary)
+        self.probability = probability
+        self.hard_fraction = hard_fraction
+        self.calls = 0
+        self.last_options = {}
+
+    def transcribe(self, samples: np.ndarray, **options) -> List[Dict]:
+        return self.transcribe_batch([samples], **options)[0]
+
+    def transcribe_batch(self, clips: Sequence[np.ndarray], **options) -> List[List[Dict]]:
+        self.calls += 1
+        self.last_options = options
+        audio_sec = sum(len(samples) for samples in clips) / self.config.sample_rate
+        delay = self.call_latency_sec + audio_sec * self.latency_per_audio_sec
+        if delay > 0:
+            time.sleep(delay)
+        word_timestamps = options.get("word_timestamps", self.config.word_timestamps)
+        return [self._transcribe(samples, word_timestamps) for samples in clips]
+
+    def _transcribe(self, samples: np.ndarray, word_timestamps: bool = True) -> List[Dict]:
+        sample_rate = self.config.sample_rate
+        duration = len(samples) / sample_rate
+        hard = zlib.crc32(samples.tobytes()) % 1000 < self.hard_fraction * 1000
+        probability = 0.35 if hard else self.probability
+
+        results = []
+        sub_start = 0.0
+        while sub_start < duration:
+            sub_end = min(duration, sub_start + self.segment_sec)
+            words = []
+            word_start = sub_start
+            while word_start < sub_end:
+                word_end = min(sub_end, word_start + self.word_sec)
+                span = samples[int(word_start * sample_rate):int(word_end * sample_rate)]
+                text = self.vocabulary[zlib.crc32(span.tobytes()) % len(self.vocabulary)]
+                words.append({
+                    "start": word_start,
+                    "end": word_end,
+                    "word": " " + text,
+                    "probability": probability,
+                })
+                word_start = word_end
+            results.append({
+                "start": sub_start,
+                "end": sub_end,
+                "text": "".join(word["word"] for word in words).strip(),
+                "avg_logprob": -1.2 if hard else -0.2,
+                "compression_ratio": 1.5,
+                "no_speech_prob": 0.01,
+                "words": words if word_timestamps else [],
+            })
+            sub_start = sub_end
+        return results
+
+
+ASR_BACKENDS = {
+    "faster-whisper": FasterWhisperBackend,
+    "fake": FakeASRBackend,
+}
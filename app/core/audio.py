@@ -1,7 +1,8 @@
 import subprocess
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Iterator
+import numpy as np
 from .config import Config
 
 logger = logging.getLogger(__name__)
@@ -50,26 +51,163 @@ class AudioConverter:
                 "FFmpeg not found. Please install FFmpeg and ensure it's in PATH."
             )
 
-    def get_audio_duration(self, wav_path: Optional[Path] = None) -> float:
-        if wav_path is None:
-            wav_path = self.config.temp_dir / "audio.wav"
+    def stream_pcm(
+        self,
+        mp3_path: Optional[Path] = None,
+        chunk_samples: Optional[int] = None,
+    ) -> Iterator[np.ndarray]:
+        if mp3_path is None:
+            mp3_path = self.config.input_file
+        if chunk_samples is None:
+            chunk_samples = self.config.sample_rate
+
+        logger.info(f"Streaming PCM from {mp3_path}")
 
         cmd = [
-            "ffprobe",
+            "ffmpeg",
             "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            str(wav_path),
+            "-i", str(mp3_path),
+            "-ar", str(self.config.sample_rate),
+            "-ac", "1",
+            "-f", "s16le",
+            "-acodec", "pcm_s16le",
+            "pipe:1",
         ]
 
         try:
-            result = subprocess.run(
+            process = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                check=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            raise RuntimeError(
+                "FFmpeg not found. Please install FFmpeg and ensure it's in PATH."
             )
-            return float(result.stdout.strip())
-        except (subprocess.CalledProcessError, ValueError) as e:
-            logger.error(f"Failed to get audio duration: {e}")
-            return 0.0
+
+        chunk_bytes = chunk_samples * 2
+        try:
+            while True:
+                data = process.stdout.read(chunk_bytes)
+                if not data:
+                    break
+                # A short read at EOF may split a sample; drop the odd byte.
+                yield np.frombuffer(data[:len(data) - len(data) % 2], dtype=np.int16)
+        finally:
+            process.stdout.close()
+            stderr = process.stderr.read().decode(errors="replace")
+            process.stderr.close()
+            returncode = process.wait()
+
+        if returncode != 0:
+            logger.error(f"FFmpeg error: {stderr}")
+            raise RuntimeError(f"Audio decoding failed with exit code {returncode}")
+
+        logger.info("Audio streaming completed")
+
+    def decode_pcm(self, mp3_path: Optional[Path] = None) -> "AudioBuffer":
+        if mp3_path is None:
+            mp3_path = self.config.input_file
+
+        # Size the buffer from the compressed file assuming a 64 kbps stream;
+        # untouched capacity is never paged in, an underestimate just grows.
+        estimated_sec = Path(mp3_path).stat().st_size * 8 / 64000
+        audio = GrowingAudioBuffer(
+            self.config.sample_rate,
+            capacity=int(estimated_sec * self.config.sample_rate) + self.config.sample_rate,
+        )
+
+        for chunk in self.stream_pcm(mp3_path, chunk_samples=self.config.sample_rate * 10):
+            audio.append(chunk)
+
+        return audio
+
+
+class AudioBuffer:
+    def __init__(
+        self,
+        samples: np.ndarray,
+        sample_rate: int,
+        path: Optional[Path] = None,
+    ):
+        self.samples = samples
+        self.sample_rate = sample_rate
+        self.path = path
+
+    @classmethod
+    def from_wav(cls, wav_path: Path) -> "AudioBuffer":
+        from scipy.io import wavfile
+
+        # Memory-mapped: segments are sliced out of the page cache, the file
+        # is never decoded into RAM as a whole.
+        sample_rate, samples = wavfile.read(str(wav_path), mmap=True)
+
+        # Handle stereo by taking first channel
+        if samples.ndim > 1:
+            samples = samples[:, 0]
+
+        return cls(samples, sample_rate, path=Path(wav_path))
+
+    @classmethod
+    def from_npy(cls, npy_path: Path, sample_rate: int) -> "AudioBuffer":
+        samples = np.load(str(npy_path), mmap_mode="r")
+        return cls(samples, sample_rate, path=Path(npy_path))
+
+    @classmethod
+    def load(cls, path: Path, sample_rate: int = 16000) -> "AudioBuffer":
+        # .npy artifacts carry no header rate; workspaces only store PCM at
+        # the configured rate, which the caller passes in.
+        if Path(path).suffix == ".npy":
+            return cls.from_npy(path, sample_rate)
+        return cls.from_wav(path)
+
+    @property
+    def duration(self) -> float:
+        return len(self.samples) / self.sample_rate
+
+    def slice(self, start_sec: float, end_sec: float) -> np.ndarray:
+        start = max(0, int(round(start_sec * self.sample_rate)))
+        end = min(len(self.samples), int(round(end_sec * self.sample_rate)))
+        return self.samples[start:max(start, end)]
+
+    def to_float32(self, start_sec: float, end_sec: float) -> np.ndarray:
+        return pcm_to_float32(self.slice(start_sec, end_sec))
+
+    def iter_chunks(self, chunk_samples: int) -> Iterator[np.ndarray]:
+        samples = self.samples
+        for start in range(0, len(samples), chunk_samples):
+            yield samples[start:start + chunk_samples]
+
+
+class GrowingAudioBuffer(AudioBuffer):
+    # Filled by a decoder thread while readers slice already-written ranges.
+    # Growth swaps in a larger array; views handed out earlier keep the old
+    # one alive and stay valid because written samples are never modified.
+    def __init__(self, sample_rate: int, capacity: Optional[int] = None):
+        self.sample_rate = sample_rate
+        self.path = None
+        self._data = np.empty(capacity or sample_rate * 60, dtype=np.int16)
+        self._length = 0
+
+    @property
+    def samples(self) -> np.ndarray:
+        return self._data[:self._length]
+
+    def append(self, chunk: np.ndarray):
+        needed = self._length + len(chunk)
+        if needed > len(self._data):
+            data = np.empty(max(needed, len(self._data) * 2), dtype=np.int16)
+            data[:self._length] = self._data[:self._length]
+            self._data = data
+
+        self._data[self._length:needed] = chunk
+        self._length = needed
+
+
+def pcm_to_float32(samples: np.ndarray) -> np.ndarray:
+    # Convert to float32 normalized to [-1, 1]
+    if samples.dtype == np.int16:
+        return samples.astype(np.float32) / 32768.0
+    if samples.dtype == np.int32:
+        return samples.astype(np.float32) / 2147483648.0
+    return samples.astype(np.float32)
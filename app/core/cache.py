@@ -0,0 +1,208 @@
+import hashlib
+import json
+import logging
+import os
+from collections import deque
+from pathlib import Path
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple
+import numpy as np
+from .config import Config
+from .audio import AudioBuffer
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+
+def decode_params(config: Config) -> Dict:
+    # Everything that can change what the decoder returns for the same PCM.
+    params = {
+        "version": CACHE_VERSION,
+        "backend": config.asr_backend,
+        "model": config.get_model_path(),
+        "compute_type": config.compute_type,
+        "language": config.language,
+        "initial_prompt": config.initial_prompt,
+        "beam_size": config.beam_size,
+        "batched": config.batch_size > 1,
+        "sample_rate": config.sample_rate,
+    }
+    if not config.word_timestamps:
+        params["word_timestamps"] = False
+    if config.adaptive_decoding:
+        params["adaptive"] = {
+            "min_logprob": config.fallback_min_logprob,
+            "max_compression": config.fallback_max_compression,
+            "no_speech_prob": config.fallback_no_speech_prob,
+        }
+    if config.draft_model:
+        params["cascade"] = {
+            "draft_model": config.draft_model,
+            "min_word_prob": config.cascade_min_word_prob,
+            "min_logprob": config.cascade_min_logprob,
+            "max_compression": config.cascade_max_compression,
+        }
+    return params
+
+
+class ASRCache:
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.size_bytes = sum(entry.stat().st_size for entry in self._entries())
+
+    def make_key(self, samples: np.ndarray, params: Dict) -> str:
+        digest = hashlib.sha256()
+        digest.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+        digest.update(np.ascontiguousarray(samples).data)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                results = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+
+        # mtime doubles as the LRU clock
+        os.utime(path)
+        self.hits += 1
+        return results
+
+    def put(self, key: str, results: List[Dict]):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+
+        data = json.dumps(results, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        self.size_bytes += len(data)
+        self.stores += 1
+
+        if self.size_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        # Trim to 90% so eviction does not run on every store once full.
+        target = self.max_bytes * 0.9
+        entries = sorted(self._entries(), key=lambda entry: entry.stat().st_mtime)
+
+        size = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if size <= target:
+                break
+            entry_size = entry.stat().st_size
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                continue
+            size -= entry_size
+            self.evictions += 1
+
+        self.size_bytes = size
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "size_bytes": self.size_bytes,
+        }
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _entries(self) -> Iterator[os.DirEntry]:
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".json"):
+                    yield entry
+
+
+class CachedASREngine:
+    # Wraps any engine exposing iter_transcribe. Cached results are stored
+    # relative to the segment start, so the same audio hits at any offset.
+    def __init__(self, engine, cache: ASRCache, config: Config):
+        self.engine = engine
+        self.cache = cache
+        self.params = decode_params(config)
+
+    def iter_transcribe(
+        self,
+        audio: AudioBuffer,
+        indexed_segments: Iterable[Tuple[int, Dict]],
+        options: Optional[Dict] = None,
+    ) -> Iterator[Tuple[int, List[Dict]]]:
+        hits = deque()
+        keys = {}
+
+        def misses():
+            for idx, seg in indexed_segments:
+                key = self.cache.make_key(audio.slice(seg["start"], seg["end"]), self.params)
+                cached = self.cache.get(key)
+                if cached is None:
+                    keys[idx] = (key, seg["start"])
+                    yield idx, seg
+                else:
+                    hits.append((idx, shift_results(cached, seg["start"])))
+
+        if isinstance(indexed_segments, list):
+            pending = list(misses())
+        else:
+            pending = misses()
+
+        while hits:
+            yield hits.popleft()
+
+        for idx, results in self.engine.iter_transcribe(audio, pending, options=options):
+            while hits:
+                yield hits.popleft()
+
+            key, start = keys.pop(idx)
+            # Silence and music decode to nothing; caching [] keeps them from
+            # being decoded again (a miss is None, never an empty list). A
+            # decode that failed is retried on the next run instead.
+            if not isinstance(results, FailedDecode):
+                self.cache.put(key, shift_results(results, -start))
+            yield idx, results
+
+        while hits:
+            yield hits.popleft()
+
+
+class FailedDecode(list):
+    # The empty results of a window whose decode raised. It reads as [] to
+    # exports; the cache and the checkpoint journal leave it out so the
+    # window is decoded again next time.
+    pass
+
+
+def shift_results(results: List[Dict], offset: float) -> List[Dict]:
+    return [
+        {
+            **result,
+            "start": result["start"] + offset,
+            "end": result["end"] + offset,
+            "words": [
+                {**word, "start": word["start"] + offset, "end": word["end"] + offset}
+                for word in result.get("words", [])
+            ],
+        }
+        for result in results
+    ]
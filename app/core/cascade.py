@@ -0,0 +1,162 @@
+import logging
+import time
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+from .config import Config
+from .audio import AudioBuffer
+from .asr import ASREngine
+from .metrics import current_metrics
+
+logger = logging.getLogger(__name__)
+
+
+def create_asr_engine(config: Config):
+    if not config.draft_model:
+        return ASREngine(config)
+    return CascadeASREngine(ASREngine(config.derive(model_name=config.draft_model)), config)
+
+
+def segment_confidence(results: List[Dict]) -> Dict[str, Optional[float]]:
+    words = [word for result in results for word in result.get("words") or []]
+    scored = [result for result in results if result.get("avg_logprob") is not None]
+    duration = sum(result["end"] - result["start"] for result in scored)
+
+    return {
+        "word_probability": sum(word["probability"] for word in words) / len(words) if words else None,
+        # Weighted by duration, so a short garbled tail counts for little.
+        "avg_logprob": (
+            sum(result["avg_logprob"] * (result["end"] - result["start"]) for result in scored) / duration
+            if duration > 0 else None
+        ),
+        "compression_ratio": max(
+            (result["compression_ratio"] for result in results if result.get("compression_ratio") is not None),
+            default=None,
+        ),
+    }
+
+
+def cascade_summary(counters: Dict[str, float]) -> Optional[Dict[str, float]]:
+    windows = counters.get("cascade_windows", 0)
+    if not windows:
+        return None
+
+    draft_sec = counters.get("cascade_draft_seconds", 0.0)
+    final_sec = counters.get("cascade_final_seconds", 0.0)
+    escalated_audio = counters.get("cascade_escalated_audio_seconds", 0.0)
+    summary = {
+        "escalated_fraction": counters.get("cascade_escalated", 0) / windows,
+        "draft_sec": draft_sec,
+        "final_sec": final_sec,
+    }
+    # The accurate model's speed on the escalated windows stands in for what
+    # running it on everything would have cost.
+    if escalated_audio > 0:
+        full_sec = final_sec / escalated_audio * counters.get("cascade_audio_seconds", 0.0)
+        summary["saved_sec"] = full_sec - draft_sec - final_sec
+    return summary
+
+
+class CascadeASREngine:
+    # Two-pass decoding: every window goes through the fast draft model and
+    # only windows whose draft scores below the confidence thresholds are
+    # decoded again by the accurate model (config.model_name). The accurate
+    # model loads on the first escalation. Escalations are decoded in groups
+    # of batch_size, so a batched engine still gets full batches.
+    def __init__(self, draft, config: Config, final=None):
+        self.draft = draft
+        self.config = config
+        self._final = final
+
+    @property
+    def final(self):
+        if self._final is None:
+            self._final = ASREngine(self.config)
+        return self._final
+
+    def accepts(self, results: List[Dict]) -> bool:
+        if not results:
+            # VAD heard speech; an empty draft is a miss or a failed decode.
+            return False
+
+        # Signals a backend does not report are not held against it.
+        score = segment_confidence(results)
+        if score["word_probability"] is not None and score["word_probability"] < self.config.cascade_min_word_prob:
+            return False
+        if score["avg_logprob"] is not None and score["avg_logprob"] < self.config.cascade_min_logprob:
+            return False
+        if score["compression_ratio"] is not None and score["compression_ratio"] > self.config.cascade_max_compression:
+            return False
+        return True
+
+    def iter_transcribe(
+        self,
+        audio: AudioBuffer,
+        indexed_segments: Iterable[Tuple[int, Dict]],
+        options: Optional[Dict] = None,
+    ) -> Iterator[Tuple[int, List[Dict]]]:
+        segments = {}
+        upstream_sec = 0.0
+
+        def source():
+            # Time spent waiting on a live VAD stream is not draft time.
+            nonlocal upstream_sec
+            iterator = iter(indexed_segments)
+            while True:
+                start = time.perf_counter()
+                item = next(iterator, None)
+                upstream_sec += time.perf_counter() - start
+                if item is None:
+                    return
+                segments[item[0]] = item[1]
+                yield item
+
+        if isinstance(indexed_segments, list):
+            segments.update(indexed_segments)
+            drafts = self.draft.iter_transcribe(audio, indexed_segments, options=options)
+        else:
+            drafts = self.draft.iter_transcribe(audio, source(), options=options)
+
+        group_size = max(1, self.config.batch_size)
+        escalated = []
+        while True:
+            start = time.perf_counter()
+            waited = upstream_sec
+            item = next(drafts, None)
+            self._count("cascade_draft_seconds", time.perf_counter() - start - (upstream_sec - waited))
+            if item is None:
+                break
+
+            idx, results = item
+            segment = segments.pop(idx)
+            duration = segment["end"] - segment["start"]
+            self._count("cascade_windows", 1)
+            self._count("cascade_audio_seconds", duration)
+
+            if self.accepts(results):
+                yield idx, results
+                continue
+
+            self._count("cascade_escalated", 1)
+            self._count("cascade_escalated_audio_seconds", duration)
+            escalated.append((idx, segment))
+            if len(escalated) >= group_size:
+                yield from self._decode_final(audio, escalated, options)
+                escalated = []
+
+        if escalated:
+            yield from self._decode_final(audio, escalated, options)
+
+    def _decode_final(
+        self,
+        audio: AudioBuffer,
+        indexed_segments: List[Tuple[int, Dict]],
+        options: Optional[Dict] = None,
+    ):
+        start = time.perf_counter()
+        completed = list(self.final.iter_transcribe(audio, indexed_segments, options=options))
+        self._count("cascade_final_seconds", time.perf_counter() - start)
+        return completed
+
+    def _count(self, name: str, value: float):
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.increment(name, value)
@@ -1,45 +1,112 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Optional, List, Union
 from pathlib import Path
 
+OUTPUT_FORMATS = ("json", "jsonl", "md", "srt", "minutes")
+DEFAULT_FORMATS = ("json", "md", "srt", "minutes")
+# Outputs that carry word timestamps; the others only need segment text.
+WORD_FORMATS = ("json", "jsonl")
+
 
 @dataclass
 class Config:
     input_file: Union[str, Path]
     output_dir: Union[str, Path] = "output"
     model_name: str = "large-v3"
+    asr_backend: str = "faster-whisper"
     compute_type: str = "int8_float16"
     language: str = "ko"
     device: str = "cuda"
     num_workers: int = 1
+    cpu_threads: int = 0
+    batch_size: int = 1
 
     initial_prompt: Optional[str] = None
+    beam_size: int = 5
+    draft_model: Optional[str] = None
+    cascade_min_word_prob: float = 0.5
+    cascade_min_logprob: float = -1.0
+    cascade_max_compression: float = 2.4
+    adaptive_decoding: bool = False
+    fallback_min_logprob: float = -1.0
+    fallback_max_compression: float = 2.4
+    fallback_no_speech_prob: float = 0.6
+    terms_file: Optional[Union[str, Path]] = None
 
     meeting_title: Optional[str] = None
     meeting_date: Optional[str] = None
     attendees: Optional[str] = None
     project_name: Optional[str] = None
+    minutes_rules_file: Optional[Union[str, Path]] = None
 
+    vad_backend: str = "torch"
+    vad_model_path: Optional[Union[str, Path]] = None
+    vad_threads: int = 1
     vad_threshold: float = 0.5
     min_speech_duration_ms: int = 250
     min_silence_duration_ms: int = 2000
     max_segment_duration_ms: int = 30000
+    max_merge_gap_ms: int = 3000
     speech_pad_ms: int = 30
+    vad_chunk_ms: int = 10000
 
     sample_rate: int = 16000
+    decode_mode: str = "memory"
+    streaming: bool = False
+    stream_queue_size: int = 64
     temp_dir: Union[str, Path] = "temp"
 
-    checkpoint_file: Union[str, Path] = "checkpoint.json"
+    checkpoint_file: Union[str, Path] = "checkpoint.jsonl"
+
+    formats: List[str] = field(default_factory=lambda: list(DEFAULT_FORMATS))
+    compact_json: bool = False
+    export_jsonl: bool = False
+    defer_word_alignment: bool = False
+    archive_db: Optional[Union[str, Path]] = None
+    metrics_textfile: Optional[Union[str, Path]] = None
+
+    use_cache: bool = True
+    cache_dir: Union[str, Path] = "cache/asr"
+    cache_max_mb: int = 1024
+
+    use_workspace: bool = True
+    workspace_dir: Union[str, Path] = "temp/workspace"
+    workspace_keep: int = 5
 
     def __post_init__(self):
         self.output_dir = Path(self.output_dir)
         self.input_file = Path(self.input_file)
         self.temp_dir = Path(self.temp_dir)
+        self.cache_dir = Path(self.cache_dir)
+        self.workspace_dir = Path(self.workspace_dir)
         self.checkpoint_file = self.output_dir / self.checkpoint_file
 
+        self.formats = list(self.formats)
+        unknown = set(self.formats) - set(OUTPUT_FORMATS)
+        if unknown:
+            raise ValueError(f"Unknown output formats: {', '.join(sorted(unknown))}")
+        if self.export_jsonl and "jsonl" not in self.formats:
+            self.formats.append("jsonl")
+        # Deferred words are aligned against transcript.json later.
+        if self.defer_word_alignment and "json" not in self.formats:
+            raise ValueError("defer_word_alignment needs the json output format")
+
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.temp_dir.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def word_timestamps(self) -> bool:
+        # Word alignment is an extra decoder pass; skip it unless a
+        # requested output carries words and alignment is not deferred.
+        return not self.defer_word_alignment and any(fmt in WORD_FORMATS for fmt in self.formats)
+
+    def derive(self, **overrides) -> "Config":
+        values = {f.name: getattr(self, f.name) for f in fields(self)}
+        # __post_init__ joins checkpoint_file onto output_dir again
+        values["checkpoint_file"] = Path(self.checkpoint_file).name
+        values.update(overrides)
+        return Config(**values)
+
     def get_model_path(self) -> Optional[str]:
         model_map = {
             "large-v3": "Systran/faster-whisper-large-v3",
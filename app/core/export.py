@@ -0,0 +1,192 @@
+import json
+import logging
+from pathlib import Path
+from typing import List, Dict, Optional, Union
+
+from .transcript import SegmentView, Transcript, TranscriptBuilder
+
+logger = logging.getLogger(__name__)
+
+
+def format_timestamp(seconds: float) -> str:
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    secs = int(seconds % 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+def format_srt_timestamp(seconds: float) -> str:
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    secs = int(seconds % 60)
+    millis = int((seconds % 1) * 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
+
+def meeting_info(config) -> Dict:
+    return {
+        "title": config.meeting_title,
+        "date": config.meeting_date,
+        "attendees": config.attendees,
+        "project": config.project_name,
+    }
+
+
+class TranscriptWriter:
+    # Appends one segment at a time. After every flush() the file on disk is
+    # a complete, valid document, so outputs can be opened or tailed while
+    # ASR is still running.
+    def __init__(self, path: Path, config):
+        self.path = Path(path)
+        self.config = config
+        self.count = 0
+        self.file = open(self.path, 'wb')
+        self.write_header()
+
+    def write_header(self):
+        pass
+
+    def write(self, segment: Union[Dict, SegmentView]):
+        if isinstance(segment, SegmentView):
+            segment = segment.to_dict()
+        self.count += 1
+        self._append(segment)
+
+    def _append(self, segment: Dict):
+        raise NotImplementedError
+
+    def _emit(self, text: str):
+        self.file.write(text.encode("utf-8"))
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class JsonWriter(TranscriptWriter):
+    # The closing brackets are written after every segment and overwritten
+    # by the next one, so the file always parses.
+    def write_header(self):
+        info = meeting_info(self.config)
+        if self.config.compact_json:
+            self._emit('{"meeting_info":' + self._dumps(info) + ',"segments":[')
+        else:
+            info_text = json.dumps(info, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+            self._emit('{\n  "meeting_info": ' + info_text + ',\n  "segments": [')
+        self.tail = self.file.tell()
+        self._close_document()
+
+    def _append(self, segment: Dict):
+        self.file.seek(self.tail)
+        if self.config.compact_json:
+            self._emit(("," if self.count > 1 else "") + self._dumps(segment))
+        else:
+            text = json.dumps(segment, ensure_ascii=False, indent=2).replace("\n", "\n    ")
+            self._emit(("," if self.count > 1 else "") + "\n    " + text)
+        self.tail = self.file.tell()
+        self._close_document()
+
+    def _close_document(self):
+        if self.config.compact_json:
+            self._emit("]}\n")
+        else:
+            self._emit("\n  ]\n}\n" if self.count else "]\n}\n")
+        self.file.truncate()
+
+    def _dumps(self, value) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class JsonlWriter(TranscriptWriter):
+    def _append(self, segment: Dict):
+        self._emit(json.dumps(segment, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+class MarkdownWriter(TranscriptWriter):
+    def write_header(self):
+        self._emit("# 회의 녹음 전문 (Transcript)\n\n")
+        if self.config.meeting_title:
+            self._emit(f"**회의명**: {self.config.meeting_title}\n")
+        if self.config.meeting_date:
+            self._emit(f"**일시**: {self.config.meeting_date}\n")
+        if self.config.attendees:
+            self._emit(f"**참석자**: {self.config.attendees}\n")
+        self._emit("\n---\n\n")
+
+    def _append(self, segment: Dict):
+        start_time = format_timestamp(segment["start"])
+        end_time = format_timestamp(segment["end"])
+        self._emit(f"## [{self.count}] {start_time} - {end_time}\n\n")
+        self._emit(f"{segment['text']}\n\n")
+
+
+class SrtWriter(TranscriptWriter):
+    def _append(self, segment: Dict):
+        start_time = format_srt_timestamp(segment["start"])
+        end_time = format_srt_timestamp(segment["end"])
+        self._emit(f"{self.count}\n")
+        self._emit(f"{start_time} --> {end_time}\n")
+        self._emit(f"{segment['text']}\n\n")
+
+
+FORMAT_WRITERS = {
+    "json": JsonWriter,
+    "jsonl": JsonlWriter,
+    "md": MarkdownWriter,
+    "srt": SrtWriter,
+}
+
+
+class ExportSink:
+    # Receives ASR results per VAD window as they complete, in any order,
+    # and releases them to every writer in window order. Windows are in
+    # timeline order, so segments reach the writers sorted by start time.
+    def __init__(self, config, post_processor, formats: Optional[List[str]] = None):
+        self.config = config
+        self.post_processor = post_processor
+        if formats is None:
+            formats = [fmt for fmt in config.formats if fmt in FORMAT_WRITERS]
+
+        self.writers = [
+            FORMAT_WRITERS[fmt](Path(config.output_dir) / f"transcript.{fmt}", config)
+            for fmt in formats
+        ]
+        self.transcript = TranscriptBuilder()
+        self.pending: Dict[int, List[Dict]] = {}
+        self.next_idx = 0
+
+    def add(self, idx: int, results: List[Dict]):
+        self.pending[idx] = sorted(results, key=lambda seg: seg["start"])
+        released = False
+        while self.next_idx in self.pending:
+            for segment in self.pending.pop(self.next_idx):
+                self._write(segment)
+            self.next_idx += 1
+            released = True
+
+        if released:
+            for writer in self.writers:
+                writer.flush()
+
+    def _write(self, segment: Dict):
+        # Decoder scores (avg_logprob, ...) stay in the checkpoint and cache;
+        # exports keep the plain segment shape.
+        segment = {
+            "start": segment["start"],
+            "end": segment["end"],
+            "text": self.post_processor.normalize_text(segment["text"]),
+            "words": segment.get("words") or [],
+        }
+        self.transcript.append(segment)
+        for writer in self.writers:
+            writer.write(segment)
+
+    def close(self) -> Transcript:
+        if self.pending:
+            logger.warning(f"{len(self.pending)} transcribed windows were not exported (earlier windows missing)")
+        for writer in self.writers:
+            writer.close()
+            logger.info(f"Exported transcript: {writer.path} ({writer.count} segments)")
+        return self.transcript.build()
@@ -1,5 +1,6 @@
 import logging
 import json
+import os
 from pathlib import Path
 from typing import List, Dict, Optional
 
@@ -7,42 +8,125 @@ logger = logging.getLogger(__name__)
 
 
 class CheckpointManager:
+    # The checkpoint is a JSON Lines journal: one record per finished ASR
+    # segment, appended and fsynced, so a write costs O(1) regardless of how
+    # much has been transcribed. Rewrites only happen through compact(),
+    # which swaps in a temp file atomically.
     def __init__(self, checkpoint_path: Path):
-        self.checkpoint_path = checkpoint_path
+        self.checkpoint_path = Path(checkpoint_path)
+        self._journal = None
 
     def save(self, data: dict):
-        with open(self.checkpoint_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        self._close()
+        self._atomic_write([data])
         logger.info(f"Checkpoint saved: {self.checkpoint_path}")
 
     def load(self) -> Optional[dict]:
-        if not self.checkpoint_path.exists():
-            return None
+        records = self._read_records()
+        return records[0] if records else None
 
-        try:
-            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            logger.info(f"Checkpoint loaded: {self.checkpoint_path}")
-            return data
-        except Exception as e:
-            logger.warning(f"Failed to load checkpoint: {e}")
+    def append_segment(self, idx: int, results: List[Dict]):
+        if self._journal is None:
+            self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            self._journal = open(self.checkpoint_path, 'a', encoding='utf-8')
+
+        record = json.dumps({"idx": idx, "results": results}, ensure_ascii=False)
+        self._journal.write(record + "\n")
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+    def replay(self, records: Optional[List[dict]] = None) -> Dict[int, List[Dict]]:
+        if records is None:
+            records = self._read_records()
+
+        # Later records win, so a re-run segment replaces its earlier result.
+        segments = {}
+        for record in records:
+            if "idx" in record:
+                segments[record["idx"]] = record.get("results", [])
+        return segments
+
+    def load_segments(self) -> Optional[dict]:
+        records = self._read_records()
+        if not records:
             return None
 
-    def save_segments(
-        self,
-        done_segments: List[int],
-        transcribed: List[Dict],
-    ):
-        data = {
-            "done_segments": done_segments,
-            "transcribed": transcribed,
+        segments = self.replay(records)
+
+        # Drop duplicates and a torn tail before new records are appended.
+        if len(segments) != len(records) or self._has_torn_tail():
+            self.compact(segments)
+
+        logger.info(f"Checkpoint loaded: {self.checkpoint_path} ({len(segments)} segments)")
+        return {
+            "done_segments": set(segments),
+            "segments": segments,
+            "transcribed": [
+                result
+                for idx in sorted(segments)
+                for result in segments[idx]
+            ],
         }
-        self.save(data)
 
-    def load_segments(self) -> Optional[dict]:
-        return self.load()
+    def compact(self, segments: Optional[Dict[int, List[Dict]]] = None):
+        if segments is None:
+            segments = self.replay()
+
+        self._close()
+        self._atomic_write([
+            {"idx": idx, "results": segments[idx]}
+            for idx in sorted(segments)
+        ])
+        logger.info(f"Checkpoint compacted: {self.checkpoint_path} ({len(segments)} segments)")
 
     def delete(self):
+        self._close()
         if self.checkpoint_path.exists():
             self.checkpoint_path.unlink()
             logger.info(f"Checkpoint deleted: {self.checkpoint_path}")
+
+    def _read_records(self) -> List[dict]:
+        if not self.checkpoint_path.exists():
+            return []
+
+        records = []
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # A crash mid-append leaves at most one partial line.
+                        logger.warning(f"Skipping corrupt checkpoint record in {self.checkpoint_path}")
+        except OSError as e:
+            logger.warning(f"Failed to load checkpoint: {e}")
+            return []
+
+        return records
+
+    def _has_torn_tail(self) -> bool:
+        with open(self.checkpoint_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+
+    def _atomic_write(self, records: List[dict]):
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _close(self):
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
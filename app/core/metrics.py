@@ -0,0 +1,215 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "dictation"
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+RTF_BUCKETS = (0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0)
+
+_current = threading.local()
+
+
+def current_metrics() -> Optional["RunMetrics"]:
+    # Set by the pipeline for the duration of a run on its thread, so a
+    # shared engine records into the metrics of the job that called it.
+    return getattr(_current, "metrics", None)
+
+
+def peak_rss_mb() -> float:
+    if sys.platform == "win32":
+        return _peak_working_set_mb()
+
+    import resource
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, KiB elsewhere
+    return rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024
+
+
+def _peak_working_set_mb() -> float:
+    # resource is Unix-only; the Windows build asks psapi for the peak
+    # working set instead, and reports 0 if that fails.
+    import ctypes
+    from ctypes import wintypes
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    try:
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return 0.0
+        return counters.PeakWorkingSetSize / 1024 / 1024
+    except (AttributeError, OSError):
+        return 0.0
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def merge(self, other: "Histogram"):
+        self.sum += other.sum
+        self.count += other.count
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield bound, total
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "buckets": {str(bound): total for bound, total in self.cumulative()},
+        }
+
+
+class RunMetrics:
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self.counters: Dict[str, float] = {}
+        self.gauges: Dict[str, float] = {}
+        self.histograms: Dict[str, Histogram] = {
+            "asr_segment_seconds": Histogram(LATENCY_BUCKETS),
+            "asr_segment_rtf": Histogram(RTF_BUCKETS),
+        }
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    @contextmanager
+    def activate(self):
+        previous = current_metrics()
+        _current.metrics = self
+        try:
+            yield self
+        finally:
+            _current.metrics = previous
+
+    def increment(self, name: str, value: float = 1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def set(self, name: str, value: float):
+        self.gauges[name] = value
+
+    def merge(self, other: "RunMetrics"):
+        # Folds in what a worker process recorded for one batch.
+        for name, value in other.counters.items():
+            self.increment(name, value)
+        for name, histogram in other.histograms.items():
+            self.histograms[name].merge(histogram)
+
+    def observe_segment(self, audio_sec: float, wall_sec: float):
+        self.histograms["asr_segment_seconds"].observe(wall_sec)
+        if audio_sec > 0:
+            self.histograms["asr_segment_rtf"].observe(wall_sec / audio_sec)
+
+    def finish(self):
+        wall = sum(self.stages.values())
+        audio_sec = self.gauges.get("audio_seconds", 0.0)
+        self.set("wall_seconds", wall)
+        self.set("audio_seconds_per_wall_second", audio_sec / wall if wall else 0.0)
+        self.set("peak_rss_mb", peak_rss_mb())
+
+    def to_dict(self) -> Dict:
+        return {
+            "stages": {name: round(sec, 6) for name, sec in self.stages.items()},
+            "counters": dict(self.counters),
+            "gauges": {name: round(value, 6) for name, value in self.gauges.items()},
+            "histograms": {name: hist.to_dict() for name, hist in self.histograms.items()},
+        }
+
+    def write_json(self, path: Union[str, Path]):
+        _atomic_write(Path(path), json.dumps(self.to_dict(), ensure_ascii=False, indent=2) + "\n")
+
+    def write_prometheus(self, path: Union[str, Path], labels: Optional[Dict[str, str]] = None):
+        # node_exporter's textfile collector reads *.prom files; the file is
+        # swapped in atomically so a scrape never sees a partial write.
+        _atomic_write(Path(path), self.to_prometheus(labels))
+
+    def to_prometheus(self, labels: Optional[Dict[str, str]] = None) -> str:
+        base = _labels(labels or {})
+        lines = [
+            f"# HELP {PREFIX}_stage_seconds Wall time spent in each pipeline stage.",
+            f"# TYPE {PREFIX}_stage_seconds gauge",
+        ]
+        for name, sec in self.stages.items():
+            lines.append(f"{PREFIX}_stage_seconds{_labels({**(labels or {}), 'stage': name})} {sec:.6f}")
+
+        for name, value in self.counters.items():
+            lines.append(f"# TYPE {PREFIX}_{name}_total counter")
+            lines.append(f"{PREFIX}_{name}_total{base} {value}")
+
+        for name, value in self.gauges.items():
+            lines.append(f"# TYPE {PREFIX}_{name} gauge")
+            lines.append(f"{PREFIX}_{name}{base} {value:.6f}")
+
+        for name, hist in self.histograms.items():
+            metric = f"{PREFIX}_{name}"
+            lines.append(f"# TYPE {metric} histogram")
+            for bound, total in hist.cumulative():
+                lines.append(f"{metric}_bucket{_labels({**(labels or {}), 'le': str(bound)})} {total}")
+            lines.append(f"{metric}_bucket{_labels({**(labels or {}), 'le': '+Inf'})} {hist.count}")
+            lines.append(f"{metric}_sum{base} {hist.sum:.6f}")
+            lines.append(f"{metric}_count{base} {hist.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        f'{key}="' + str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for key, value in labels.items()
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _atomic_write(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
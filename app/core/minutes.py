@@ -1,29 +1,16 @@
 import logging
-import re
 from typing import List, Dict
 from pathlib import Path
 
+from .rules import RulePack
+
 logger = logging.getLogger(__name__)
 
 
 class MinutesGenerator:
     def __init__(self, config):
         self.config = config
-
-        self.action_patterns = [
-            r'(?:할|해야|할 것|해줘|해주세요|부탁드립니다|요청드립니다)',
-            r'(?:assign|assigned|assigns|will do|should do|please|request)',
-        ]
-
-        self.decision_patterns = [
-            r'(?:결정|확정|선정|선정하|채택|채택하|최종)',
-            r'(?:decided|determine|finalize|select|adopt)',
-        ]
-
-        self.issue_patterns = [
-            r'(?:문제|이슈|리스크|우려|걱정|문제점|오류|버그|에러)',
-            r'(?:issue|risk|problem|concern|worry|bug|error)',
-        ]
+        self.rule_pack = RulePack.from_file(config.minutes_rules_file)
 
     def generate_minutes(
         self,
@@ -32,13 +19,12 @@ class MinutesGenerator:
     ):
         logger.info("Generating meeting minutes")
 
-        full_text = " ".join([seg["text"] for seg in segments])
-
-        discussions = self._extract_discussions(segments)
-        decisions = self._extract_decisions(segments)
-        action_items = self._extract_action_items(segments)
-        issues = self._extract_issues(segments)
-        open_questions = self._extract_open_questions(segments)
+        found = self.rule_pack.classify(segments)
+        discussions = self._with_timestamps(found.get("discussions", []))
+        decisions = self._with_timestamps(found.get("decisions", []))
+        action_items = self._with_timestamps(found.get("action_items", []))
+        issues = self._with_timestamps(found.get("issues", []))
+        open_questions = self._with_timestamps(found.get("open_questions", []))
 
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write("# 회의록 (Meeting Minutes)\n\n")
@@ -113,118 +99,15 @@ class MinutesGenerator:
                         f.write(f" (근거: {question['timestamp']})")
                     f.write("\n")
             else:
-                f.write("추가 확인 필요 없음\n"
-                )
+                f.write("추가 확인 필요 없음\n")
             f.write("\n")
 
         logger.info(f"Minutes generated: {output_path}")
 
-    def _extract_discussions(
-        self,
-        segments: List[Dict],
-        max_items: int = 10,
-    ) -> List[Dict]:
-        discussions = []
-
-        for seg in segments:
-            text = seg["text"].strip()
-            if len(text) > 30:
-                discussions.append({
-                    "text": text,
-                    "timestamp": self._format_timestamp(seg["start"]),
-                })
-                if len(discussions) >= max_items:
-                    break
-
-        return discussions
-
-    def _extract_decisions(
-        self,
-        segments: List[Dict],
-    ) -> List[Dict]:
-        decisions = []
-
-        combined_pattern = "|".join(self.decision_patterns)
-
-        for seg in segments:
-            text = seg["text"].strip()
-            if re.search(combined_pattern, text, re.IGNORECASE):
-                decisions.append({
-                    "text": text,
-                    "timestamp": self._format_timestamp(seg["start"]),
-                })
-
-        return decisions
-
-    def _extract_action_items(
-        self,
-        segments: List[Dict],
-    ) -> List[Dict]:
-        action_items = []
-
-        combined_pattern = "|".join(self.action_patterns)
-
-        for seg in segments:
-            text = seg["text"].strip()
-            if re.search(combined_pattern, text, re.IGNORECASE):
-                action_items.append({
-                    "text": text,
-                    "timestamp": self._format_timestamp(seg["start"]),
-                    "assignee": self._extract_assignee(text),
-                    "deadline": self._extract_deadline(text),
-                })
-
-        return action_items
-
-    def _extract_issues(
-        self,
-        segments: List[Dict],
-    ) -> List[Dict]:
-        issues = []
-
-        combined_pattern = "|".join(self.issue_patterns)
-
-        for seg in segments:
-            text = seg["text"].strip()
-            if re.search(combined_pattern, text, re.IGNORECASE):
-                issues.append({
-                    "text": text,
-                    "timestamp": self._format_timestamp(seg["start"]),
-                })
-
-        return issues
-
-    def _extract_open_questions(
-        self,
-        segments: List[Dict],
-    ) -> List[Dict]:
-        questions = []
-
-        for seg in segments:
-            text = seg["text"].strip()
-            if "?" in text or "물어봐" in text or "확인" in text:
-                questions.append({
-                    "text": text,
-                    "timestamp": self._format_timestamp(seg["start"]),
-                })
-
-        return questions[:5]
-
-    def _extract_assignee(self, text: str) -> str:
-        names = re.findall(
-            r'(?:담당자|by|from|with)\s*[:is]*\s*([가-힣A-Za-z]+(?:\s+[가-힣A-Za-z]+)?)',
-            text,
-            re.IGNORECASE
-        )
-        return names[0] if names else None
-
-    def _extract_deadline(self, text: str) -> str:
-        deadlines = re.findall(
-            r'(?:기한|deadline|by|until|까지)\s*[:is]*\s*(\d{1,2}(?:월|월\s*\d{1,2}일|/|\.).*?)(?:까지|까지|$)',
-            text,
-            re.IGNORECASE
-        )
-        return deadlines[0] if deadlines else None
+    def _with_timestamps(self, items: List[Dict]) -> List[Dict]:
+        for item in items:
+            item["timestamp"] = self._format_timestamp(item["start"])
+        return items
 
     def _format_timestamp(self, seconds: float) -> str:
         hours = int(seconds // 3600)
@@ -0,0 +1,92 @@
+import logging
+import numpy as np
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class WindowPacker:
+    # Packs VAD speech regions into decoder windows. Whisper pads every call
+    # to 30 s, so a window costs the same whether it holds 2 s or 30 s of
+    # speech: regions are merged greedily until the next one would overflow
+    # the window or sits behind a long silence, and regions longer than a
+    # window are cut where the speech probability is lowest.
+    def __init__(
+        self,
+        sample_rate: int,
+        max_window_ms: int = 30000,
+        max_gap_ms: int = 3000,
+        frame_size: int = 512,
+    ):
+        self.sample_rate = sample_rate
+        self.max_window = max_window_ms * sample_rate // 1000
+        self.max_gap = max_gap_ms * sample_rate // 1000
+        self.frame_size = frame_size
+
+        self.windows = 0
+        self.splits = 0
+        self.speech_samples = 0
+        self.window_samples = 0
+
+    def pack(self, regions: Iterable[Dict]) -> Iterator[Tuple[float, float]]:
+        window_start = None
+        window_end = None
+
+        for region in regions:
+            for start, end in self._split(region):
+                self.speech_samples += end - start
+
+                if window_start is None:
+                    window_start, window_end = start, end
+                elif start - window_end <= self.max_gap and end - window_start <= self.max_window:
+                    window_end = end
+                else:
+                    yield self._close(window_start, window_end)
+                    window_start, window_end = start, end
+
+        if window_start is not None:
+            yield self._close(window_start, window_end)
+
+    def stats(self) -> Dict:
+        # Fill ratio: how much of the decoder's fixed window is actually used.
+        capacity = self.windows * self.max_window
+        return {
+            "windows": self.windows,
+            "splits": self.splits,
+            "speech_sec": self.speech_samples / self.sample_rate,
+            "fill_ratio": self.window_samples / capacity if capacity else 0.0,
+        }
+
+    def _close(self, start: int, end: int) -> Tuple[float, float]:
+        self.windows += 1
+        self.window_samples += end - start
+        return (start / self.sample_rate, end / self.sample_rate)
+
+    def _split(self, region: Dict) -> List[Tuple[int, int]]:
+        start, end = region["start"], region["end"]
+        probs: Optional[np.ndarray] = region.get("probs")
+        probs_start = region.get("probs_start", start)
+
+        pieces = []
+        while end - start > self.max_window:
+            cut = self._cut_point(start, probs, probs_start)
+            pieces.append((start, cut))
+            start = cut
+            self.splits += 1
+
+        pieces.append((start, end))
+        return pieces
+
+    def _cut_point(self, start: int, probs: Optional[np.ndarray], probs_start: int) -> int:
+        # Search the second half of the window so no piece is tiny.
+        limit = start + self.max_window
+        if probs is None or not len(probs):
+            return limit
+
+        first = max(0, (start + self.max_window // 2 - probs_start) // self.frame_size)
+        last = min(len(probs), (limit - probs_start) // self.frame_size)
+        if first >= last:
+            return limit
+
+        frame = first + int(np.argmin(probs[first:last]))
+        return probs_start + frame * self.frame_size
@@ -0,0 +1,402 @@
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Optional, List, Dict, Tuple
+
+from .config import Config
+from .audio import AudioConverter, AudioBuffer, GrowingAudioBuffer
+from .vad import VADSegmenter
+from .asr import decode_options
+from .cascade import create_asr_engine, cascade_summary
+from .workers import ASRWorkerPool
+from .postprocess import PostProcessor
+from .minutes import MinutesGenerator
+from .io import CheckpointManager
+from .cache import ASRCache, CachedASREngine, FailedDecode
+from .streaming import StageThread
+from .export import ExportSink, meeting_info
+from .archive import TranscriptArchive
+from .transcript import Transcript
+from .workspace import Workspace
+from .metrics import RunMetrics
+
+logger = logging.getLogger(__name__)
+
+
+class DictationPipeline:
+    def __init__(
+        self,
+        config: Config,
+        vad_segmenter: Optional[VADSegmenter] = None,
+        asr_engine=None,
+    ):
+        self.config = config
+        self.audio_converter = AudioConverter(config)
+        # Long-running callers (server, batch mode) pass preloaded models
+        # and keep ownership of them. Otherwise models load on first use, so
+        # a run whose stages are all cached in the workspace loads none.
+        self._vad_segmenter = vad_segmenter
+        self._asr_engine = asr_engine
+        self.owns_asr_engine = asr_engine is None
+        self._transcriber = None
+        self._workspace = None
+        self._checkpoint_manager = None
+        self.asr_cache = None
+        self.post_processor = PostProcessor(config)
+        self.minutes_generator = MinutesGenerator(config)
+        self.metrics = RunMetrics()
+
+    @property
+    def vad_segmenter(self) -> VADSegmenter:
+        if self._vad_segmenter is None:
+            self._vad_segmenter = VADSegmenter(self.config)
+        return self._vad_segmenter
+
+    @property
+    def asr_engine(self):
+        if self._asr_engine is None:
+            if self._uses_worker_pool():
+                self._asr_engine = ASRWorkerPool(self.config)
+            else:
+                self._asr_engine = create_asr_engine(self.config)
+        return self._asr_engine
+
+    @property
+    def transcriber(self):
+        if self._transcriber is None:
+            self._transcriber = self.asr_engine
+            if self.config.use_cache:
+                self.asr_cache = ASRCache(self.config.cache_dir, self.config.cache_max_mb * 1024 * 1024)
+                self._transcriber = CachedASREngine(self.asr_engine, self.asr_cache, self.config)
+        return self._transcriber
+
+    @property
+    def workspace(self) -> Optional[Workspace]:
+        if self._workspace is None and self.config.use_workspace:
+            self._workspace = Workspace(self.config)
+        return self._workspace
+
+    @property
+    def checkpoint_manager(self) -> CheckpointManager:
+        if self._checkpoint_manager is None:
+            # With a workspace the journal is the raw ASR artifact and is
+            # kept; without one it is a plain checkpoint, deleted on success.
+            if self.workspace is not None:
+                self._checkpoint_manager = CheckpointManager(self.workspace.checkpoint_path)
+            else:
+                self._checkpoint_manager = CheckpointManager(self.config.checkpoint_file)
+        return self._checkpoint_manager
+
+    def _uses_worker_pool(self) -> bool:
+        if self._asr_engine is not None:
+            return isinstance(self._asr_engine, ASRWorkerPool)
+        return self.config.num_workers > 1 and not self.config.streaming
+
+    def progress_callback(self, current: int, total: int, message: str):
+        progress = (current / total) * 100
+        logger.info(f"[{progress:.1f}%] {message}")
+
+    def run(self) -> bool:
+        start_time = time.time()
+        logger.info("=" * 50)
+        logger.info("Starting dictation pipeline")
+        logger.info("=" * 50)
+
+        try:
+            if self.config.streaming:
+                self._export(self._run_streaming, stage="streaming")
+            else:
+                audio, segments = self.prepare()
+                self.transcribe_and_export(audio, segments)
+
+            elapsed = time.time() - start_time
+            logger.info("=" * 50)
+            logger.info(f"Pipeline completed in {elapsed:.1f} seconds")
+            logger.info("=" * 50)
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Pipeline failed: {e}", exc_info=True)
+            return False
+
+        finally:
+            if self.owns_asr_engine and isinstance(self._asr_engine, ASRWorkerPool):
+                self._asr_engine.close()
+
+    def prepare(self) -> Tuple[AudioBuffer, List[Dict]]:
+        with self.metrics.stage("decode"):
+            audio = self._convert_audio()
+        with self.metrics.stage("vad"):
+            segments = self._segment_audio(audio)
+        return audio, segments
+
+    def transcribe_and_export(self, audio: AudioBuffer, segments: List[Dict]):
+        self._export(lambda sink: self._transcribe_segments(audio, segments, sink))
+
+    def _export(self, transcribe, stage: str = "asr"):
+        # Transcript files are written while ASR runs; only the minutes need
+        # the whole transcript.
+        sink = ExportSink(self.config, self.post_processor)
+        try:
+            with self.metrics.stage(stage), self.metrics.activate():
+                transcribe(sink)
+        finally:
+            transcript = sink.close()
+
+        minutes_path = None
+        if "minutes" in self.config.formats:
+            logger.info("Step 4/4: Generating minutes")
+            minutes_path = self.config.output_dir / "minutes.md"
+            with self.metrics.stage("minutes"):
+                self.minutes_generator.generate_minutes(transcript, minutes_path)
+
+        logger.info(f"Output files saved to: {self.config.output_dir}")
+        self._finish_checkpoint()
+
+        if self.config.archive_db:
+            with self.metrics.stage("archive"):
+                self._archive(transcript, minutes_path)
+
+        self.metrics.increment("transcript_segments", len(transcript))
+        self._write_metrics()
+
+    def _write_metrics(self):
+        self.metrics.finish()
+        stages = ", ".join(f"{name} {sec:.1f}s" for name, sec in self.metrics.stages.items())
+        logger.info(
+            f"Stages: {stages}; {self.metrics.gauges['audio_seconds_per_wall_second']:.1f} "
+            f"audio s/s, peak RSS {self.metrics.gauges['peak_rss_mb']:.0f} MB"
+        )
+
+        # Like the archive, metrics are reported on failure but never fail
+        # a run whose outputs are written.
+        try:
+            self.metrics.write_json(self.config.output_dir / "run_metrics.json")
+            if self.config.metrics_textfile:
+                self.metrics.write_prometheus(
+                    self.config.metrics_textfile,
+                    labels={"input": self.config.input_file.name},
+                )
+        except OSError as e:
+            logger.error(f"Failed to write run metrics: {e}")
+
+    def _archive(self, transcript: Transcript, minutes_path: Optional[Path]):
+        # The outputs are already written; a failed archive update is
+        # reported but does not fail the run.
+        try:
+            archive = TranscriptArchive(self.config.archive_db)
+            try:
+                archive.add_meeting(
+                    self.config.output_dir,
+                    meeting_info(self.config),
+                    transcript,
+                    minutes=minutes_path.read_text(encoding="utf-8") if minutes_path else None,
+                    input_file=str(self.config.input_file),
+                )
+            finally:
+                archive.close()
+        except Exception as e:
+            logger.error(f"Failed to add transcript to archive {self.config.archive_db}: {e}")
+
+    def _finish_checkpoint(self):
+        if self.workspace is not None:
+            self.checkpoint_manager.compact()
+            self.workspace.prune(self.config.workspace_keep)
+        else:
+            self.checkpoint_manager.delete()
+
+    def _convert_audio(self) -> AudioBuffer:
+        if self.workspace is not None:
+            audio = self.workspace.load_pcm()
+            if audio is not None:
+                logger.info("Step 1/4: Reusing decoded audio from workspace")
+            else:
+                logger.info("Step 1/4: Decoding MP3 to workspace")
+                # Saved as .npy and mapped back, so worker processes can map
+                # the same file.
+                audio = self.workspace.save_pcm(self.audio_converter.decode_pcm())
+        # Worker processes map the WAV file instead of receiving the samples.
+        elif self.config.decode_mode == "wav" or self._uses_worker_pool():
+            logger.info("Step 1/4: Converting MP3 to WAV")
+            wav_path = self.audio_converter.convert_mp3_to_wav()
+            audio = AudioBuffer.from_wav(wav_path)
+        else:
+            logger.info("Step 1/4: Decoding MP3 to memory")
+            audio = self.audio_converter.decode_pcm()
+
+        logger.info(f"Audio duration: {audio.duration / 60:.1f} minutes")
+        self.metrics.set("audio_seconds", audio.duration)
+
+        return audio
+
+    def _segment_audio(self, audio: AudioBuffer) -> list:
+        if self.workspace is not None:
+            segments_dict = self.workspace.load_segments()
+            if segments_dict is not None:
+                logger.info(f"Step 2/4: Reusing {len(segments_dict)} VAD segments from workspace")
+                self._record_segments(segments_dict)
+                return segments_dict
+
+        logger.info("Step 2/4: VAD segmentation")
+        segments = self.vad_segmenter.segment_audio(audio)
+
+        logger.info(f"Found {len(segments)} speech segments")
+
+        total_speech = sum(end - start for start, end in segments)
+        logger.info(f"Total speech duration: {total_speech / 60:.1f} minutes")
+
+        segments_dict = self.vad_segmenter.segments_to_dict(segments)
+        self._record_segments(segments_dict)
+
+        if self.workspace is not None:
+            self.workspace.save_segments(segments_dict)
+
+        return segments_dict
+
+    def _record_segments(self, segments: List[Dict]):
+        self.metrics.set("vad_windows", len(segments))
+        self.metrics.set("speech_seconds", sum(seg["end"] - seg["start"] for seg in segments))
+
+    def _run_streaming(self, sink: ExportSink):
+        logger.info("Steps 1-3/4: Streaming decode, VAD and Speech-to-Text")
+
+        audio = GrowingAudioBuffer(self.config.sample_rate)
+        stop_event = threading.Event()
+
+        def decode():
+            for chunk in self.audio_converter.stream_pcm():
+                audio.append(chunk)
+                yield chunk
+
+        def segment():
+            for start, end in self.vad_segmenter.segment_stream(decoder):
+                yield {"start": start, "end": end}
+
+        decoder = StageThread("decode", decode, self.config.stream_queue_size, stop_event)
+        segmenter = StageThread("vad", segment, self.config.stream_queue_size, stop_event)
+
+        decoder.start()
+        segmenter.start()
+        try:
+            self._transcribe_segments(audio, segmenter, sink)
+        finally:
+            stop_event.set()
+
+        logger.info(f"Audio duration: {audio.duration / 60:.1f} minutes")
+        self.metrics.set("audio_seconds", audio.duration)
+
+    def _transcribe_segments(
+        self,
+        audio: AudioBuffer,
+        segments,
+        sink: ExportSink,
+    ):
+        logger.info("Step 3/4: Speech-to-Text")
+
+        checkpoint_data = self.checkpoint_manager.load_segments()
+
+        done_segments = set()
+
+        if checkpoint_data:
+            done_segments = checkpoint_data.get("done_segments", set())
+            for idx, results in sorted(checkpoint_data.get("segments", {}).items()):
+                sink.add(idx, results)
+            self.metrics.increment("checkpoint_restored_segments", len(done_segments))
+            logger.info(f"Resuming from checkpoint: {len(done_segments)} segments done")
+
+        # A list comes from the sequential path; any other iterable is a live
+        # VAD stream whose total is only known once it is exhausted.
+        streamed = not isinstance(segments, list)
+        total_segments = 0 if streamed else len(segments)
+        closed = 0
+
+        def pending():
+            nonlocal closed
+            for idx, segment in enumerate(segments):
+                closed = idx + 1
+                if idx not in done_segments:
+                    yield idx, segment
+
+        indexed_segments = pending() if streamed else list(pending())
+        if not streamed and not indexed_segments:
+            # Everything was replayed from the journal; the model never loads.
+            logger.info("All segments restored from checkpoint, skipping ASR")
+            completed = iter(())
+        else:
+            # A shared engine decodes with this job's prompt and settings.
+            completed = self.transcriber.iter_transcribe(
+                audio,
+                indexed_segments,
+                options=decode_options(self.config),
+            )
+
+        failed = 0
+        for idx, results in completed:
+            # A failed decode is exported empty but not journaled, so the
+            # next run or resume decodes it again.
+            if isinstance(results, FailedDecode):
+                failed += 1
+            else:
+                self.checkpoint_manager.append_segment(idx, results)
+                self.metrics.increment("checkpoint_appends")
+            sink.add(idx, results)
+            done_segments.add(idx)
+
+            total = total_segments or closed
+            self.progress_callback(
+                len(done_segments),
+                total,
+                f"Transcribed segment {idx + 1}/{total}"
+            )
+
+        if failed:
+            self.metrics.increment("asr_failed_segments", failed)
+            logger.warning(f"{failed} segments failed to transcribe; they are retried on the next run")
+
+        if self.asr_cache is not None:
+            stats = self.asr_cache.stats()
+            for key in ("hits", "misses", "evictions"):
+                self.metrics.increment(f"asr_cache_{key}", stats[key])
+
+            logger.info(
+                f"ASR cache: {stats['hits']} hits, {stats['misses']} misses, "
+                f"{stats['evictions']} evictions, {stats['size_bytes'] / 1024 / 1024:.1f} MB"
+            )
+
+        self._record_cascade()
+        self._record_decoding()
+
+    def _record_cascade(self):
+        summary = cascade_summary(self.metrics.counters)
+        if summary is None:
+            return
+
+        self.metrics.set("cascade_escalated_fraction", summary["escalated_fraction"])
+        message = (
+            f"Cascade: {summary['escalated_fraction']:.1%} of windows re-decoded with {self.config.model_name} "
+            f"(draft {summary['draft_sec']:.1f}s, accurate {summary['final_sec']:.1f}s)"
+        )
+        if "saved_sec" in summary:
+            self.metrics.set("cascade_saved_seconds", summary["saved_sec"])
+            message += f", about {summary['saved_sec']:.1f}s saved against {self.config.model_name} alone"
+        logger.info(message)
+
+    def _record_decoding(self):
+        windows = self.metrics.counters.get("decode_windows", 0)
+        if not windows:
+            return
+
+        reasons = {
+            key[len("decode_fallback_"):]: count
+            for key, count in self.metrics.counters.items()
+            if key.startswith("decode_fallback_")
+        }
+        fallbacks = sum(reasons.values())
+        self.metrics.set("decode_fallback_fraction", fallbacks / windows)
+        detail = ", ".join(f"{count:.0f} {reason}" for reason, count in sorted(reasons.items()))
+        logger.info(
+            f"Adaptive decoding: {fallbacks:.0f}/{windows:.0f} windows ({fallbacks / windows:.1%}) "
+            f"needed beam search fallback" + (f" ({detail})" if detail else "")
+        )
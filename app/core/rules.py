@@ -0,0 +1,93 @@
+import logging
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RULES_FILE = Path(__file__).resolve().parent.parent / "resources" / "minutes_rules.yaml"
+
+
+@dataclass
+class CategoryRule:
+    name: str
+    pattern: Optional[re.Pattern] = None
+    min_length: int = 0
+    max_items: Optional[int] = None
+    extract: List[str] = field(default_factory=list)
+
+    def matches(self, text: str) -> bool:
+        if len(text) < self.min_length:
+            return False
+        return self.pattern is None or self.pattern.search(text) is not None
+
+
+class RulePack:
+    # Compiled once per pack; classify() tests every segment against every
+    # category in one pass and runs extractors only on matched segments.
+    def __init__(self, rules: List[CategoryRule], extractors: Dict[str, re.Pattern]):
+        self.rules = rules
+        self.extractors = extractors
+
+        for rule in rules:
+            unknown = set(rule.extract) - set(extractors)
+            if unknown:
+                raise ValueError(f"Category '{rule.name}' uses unknown extractors: {sorted(unknown)}")
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RulePack":
+        flags = re.IGNORECASE if data.get("ignore_case", False) else 0
+
+        rules = []
+        for name, spec in (data.get("categories") or {}).items():
+            spec = spec or {}
+            alternatives = list(spec.get("patterns", []))
+            alternatives += [re.escape(keyword) for keyword in spec.get("keywords", [])]
+            rules.append(CategoryRule(
+                name=name,
+                pattern=re.compile("|".join(alternatives), flags) if alternatives else None,
+                min_length=int(spec.get("min_length", 0)),
+                max_items=spec.get("max_items"),
+                extract=list(spec.get("extract", [])),
+            ))
+
+        extractors = {
+            name: re.compile(pattern, flags)
+            for name, pattern in (data.get("extractors") or {}).items()
+        }
+        return cls(rules, extractors)
+
+    @classmethod
+    def from_file(cls, path: Optional[Union[str, Path]] = None) -> "RulePack":
+        import yaml
+
+        path = Path(path) if path else DEFAULT_RULES_FILE
+        with open(path, 'r', encoding='utf-8') as f:
+            pack = cls.from_dict(yaml.safe_load(f) or {})
+
+        logger.info(f"Loaded {len(pack.rules)} minutes categories from {path}")
+        return pack
+
+    def classify(self, segments: List[Dict]) -> Dict[str, List[Dict]]:
+        found = {rule.name: [] for rule in self.rules}
+
+        for seg in segments:
+            text = seg["text"].strip()
+            for rule in self.rules:
+                items = found[rule.name]
+                if rule.max_items is not None and len(items) >= rule.max_items:
+                    continue
+                if not rule.matches(text):
+                    continue
+
+                item = {"text": text, "start": seg["start"]}
+                for name in rule.extract:
+                    item[name] = self.extract(name, text)
+                items.append(item)
+
+        return found
+
+    def extract(self, name: str, text: str) -> Optional[str]:
+        match = self.extractors[name].search(text)
+        return match.group(1) if match else None
@@ -0,0 +1,62 @@
+import logging
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+_END = object()
+
+
+class StageThread(threading.Thread):
+    # Runs one producer stage and pushes its items into a bounded queue.
+    # A full queue blocks the stage, which is what keeps decode and VAD
+    # from running arbitrarily far ahead of ASR.
+    def __init__(
+        self,
+        name: str,
+        produce: Callable[[], Iterable],
+        maxsize: int,
+        stop_event: threading.Event,
+    ):
+        super().__init__(name=name, daemon=True)
+        self.produce = produce
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.stop_event = stop_event
+        self.error: Optional[BaseException] = None
+
+    def run(self):
+        try:
+            for item in self.produce():
+                if not self._put(item):
+                    return
+        except BaseException as e:
+            logger.error(f"Stage '{self.name}' failed: {e}")
+            self.error = e
+        finally:
+            self._put(_END)
+
+    def _put(self, item) -> bool:
+        while not self.stop_event.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def __iter__(self) -> Iterator:
+        while True:
+            try:
+                item = self.queue.get(timeout=0.1)
+            except queue.Empty:
+                if self.stop_event.is_set():
+                    return
+                continue
+
+            if item is _END:
+                if self.error is not None:
+                    raise RuntimeError(f"Stage '{self.name}' failed") from self.error
+                return
+
+            yield item
@@ -0,0 +1,90 @@
+import logging
+import re
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TERMS_FILE = Path(__file__).resolve().parent.parent / "resources" / "terms.tsv"
+
+
+def load_terms(path: Union[str, Path]) -> Dict[str, str]:
+    # One entry per line: "variant<TAB>canonical", or just "canonical" to fix
+    # the casing of a term. Blank lines and '#' comments are skipped.
+    terms = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            parts = [part.strip() for part in line.split("\t")]
+            if len(parts) == 1:
+                variant = canonical = parts[0]
+            elif len(parts) == 2 and all(parts):
+                variant, canonical = parts
+            else:
+                raise ValueError(f"{path}:{line_no}: expected 'variant<TAB>canonical'")
+
+            terms[variant.lower()] = canonical
+    return terms
+
+
+def _trie_pattern(node: Dict) -> str:
+    # A term may end early only after every longer continuation failed, so
+    # the regex engine walks the trie once per position and prefers the
+    # longest term.
+    end = "" in node
+    branches = sorted(char for char in node if char)
+    alternatives = []
+    for char in branches:
+        alternatives.append(re.escape(char) + _trie_pattern(node[char]))
+
+    if not alternatives:
+        return ""
+
+    if len(alternatives) == 1:
+        body = alternatives[0]
+    else:
+        body = "(?:" + "|".join(alternatives) + ")"
+
+    return f"(?:{body})?" if end else body
+
+
+class TermNormalizer:
+    # All terms are compiled into one case-insensitive regex shaped like a
+    # trie, so a segment is rewritten in a single left-to-right scan no
+    # matter how large the dictionary is.
+    def __init__(self, terms: Dict[str, str]):
+        self.terms = {variant.lower(): canonical for variant, canonical in terms.items()}
+        self.pattern = self._compile(self.terms)
+
+    @classmethod
+    def from_file(cls, path: Optional[Union[str, Path]] = None) -> "TermNormalizer":
+        path = Path(path) if path else DEFAULT_TERMS_FILE
+        normalizer = cls(load_terms(path))
+        logger.info(f"Loaded {len(normalizer.terms)} terms from {path}")
+        return normalizer
+
+    def _compile(self, terms: Dict[str, str]) -> Optional[re.Pattern]:
+        if not terms:
+            return None
+
+        trie = {}
+        for variant in terms:
+            node = trie
+            for char in variant:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        # Lookarounds instead of \b so terms may start or end with symbols.
+        return re.compile(r"(?<!\w)" + _trie_pattern(trie) + r"(?!\w)", re.IGNORECASE)
+
+    def normalize(self, text: str) -> str:
+        if self.pattern is None:
+            return text
+        return self.pattern.sub(self._replace, text)
+
+    def _replace(self, match: re.Match) -> str:
+        found = match.group(0)
+        return self.terms.get(found.lower(), found)
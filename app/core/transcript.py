@@ -0,0 +1,197 @@
+from array import array
+from pathlib import Path
+from typing import List, Dict, Iterator, Union
+import numpy as np
+
+# Columnar transcript storage: one NumPy array per field instead of a dict
+# per segment and per word, with segment and word text each kept in one UTF-8
+# buffer plus offsets. SegmentView/WordView give attribute and dict-style
+# access to a single row; to_dicts() rebuilds the list-of-dicts shape the
+# exporters and the JSON output use.
+
+SEGMENT_FIELDS = ("start", "end", "text", "words")
+WORD_FIELDS = ("start", "end", "word", "probability")
+
+
+class WordView:
+    __slots__ = ("_transcript", "_index")
+
+    def __init__(self, transcript: "Transcript", index: int):
+        self._transcript = transcript
+        self._index = index
+
+    @property
+    def start(self) -> float:
+        return float(self._transcript.word_start[self._index])
+
+    @property
+    def end(self) -> float:
+        return float(self._transcript.word_end[self._index])
+
+    @property
+    def word(self) -> str:
+        t = self._transcript
+        return t._decode(t.word_text, t.word_text_offsets, self._index)
+
+    @property
+    def probability(self) -> float:
+        return float(self._transcript.word_probability[self._index])
+
+    def __getitem__(self, key: str):
+        if key not in WORD_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict:
+        return {field: getattr(self, field) for field in WORD_FIELDS}
+
+
+class SegmentView:
+    __slots__ = ("_transcript", "_index")
+
+    def __init__(self, transcript: "Transcript", index: int):
+        self._transcript = transcript
+        self._index = index
+
+    @property
+    def start(self) -> float:
+        return float(self._transcript.segment_start[self._index])
+
+    @property
+    def end(self) -> float:
+        return float(self._transcript.segment_end[self._index])
+
+    @property
+    def text(self) -> str:
+        t = self._transcript
+        return t._decode(t.segment_text, t.segment_text_offsets, self._index)
+
+    @property
+    def words(self) -> List[WordView]:
+        t = self._transcript
+        first, last = t.segment_word_offsets[self._index:self._index + 2]
+        return [WordView(t, i) for i in range(first, last)]
+
+    def __getitem__(self, key: str):
+        if key not in SEGMENT_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return self[key] if key in SEGMENT_FIELDS else default
+
+    def to_dict(self) -> Dict:
+        return {
+            "start": self.start,
+            "end": self.end,
+            "text": self.text,
+            "words": [word.to_dict() for word in self.words],
+        }
+
+
+class Transcript:
+    ARRAYS = (
+        "segment_start",
+        "segment_end",
+        "segment_text",
+        "segment_text_offsets",
+        "segment_word_offsets",
+        "word_start",
+        "word_end",
+        "word_probability",
+        "word_text",
+        "word_text_offsets",
+    )
+
+    def __init__(self, **arrays: np.ndarray):
+        for name in self.ARRAYS:
+            setattr(self, name, arrays[name])
+
+    @classmethod
+    def from_dicts(cls, segments: List[Dict]) -> "Transcript":
+        builder = TranscriptBuilder()
+        for segment in segments:
+            builder.append(segment)
+        return builder.build()
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Transcript":
+        with np.load(str(path)) as data:
+            return cls(**{name: data[name] for name in cls.ARRAYS})
+
+    def save(self, path: Union[str, Path]):
+        np.savez_compressed(str(path), **{name: getattr(self, name) for name in self.ARRAYS})
+
+    def to_dicts(self) -> List[Dict]:
+        return [segment.to_dict() for segment in self]
+
+    def __len__(self) -> int:
+        return len(self.segment_start)
+
+    def __getitem__(self, index: int) -> SegmentView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return SegmentView(self, index)
+
+    def __iter__(self) -> Iterator[SegmentView]:
+        for index in range(len(self)):
+            yield SegmentView(self, index)
+
+    @property
+    def word_count(self) -> int:
+        return len(self.word_start)
+
+    def _decode(self, buffer: np.ndarray, offsets: np.ndarray, index: int) -> str:
+        return buffer[offsets[index]:offsets[index + 1]].tobytes().decode("utf-8")
+
+
+class TranscriptBuilder:
+    # Appends segment dicts into compact typed buffers; nothing per segment
+    # or per word is kept as a Python object.
+    def __init__(self):
+        self.segment_start = array("d")
+        self.segment_end = array("d")
+        self.segment_text = bytearray()
+        self.segment_text_offsets = array("q", [0])
+        self.segment_word_offsets = array("q", [0])
+        self.word_start = array("d")
+        self.word_end = array("d")
+        # float64 like the ASR dicts, so to_dicts() gives back the same values.
+        self.word_probability = array("d")
+        self.word_text = bytearray()
+        self.word_text_offsets = array("q", [0])
+
+    def append(self, segment: Dict):
+        self.segment_start.append(segment["start"])
+        self.segment_end.append(segment["end"])
+        self._append_text(segment["text"], self.segment_text, self.segment_text_offsets)
+
+        for word in segment.get("words") or []:
+            self.word_start.append(word["start"])
+            self.word_end.append(word["end"])
+            self.word_probability.append(word.get("probability", 0.0))
+            self._append_text(word["word"], self.word_text, self.word_text_offsets)
+        self.segment_word_offsets.append(len(self.word_start))
+
+    def __len__(self) -> int:
+        return len(self.segment_start)
+
+    def build(self) -> Transcript:
+        return Transcript(
+            segment_start=np.frombuffer(self.segment_start, dtype=np.float64),
+            segment_end=np.frombuffer(self.segment_end, dtype=np.float64),
+            segment_text=np.frombuffer(bytes(self.segment_text), dtype=np.uint8),
+            segment_text_offsets=np.frombuffer(self.segment_text_offsets, dtype=np.int64),
+            segment_word_offsets=np.frombuffer(self.segment_word_offsets, dtype=np.int64),
+            word_start=np.frombuffer(self.word_start, dtype=np.float64),
+            word_end=np.frombuffer(self.word_end, dtype=np.float64),
+            word_probability=np.frombuffer(self.word_probability, dtype=np.float64),
+            word_text=np.frombuffer(bytes(self.word_text), dtype=np.uint8),
+            word_text_offsets=np.frombuffer(self.word_text_offsets, dtype=np.int64),
+        )
+
+    def _append_text(self, text: str, buffer: bytearray, offsets: array):
+        buffer.extend(text.encode("utf-8"))
+        offsets.append(len(buffer))
@@ -1,101 +1,199 @@
 import logging
 import numpy as np
-from pathlib import Path
-from typing import List, Tuple
-import torch
-from scipy.io import wavfile
+from typing import List, Tuple, Iterable, Iterator, Optional
 from .config import Config
+from .audio import AudioBuffer, pcm_to_float32
+from .vad_backends import VAD_BACKENDS
+from .packing import WindowPacker
 
 logger = logging.getLogger(__name__)
 
 
+class FrameVADIterator:
+    # Same start/end hysteresis as silero's VADIterator, but driven by any
+    # model that maps a float32 frame to a speech probability.
+    def __init__(
+        self,
+        model,
+        threshold: float = 0.5,
+        sampling_rate: int = 16000,
+        min_silence_duration_ms: int = 100,
+        speech_pad_ms: int = 30,
+    ):
+        self.model = model
+        self.threshold = threshold
+        self.min_silence_samples = sampling_rate * min_silence_duration_ms / 1000
+        self.speech_pad_samples = sampling_rate * speech_pad_ms / 1000
+        self.reset_states()
+
+    def reset_states(self):
+        self.model.reset_states()
+        self.triggered = False
+        self.temp_end = 0
+        self.current_sample = 0
+        self.last_prob = 0.0
+
+    def __call__(self, frame: np.ndarray) -> Optional[dict]:
+        window_size = len(frame)
+        self.current_sample += window_size
+
+        speech_prob = self.model(frame)
+        self.last_prob = speech_prob
+
+        if speech_prob >= self.threshold and self.temp_end:
+            self.temp_end = 0
+
+        if speech_prob >= self.threshold and not self.triggered:
+            self.triggered = True
+            start = self.current_sample - self.speech_pad_samples - window_size
+            return {"start": int(max(0, start))}
+
+        if speech_prob < self.threshold - 0.15 and self.triggered:
+            if not self.temp_end:
+                self.temp_end = self.current_sample
+            if self.current_sample - self.temp_end < self.min_silence_samples:
+                return None
+
+            end = self.temp_end + self.speech_pad_samples - window_size
+            self.temp_end = 0
+            self.triggered = False
+            return {"end": int(end)}
+
+        return None
+
+
 class VADSegmenter:
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, model=None):
         self.config = config
-        self.model = None
-        self._load_model()
+        self.model = model
+        if self.model is None:
+            self._load_model()
 
     def _load_model(self):
         try:
-            model, utils = torch.hub.load(
-                repo_or_dir="snakers4/silero-vad",
-                model="silero_vad",
-                force_reload=False,
-                onnx=False,
-            )
-            self.model = model
-            (get_speech_timestamps, save_audio, read_audio, VADIterator, collect_chunks) = utils
-            self.get_speech_timestamps = get_speech_timestamps
-            logger.info("Silero VAD model loaded")
+            backend = VAD_BACKENDS[self.config.vad_backend]
+            self.model = backend(self.config)
+            logger.info(f"Silero VAD model loaded ({self.config.vad_backend})")
         except Exception as e:
             logger.error(f"Failed to load VAD model: {e}")
             raise
 
     def segment_audio(
         self,
-        wav_path: Path,
+        audio_buffer: AudioBuffer,
     ) -> List[Tuple[float, float]]:
-        logger.info(f"Segmenting audio using VAD: {wav_path}")
+        logger.info(f"Segmenting audio using VAD: {audio_buffer.duration:.1f}s")
 
         try:
-            sample_rate, audio_data = wavfile.read(str(wav_path))
-
-            # Convert to float32 normalized to [-1, 1]
-            if audio_data.dtype == np.int16:
-                audio = audio_data.astype(np.float32) / 32768.0
-            elif audio_data.dtype == np.int32:
-                audio = audio_data.astype(np.float32) / 2147483648.0
-            else:
-                audio = audio_data.astype(np.float32)
-
-            # Handle stereo by taking first channel
-            if len(audio.shape) > 1:
-                audio = audio[:, 0]
-
-            speech_timestamps = self.get_speech_timestamps(
-                audio,
-                self.model,
-                threshold=self.config.vad_threshold,
-                sampling_rate=self.config.sample_rate,
-                min_speech_duration_ms=self.config.min_speech_duration_ms,
-                min_silence_duration_ms=self.config.min_silence_duration_ms,
-                speech_pad_ms=self.config.speech_pad_ms,
-            )
-
-            segments = self._merge_segments(speech_timestamps)
-
-            logger.info(f"VAD completed: {len(segments)} segments found")
+            # Fixed-size chunks are converted to float one at a time, so peak
+            # memory does not depend on the recording length.
+            chunk_samples = self.config.vad_chunk_ms * self.config.sample_rate // 1000
+            packer = self._make_packer()
+            segments = list(packer.pack(
+                self._speech_stream(audio_buffer.iter_chunks(chunk_samples))
+            ))
+
+            self._log_stats(packer)
             return segments
 
         except Exception as e:
             logger.error(f"VAD segmentation failed: {e}")
             raise
 
-    def _merge_segments(
+    def segment_stream(
         self,
-        timestamps: List[dict],
-    ) -> List[Tuple[float, float]]:
-        if not timestamps:
-            return []
-
-        segments = []
-        current_start = timestamps[0]["start"] / self.config.sample_rate
-        current_end = timestamps[0]["end"] / self.config.sample_rate
+        chunks: Iterable[np.ndarray],
+    ) -> Iterator[Tuple[float, float]]:
+        logger.info("Segmenting audio stream using VAD")
+
+        packer = self._make_packer()
+        yield from packer.pack(self._speech_stream(chunks))
+
+        self._log_stats(packer)
+
+    def _make_packer(self) -> WindowPacker:
+        return WindowPacker(
+            self.config.sample_rate,
+            max_window_ms=self.config.max_segment_duration_ms,
+            max_gap_ms=self.config.max_merge_gap_ms,
+            frame_size=self._frame_size(),
+        )
+
+    def _log_stats(self, packer: WindowPacker):
+        stats = packer.stats()
+        logger.info(
+            f"VAD completed: {stats['windows']} windows, "
+            f"{stats['fill_ratio'] * 100:.0f}% filled, {stats['splits']} long regions split"
+        )
+
+    def _frame_size(self) -> int:
+        return 512 if self.config.sample_rate == 16000 else 256
+
+    def _speech_stream(self, chunks: Iterable[np.ndarray]) -> Iterator[dict]:
+        # Yields speech regions in samples, each with the per-frame speech
+        # probabilities covering it so the packer can split long regions.
+        sample_rate = self.config.sample_rate
+        frame_size = self._frame_size()
+        min_speech_samples = self.config.min_speech_duration_ms * sample_rate / 1000
+        # Outside speech only a few frames are kept, enough to cover the
+        # padding a start event reaches back into.
+        history = int(self.config.speech_pad_ms * sample_rate / 1000) // frame_size + 2
+
+        vad_iterator = FrameVADIterator(
+            self.model,
+            threshold=self.config.vad_threshold,
+            sampling_rate=sample_rate,
+            min_silence_duration_ms=self.config.min_silence_duration_ms,
+            speech_pad_ms=self.config.speech_pad_ms,
+        )
+
+        carry = np.empty(0, dtype=np.int16)
+        position = 0
+        speech_start = None
+        probs = []
+        probs_start = 0
+
+        def region(start, end):
+            first = max(0, (start - probs_start) // frame_size)
+            return {
+                "start": start,
+                "end": end,
+                "probs": np.asarray(probs[first:], dtype=np.float32),
+                "probs_start": probs_start + first * frame_size,
+            }
 
-        for ts in timestamps[1:]:
-            start = ts["start"] / self.config.sample_rate
-            end = ts["end"] / self.config.sample_rate
-
-            if start - current_end < (self.config.max_segment_duration_ms / 1000.0):
-                current_end = end
-            else:
-                segments.append((current_start, current_end))
-                current_start = start
-                current_end = end
-
-        segments.append((current_start, current_end))
-
-        return segments
+        try:
+            for chunk in chunks:
+                if len(carry):
+                    chunk = np.concatenate([carry, chunk])
+
+                n_frames = len(chunk) // frame_size
+                audio = pcm_to_float32(chunk[:n_frames * frame_size])
+                carry = chunk[n_frames * frame_size:]
+
+                for i in range(n_frames):
+                    event = vad_iterator(audio[i * frame_size:(i + 1) * frame_size])
+                    probs.append(vad_iterator.last_prob)
+                    position += frame_size
+
+                    if event and "start" in event:
+                        speech_start = event["start"]
+                    elif event and "end" in event and speech_start is not None:
+                        if event["end"] - speech_start >= min_speech_samples:
+                            yield region(speech_start, event["end"])
+                        speech_start = None
+
+                    if speech_start is None and len(probs) > history:
+                        drop = len(probs) - history
+                        del probs[:drop]
+                        probs_start += drop * frame_size
+
+            end = position + len(carry)
+            if speech_start is not None and end - speech_start >= min_speech_samples:
+                yield region(speech_start, end)
+
+        finally:
+            vad_iterator.reset_states()
 
     def segments_to_dict(self, segments: List[Tuple[float, float]]) -> List[dict]:
         return [
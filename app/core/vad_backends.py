@@ -0,0 +1,77 @@
+import logging
+from pathlib import Path
+import numpy as np
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# Shipped with the app (build.spec bundles it), so the default does not
+# depend on the working directory.
+DEFAULT_VAD_MODEL = Path(__file__).resolve().parent.parent / "resources" / "silero_vad.onnx"
+
+
+class TorchVADModel:
+    def __init__(self, config: Config):
+        import torch
+
+        self.config = config
+        self._torch = torch
+        model, utils = torch.hub.load(
+            repo_or_dir="snakers4/silero-vad",
+            model="silero_vad",
+            force_reload=False,
+            onnx=False,
+        )
+        self.model = model
+
+    def __call__(self, frame: np.ndarray) -> float:
+        return self.model(self._torch.from_numpy(frame), self.config.sample_rate).item()
+
+    def reset_states(self):
+        self.model.reset_states()
+
+
+class OnnxVADModel:
+    # Runs silero_vad.onnx (v5) directly: the recurrent state and the
+    # 64/32-sample context carried between frames live here, not in torch.
+    def __init__(self, config: Config):
+        import onnxruntime
+
+        self.config = config
+        model_path = Path(config.vad_model_path) if config.vad_model_path else DEFAULT_VAD_MODEL
+        if not model_path.exists():
+            raise FileNotFoundError(f"ONNX VAD model not found: {model_path}")
+
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = config.vad_threads
+        options.inter_op_num_threads = 1
+        options.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+        self.session = onnxruntime.InferenceSession(
+            str(model_path),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self._sr = np.array(config.sample_rate, dtype=np.int64)
+        self._context_size = 64 if config.sample_rate == 16000 else 32
+        self.reset_states()
+
+    def __call__(self, frame: np.ndarray) -> float:
+        x = np.concatenate([self._context, frame[np.newaxis, :]], axis=1)
+        output, self._state = self.session.run(
+            None,
+            {"input": x, "state": self._state, "sr": self._sr},
+        )
+        self._context = x[:, -self._context_size:]
+        return float(output[0, 0])
+
+    def reset_states(self):
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._context = np.zeros((1, self._context_size), dtype=np.float32)
+
+
+VAD_BACKENDS = {
+    "torch": TorchVADModel,
+    "onnx": OnnxVADModel,
+}
@@ -0,0 +1,109 @@
+import copy
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Dict, Iterator, Optional, Tuple
+from .config import Config
+from .audio import AudioBuffer
+from .asr import ASREngine
+from .cascade import create_asr_engine
+from .metrics import RunMetrics, current_metrics
+
+logger = logging.getLogger(__name__)
+
+# Per-process state, populated by _init_worker in each pool process.
+_worker_engine = None
+_worker_audio = None
+_worker_audio_path = None
+
+
+def _init_worker(config: Config):
+    global _worker_engine
+    _worker_engine = create_asr_engine(config)
+
+
+def _transcribe_batch(
+    audio_path: Path,
+    batch: List[Tuple[int, Dict]],
+    options: Optional[Dict] = None,
+) -> Tuple[List[Tuple[int, List[Dict]]], RunMetrics]:
+    global _worker_audio, _worker_audio_path
+    if _worker_audio_path != audio_path:
+        # Every worker maps the same file, so the pages are shared.
+        _worker_audio = AudioBuffer.load(audio_path, _worker_engine.config.sample_rate)
+        _worker_audio_path = audio_path
+
+    # The job's metrics live in the parent; counters and latencies recorded
+    # here travel back with the results and are merged there.
+    metrics = RunMetrics()
+    with metrics.activate():
+        results = list(_worker_engine.iter_transcribe(_worker_audio, batch, options=options))
+    return results, metrics
+
+
+class ASRWorkerPool:
+    def __init__(self, config: Config):
+        self.config = config
+        self.num_workers = max(1, config.num_workers)
+        self.executor = None
+
+    def _worker_config(self) -> Config:
+        total_threads = self.config.cpu_threads or os.cpu_count() or 1
+        worker_config = copy.copy(self.config)
+        worker_config.num_workers = 1
+        worker_config.cpu_threads = max(1, total_threads // self.num_workers)
+        return worker_config
+
+    def _start(self):
+        worker_config = self._worker_config()
+        logger.info(
+            f"Starting {self.num_workers} ASR workers "
+            f"({worker_config.cpu_threads} CPU threads each)"
+        )
+        # spawn: CTranslate2/CUDA state must not be inherited through fork.
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(worker_config,),
+        )
+
+    def iter_transcribe(
+        self,
+        audio: AudioBuffer,
+        indexed_segments: List[Tuple[int, Dict]],
+        options: Optional[Dict] = None,
+    ) -> Iterator[Tuple[int, List[Dict]]]:
+        if audio.path is None:
+            raise ValueError("ASR workers need a file-backed AudioBuffer")
+
+        if self.executor is None:
+            self._start()
+
+        # Longest batches first so no worker is left with a long tail.
+        batches = ASREngine._make_batches(indexed_segments, self.config.batch_size)
+        batches.reverse()
+
+        futures = [
+            self.executor.submit(_transcribe_batch, audio.path, batch, options)
+            for batch in batches
+        ]
+
+        try:
+            for future in as_completed(futures):
+                completed, batch_metrics = future.result()
+                metrics = current_metrics()
+                if metrics is not None:
+                    metrics.merge(batch_metrics)
+                for idx, results in completed:
+                    yield idx, results
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
@@ -0,0 +1,119 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import List, Dict, Optional
+import numpy as np
+from .config import Config
+from .audio import AudioBuffer
+from .cache import decode_params
+
+logger = logging.getLogger(__name__)
+
+WORKSPACE_VERSION = 1
+
+
+def fingerprint_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _stage_key(parent: str, params: Dict) -> str:
+    digest = hashlib.sha256()
+    digest.update(parent.encode("utf-8"))
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class Workspace:
+    # One directory per input file, keyed by its content hash. Each stage
+    # artifact is named after a key chained from the previous stage's key and
+    # the settings that stage depends on, so changing a VAD setting reuses the
+    # decoded PCM but invalidates segments and ASR results.
+    def __init__(self, config: Config):
+        self.config = config
+        self.fingerprint = fingerprint_file(config.input_file)
+        self.root = Path(config.workspace_dir) / self.fingerprint[:16]
+
+        self.pcm_key = _stage_key(self.fingerprint, {
+            "version": WORKSPACE_VERSION,
+            "sample_rate": config.sample_rate,
+        })
+        self.segments_key = _stage_key(self.pcm_key, {
+            "vad_backend": config.vad_backend,
+            "vad_threshold": config.vad_threshold,
+            "min_speech_duration_ms": config.min_speech_duration_ms,
+            "min_silence_duration_ms": config.min_silence_duration_ms,
+            "max_segment_duration_ms": config.max_segment_duration_ms,
+            "max_merge_gap_ms": config.max_merge_gap_ms,
+            "speech_pad_ms": config.speech_pad_ms,
+        })
+        self.asr_key = _stage_key(self.segments_key, decode_params(config))
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        # Touch the directory so prune() keeps recently used inputs.
+        os.utime(self.root)
+
+    @property
+    def pcm_path(self) -> Path:
+        return self.root / f"pcm-{self.pcm_key}.npy"
+
+    @property
+    def segments_path(self) -> Path:
+        return self.root / f"segments-{self.segments_key}.json"
+
+    @property
+    def checkpoint_path(self) -> Path:
+        return self.root / f"asr-{self.asr_key}.jsonl"
+
+    def load_pcm(self) -> Optional[AudioBuffer]:
+        if not self.pcm_path.exists():
+            return None
+        try:
+            return AudioBuffer.from_npy(self.pcm_path, self.config.sample_rate)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable workspace artifact {self.pcm_path}: {e}")
+            return None
+
+    def save_pcm(self, audio: AudioBuffer) -> AudioBuffer:
+        tmp_path = self.pcm_path.with_name(self.pcm_path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            np.save(f, np.ascontiguousarray(audio.samples))
+        os.replace(tmp_path, self.pcm_path)
+
+        # Hand back the mapped file so the decoded copy can be released.
+        return AudioBuffer.from_npy(self.pcm_path, audio.sample_rate)
+
+    def load_segments(self) -> Optional[List[Dict]]:
+        try:
+            with open(self.segments_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable workspace artifact {self.segments_path}: {e}")
+            return None
+
+    def save_segments(self, segments: List[Dict]):
+        tmp_path = self.segments_path.with_name(self.segments_path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(segments, f)
+        os.replace(tmp_path, self.segments_path)
+
+    def prune(self, keep: int):
+        # Keep the most recently used input workspaces, this one included.
+        workspaces = sorted(
+            (path for path in Path(self.config.workspace_dir).iterdir() if path.is_dir()),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for path in workspaces[max(1, keep):]:
+            if path == self.root:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            logger.info(f"Pruned workspace: {path}")
@@ -0,0 +1,373 @@
+import itertools
+import json
+import logging
+import queue
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.core.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Request fields a job may set; everything model-related is fixed by the
+# server's own Config so the loaded models stay valid for every job.
+JOB_FIELDS = {
+    "input": "input_file",
+    "output": "output_dir",
+    "prompt": "initial_prompt",
+    "meeting_title": "meeting_title",
+    "meeting_date": "meeting_date",
+    "attendees": "attendees",
+    "project": "project_name",
+    "formats": "formats",
+}
+
+# Each word aligner holds its job's decoded audio; only the most recently
+# used ones are kept.
+MAX_ALIGNERS = 4
+
+OUTPUT_FILES = ["transcript.json", "transcript.jsonl", "transcript.md", "transcript.srt", "minutes.md", "run_metrics.json"]
+
+
+@dataclass
+class Job:
+    job_id: str
+    priority: int
+    config: Config
+    status: str = "queued"
+    progress: float = 0.0
+    message: str = ""
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    outputs: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return {
+            "job_id": self.job_id,
+            "priority": self.priority,
+            "input": str(self.config.input_file),
+            "output": str(self.config.output_dir),
+            "status": self.status,
+            "progress": round(self.progress, 1),
+            "message": self.message,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "outputs": self.outputs,
+        }
+
+
+class TranscriptionServer:
+    def __init__(
+        self,
+        config: Config,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        max_concurrent_jobs: int = 1,
+    ):
+        self.config = config
+        self.host = host
+        self.port = port
+        self.max_concurrent_jobs = max(1, max_concurrent_jobs)
+
+        self.jobs: Dict[str, Job] = {}
+        self.jobs_lock = threading.Lock()
+        self.job_queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self.stop_event = threading.Event()
+
+        self.asr_engine = None
+        self._align_engine = None
+        self.aligners = OrderedDict()
+        self.vad_segmenters = []
+        self.workers = []
+        self.httpd = None
+
+    def load_models(self):
+        from app.core.cascade import create_asr_engine
+        from app.core.vad import VADSegmenter
+        from app.core.workers import ASRWorkerPool
+
+        logger.info("Loading models for resident server")
+        # Streaming jobs transcribe from a growing in-memory buffer, which
+        # worker processes cannot map; they run in-process like the pipeline.
+        if self.config.num_workers > 1 and not self.config.streaming:
+            self.asr_engine = ASRWorkerPool(self.config)
+        else:
+            self.asr_engine = create_asr_engine(self.config)
+
+        # The ASR model is shared; VAD models carry recurrent state, so
+        # every job slot gets its own (they are small).
+        self.vad_segmenters = [
+            VADSegmenter(self.config)
+            for _ in range(self.max_concurrent_jobs)
+        ]
+
+    def submit(self, request: Dict) -> Job:
+        if not request.get("input"):
+            raise ValueError("'input' is required")
+
+        overrides = {
+            config_field: request[key]
+            for key, config_field in JOB_FIELDS.items()
+            if request.get(key) is not None
+        }
+        if "output_dir" not in overrides:
+            overrides["output_dir"] = str(
+                Path(self.config.output_dir) / Path(request["input"]).stem
+            )
+
+        job = Job(
+            job_id=uuid.uuid4().hex[:12],
+            priority=int(request.get("priority", 0)),
+            config=self.config.derive(**overrides),
+        )
+
+        with self.jobs_lock:
+            self.jobs[job.job_id] = job
+        # Higher priority first, FIFO within a priority.
+        self.job_queue.put((-job.priority, next(self._sequence), job.job_id))
+
+        logger.info(f"Job {job.job_id} queued (priority {job.priority}): {job.config.input_file}")
+        return job
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        with self.jobs_lock:
+            return self.jobs.get(job_id)
+
+    def list_jobs(self) -> List[Job]:
+        with self.jobs_lock:
+            return sorted(self.jobs.values(), key=lambda job: job.submitted_at)
+
+    def _aligner_engine(self):
+        from app.core.asr import ASREngine
+        from app.core.workers import ASRWorkerPool
+
+        # Aligners decode in-process. Behind a worker pool, one engine is
+        # loaded on first use and shared by every job's aligner.
+        if not isinstance(self.asr_engine, ASRWorkerPool):
+            return self.asr_engine
+        if self._align_engine is None:
+            self._align_engine = ASREngine(self.config)
+        return self._align_engine
+
+    def segment_words(self, job_id: str, idx: int) -> List[Dict]:
+        from app.core.alignment import WordAligner
+
+        job = self.get_job(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        if job.status != "done":
+            raise ValueError(f"Job {job_id} is {job.status}")
+
+        with self.jobs_lock:
+            aligner = self.aligners.get(job_id)
+            if aligner is None:
+                aligner = self.aligners[job_id] = WordAligner(job.config, self._aligner_engine())
+                # Evicted aligners lose nothing: aligned words are in
+                # words.jsonl, and the audio is decoded again on next use.
+                while len(self.aligners) > MAX_ALIGNERS:
+                    self.aligners.popitem(last=False)
+            else:
+                self.aligners.move_to_end(job_id)
+        return aligner.align([idx])[idx]
+
+    def _worker_loop(self, vad_segmenter):
+        from app.core.pipeline import DictationPipeline
+
+        while not self.stop_event.is_set():
+            try:
+                _, _, job_id = self.job_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            job = self.get_job(job_id)
+            job.status = "running"
+            job.started_at = time.time()
+
+            def progress_callback(current, total, message, job=job):
+                job.progress = (current / total) * 100 if total else 0.0
+                job.message = message
+
+            try:
+                pipeline = DictationPipeline(
+                    job.config,
+                    vad_segmenter=vad_segmenter,
+                    asr_engine=self.asr_engine,
+                )
+                pipeline.progress_callback = progress_callback
+                success = pipeline.run()
+            except Exception as e:
+                logger.error(f"Job {job.job_id} failed: {e}", exc_info=True)
+                job.error = str(e)
+                success = False
+
+            job.finished_at = time.time()
+            if success:
+                job.status = "done"
+                job.progress = 100.0
+                job.outputs = [
+                    str(job.config.output_dir / name)
+                    for name in OUTPUT_FILES
+                    if (job.config.output_dir / name).exists()
+                ]
+            else:
+                job.status = "failed"
+                job.error = job.error or "Pipeline failed, see server log"
+
+            logger.info(f"Job {job.job_id} {job.status} in {job.finished_at - job.started_at:.1f}s")
+
+    def serve_forever(self):
+        self.load_models()
+
+        for idx, vad_segmenter in enumerate(self.vad_segmenters):
+            worker = threading.Thread(
+                target=self._worker_loop,
+                args=(vad_segmenter,),
+                name=f"job-worker-{idx}",
+                daemon=True,
+            )
+            worker.start()
+            self.workers.append(worker)
+
+        self.httpd = ThreadingHTTPServer((self.host, self.port), _make_handler(self))
+        logger.info(f"Transcription server listening on http://{self.host}:{self.port}")
+
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        self.stop_event.set()
+        if self.httpd is not None:
+            self.httpd.server_close()
+        if hasattr(self.asr_engine, "close"):
+            self.asr_engine.close()
+
+
+def _make_handler(server: TranscriptionServer):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+        def _send(self, status: int, body):
+            data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            parts = [part for part in self.path.split("/") if part]
+
+            if parts == ["health"]:
+                self._send(200, {"status": "ok", "queued": server.job_queue.qsize()})
+            elif parts == ["jobs"]:
+                self._send(200, [job.to_dict() for job in server.list_jobs()])
+            elif len(parts) == 2 and parts[0] == "jobs":
+                job = server.get_job(parts[1])
+                if job is None:
+                    self._send(404, {"error": f"Unknown job: {parts[1]}"})
+                else:
+                    self._send(200, job.to_dict())
+            elif len(parts) == 5 and parts[0] == "jobs" and parts[2:5:2] == ["segments", "words"]:
+                self._send_words(parts[1], parts[3])
+            else:
+                self._send(404, {"error": f"Unknown path: {self.path}"})
+
+        def _send_words(self, job_id: str, segment: str):
+            # Word timestamps on demand, for jobs run with deferred alignment.
+            try:
+                idx = int(segment)
+            except ValueError:
+                self._send(400, {"error": f"Invalid segment index: {segment}"})
+                return
+
+            try:
+                words = server.segment_words(job_id, idx)
+            except KeyError:
+                self._send(404, {"error": f"Unknown job: {job_id}"})
+            except IndexError as e:
+                self._send(404, {"error": str(e)})
+            except ValueError as e:
+                self._send(409, {"error": str(e)})
+            else:
+                self._send(200, {"job_id": job_id, "segment": idx, "words": words})
+
+        def do_POST(self):
+            if self.path.rstrip("/") != "/jobs":
+                self._send(404, {"error": f"Unknown path: {self.path}"})
+                return
+
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                job = server.submit(request)
+            except (ValueError, TypeError) as e:
+                self._send(400, {"error": str(e)})
+                return
+
+            self._send(202, job.to_dict())
+
+    return Handler
+
+
+class TranscriptionClient:
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+
+    def _request(self, method: str, path: str, body: Optional[Dict] = None) -> Dict:
+        data = None
+        headers = {}
+        if body is not None:
+            data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            headers["Content-Type"] = "application/json; charset=utf-8"
+
+        request = urllib.request.Request(
+            self.base_url + path,
+            data=data,
+            headers=headers,
+            method=method,
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            message = json.loads(e.read() or b"{}").get("error", str(e))
+            raise RuntimeError(f"Server error {e.code}: {message}") from e
+        except urllib.error.URLError as e:
+            raise RuntimeError(f"Cannot reach transcription server at {self.base_url}: {e.reason}") from e
+
+    def submit(self, job: Dict) -> Dict:
+        return self._request("POST", "/jobs", job)
+
+    def status(self, job_id: str) -> Dict:
+        return self._request("GET", f"/jobs/{job_id}")
+
+    def segment_words(self, job_id: str, idx: int) -> Dict:
+        return self._request("GET", f"/jobs/{job_id}/segments/{idx}/words")
+
+    def wait(self, job_id: str, poll_interval: float = 1.0) -> Dict:
+        last_message = None
+        while True:
+            job = self.status(job_id)
+            if job["status"] in ("done", "failed"):
+                return job
+
+            if job["message"] != last_message:
+                logger.info(f"[{job['progress']:.1f}%] {job['message'] or job['status']}")
+                last_message = job["message"]
+            time.sleep(poll_interval)
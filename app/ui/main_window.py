@@ -10,7 +10,6 @@ from PySide6.QtCore import QThread, Signal, Qt
 from PySide6.QtGui import QFont
 
 from app.core.config import Config
-from main import DictationPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +25,10 @@ class PipelineThread(QThread):
 
     def run(self):
         try:
+            # Loaded on first run so the window shows before numpy and the
+            # model runtimes are imported.
+            from app.core.pipeline import DictationPipeline
+
             pipeline = DictationPipeline(self.config)
 
             original_callback = pipeline.progress_callback
@@ -0,0 +1,73 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = (
+    "torch",
+    "torchaudio",
+    "faster_whisper",
+    "ctranslate2",
+    "onnxruntime",
+    "scipy",
+    "PySide6",
+)
+
+SCENARIOS = {
+    "cli --help": ["main.py", "--help"],
+    "import pipeline": ["-c", "import app.core.pipeline"],
+}
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def measure_imports(args: List[str]) -> Tuple[Dict[str, int], int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+    cumulative = {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, _, module = match.groups()
+        cumulative[module] = int(cumulative_us)
+        total_us += int(self_us)
+
+    return cumulative, total_us
+
+
+def heavy_imports(modules: Dict[str, int]) -> List[str]:
+    return sorted(
+        module for module in modules
+        if module.split(".")[0] in HEAVY_MODULES
+    )
+
+
+def main():
+    for name, args in SCENARIOS.items():
+        modules, total_us = measure_imports(args)
+        print(f"== {name}: {total_us / 1000:.1f} ms, {len(modules)} modules")
+
+        top_level = sorted(
+            ((us, module) for module, us in modules.items() if "." not in module),
+            reverse=True,
+        )
+        for us, module in top_level[:10]:
+            print(f"   {us / 1000:8.1f} ms  {module}")
+
+        heavy = heavy_imports(modules)
+        if heavy:
+            print(f"   heavy modules loaded: {', '.join(heavy)}")
+
+
+if __name__ == "__main__":
+    main()
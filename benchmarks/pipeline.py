@@ -0,0 +1,205 @@
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_FILE = Path(__file__).resolve().parent / "pipeline_baseline.json"
+
+SAMPLE_RATE = 16000
+
+SCENARIOS = {
+    "10m": 600,
+    "1h": 3600,
+    "4h": 14400,
+}
+
+# A stage slower than baseline by more than this fraction is flagged;
+# differences under MIN_REGRESSION_SEC are timer noise on short stages.
+REGRESSION_TOLERANCE = 0.2
+MIN_REGRESSION_SEC = 0.05
+
+
+def synthetic_audio(path: Path, duration_sec: float, seed: int = 0) -> np.ndarray:
+    # Speech-like bursts: a few harmonics under a ~4 Hz syllable envelope,
+    # 2-20 s talk spurts separated by short pauses and occasional long
+    # silences. Written straight to a memory-mapped .npy in chunks so even
+    # the 4 h input never sits in memory at once.
+    rng = np.random.default_rng(seed)
+    total = int(duration_sec * SAMPLE_RATE)
+    samples = np.lib.format.open_memmap(str(path), mode="w+", dtype=np.int16, shape=(total,))
+    samples[:] = 0
+
+    position = int(rng.uniform(0.5, 2.0) * SAMPLE_RATE)
+    while position < total:
+        length = min(int(rng.uniform(2.0, 20.0) * SAMPLE_RATE), total - position)
+        t = np.arange(length) / SAMPLE_RATE
+        pitch = rng.uniform(100, 220)
+        voice = sum(np.sin(2 * np.pi * pitch * k * t) / k for k in (1, 2, 3))
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * rng.uniform(3, 5) * t) ** 2
+        noise = rng.normal(0, 0.05, length)
+        samples[position:position + length] = ((voice * envelope + noise) * 6000).astype(np.int16)
+
+        pause = rng.uniform(5.0, 10.0) if rng.random() < 0.1 else rng.uniform(0.3, 4.0)
+        position += length + int(pause * SAMPLE_RATE)
+
+    samples.flush()
+    return samples
+
+
+class EnergyVADModel:
+    # Stand-in for Silero: speech probability from frame RMS.
+    def __call__(self, frame: np.ndarray) -> float:
+        rms = float(np.sqrt(np.mean(frame * frame)))
+        return min(1.0, rms * 20)
+
+    def reset_states(self):
+        pass
+
+
+class NpyConverter:
+    # Stands in for the ffmpeg decode: the input is generated already decoded.
+    def __init__(self, path: Path):
+        self.path = path
+
+    def decode_pcm(self):
+        from app.core.audio import AudioBuffer
+
+        return AudioBuffer.from_npy(self.path, SAMPLE_RATE)
+
+
+def run_scenario(input_file: Path) -> Dict:
+    from app.core.config import Config
+    from app.core.pipeline import DictationPipeline
+    from app.core.vad import VADSegmenter
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench-"))
+    try:
+        config = Config(
+            input_file=input_file,
+            output_dir=work_dir / "output",
+            temp_dir=work_dir / "temp",
+            use_cache=False,
+            use_workspace=False,
+            asr_backend="fake",
+        )
+        pipeline = DictationPipeline(config, vad_segmenter=VADSegmenter(config, model=EnergyVADModel()))
+        pipeline.audio_converter = NpyConverter(input_file)
+        pipeline.progress_callback = lambda current, total, message: None
+
+        if not pipeline.run():
+            raise RuntimeError(f"Pipeline failed on {input_file}")
+
+        # Stage times and peak RSS come from the run's own metrics, as they
+        # would for a real meeting.
+        metrics = json.loads((config.output_dir / "run_metrics.json").read_text())
+        stages = metrics["stages"]
+        audio_sec = metrics["gauges"]["audio_seconds"]
+        total = sum(stages.values())
+        return {
+            "audio_sec": audio_sec,
+            "stages": {name: round(sec, 3) for name, sec in stages.items()},
+            "total_sec": round(total, 3),
+            "rtf": round(total / audio_sec, 6),
+            "windows": int(metrics["gauges"]["vad_windows"]),
+            "segments": int(metrics["counters"]["transcript_segments"]),
+            "peak_rss_mb": round(metrics["gauges"]["peak_rss_mb"], 1),
+        }
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def run_isolated(input_file: Path) -> Dict:
+    # The pipeline runs in a fresh process that never held the generator's
+    # buffers: peak RSS is a per-process high-water mark.
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.pipeline", "--child", str(input_file)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def run_benchmark(name: str) -> Dict:
+    data_dir = Path(tempfile.mkdtemp(prefix="bench-audio-"))
+    try:
+        input_file = data_dir / f"{name}.npy"
+        start = time.perf_counter()
+        synthetic_audio(input_file, SCENARIOS[name])
+        generate_sec = time.perf_counter() - start
+
+        result = run_isolated(input_file)
+        result["generate_sec"] = round(generate_sec, 3)
+        return result
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+def compare(name: str, result: Dict, baseline: Dict) -> List[str]:
+    base = baseline.get(name)
+    if not base:
+        return []
+
+    regressions = []
+    checks = [
+        (f"stage {stage}", sec, base["stages"].get(stage), MIN_REGRESSION_SEC)
+        for stage, sec in result["stages"].items()
+    ]
+    checks.append(("peak RSS", result["peak_rss_mb"], base.get("peak_rss_mb"), 0))
+    for label, value, reference, noise in checks:
+        if reference and value > reference * (1 + REGRESSION_TOLERANCE) and value - reference > noise:
+            regressions.append(f"{label}: {value} vs baseline {reference}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end pipeline benchmark (synthetic audio, fake ASR backend)")
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=list(SCENARIOS),
+        default=list(SCENARIOS),
+        help="Input lengths to run (default: all)",
+    )
+    parser.add_argument("--update-baseline", action="store_true", help=f"Store results in {BASELINE_FILE.name}")
+    parser.add_argument("--child", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_scenario(args.child)))
+        return
+
+    baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    results = {}
+    failed = False
+
+    for name in args.scenarios:
+        result = results[name] = run_benchmark(name)
+        stages = ", ".join(f"{stage} {sec:.2f}s" for stage, sec in result["stages"].items())
+        print(f"== {name}: RTF {result['rtf']:.4f}, peak RSS {result['peak_rss_mb']:.0f} MB")
+        print(f"   {stages}")
+        print(f"   {result['windows']} windows, {result['segments']} segments")
+
+        for regression in compare(name, result, baseline):
+            print(f"   REGRESSION {regression}")
+            failed = True
+
+    if args.update_baseline:
+        baseline.update(results)
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"Baseline written to {BASELINE_FILE}")
+    elif failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import argparse
+import random
+import re
+import string
+import time
+from typing import Dict, List
+
+from app.core.terms import TermNormalizer
+
+FILLER = ["검사", "결과", "확인", "했습니다", "그리고", "다음", "주", "장비", "샘플", "보고"]
+
+
+def synthetic_terms(count: int, seed: int = 0) -> Dict[str, str]:
+    rng = random.Random(seed)
+    terms = {}
+    while len(terms) < count:
+        length = rng.randint(2, 8)
+        word = "".join(rng.choice(string.ascii_lowercase + string.digits) for _ in range(length))
+        if rng.random() < 0.2:
+            word += "-" + "".join(rng.choice(string.ascii_lowercase) for _ in range(3))
+        terms[word] = word.upper()
+    return terms
+
+
+def synthetic_segments(terms: Dict[str, str], count: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    variants = list(terms)
+    segments = []
+    for _ in range(count):
+        words = [rng.choice(FILLER) for _ in range(rng.randint(8, 20))]
+        for _ in range(rng.randint(0, 3)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(variants))
+        segments.append(" ".join(words))
+    return segments
+
+
+def naive_normalize(text: str, terms: Dict[str, str]) -> str:
+    # The previous implementation: one re.sub per term per segment.
+    for term, normalized in terms.items():
+        pattern = r'\b' + re.escape(term) + r'\b'
+        text = re.sub(pattern, normalized, text, flags=re.IGNORECASE)
+    return text
+
+
+def run(term_count: int, segment_count: int, naive_limit: int) -> Dict[str, float]:
+    terms = synthetic_terms(term_count)
+    segments = synthetic_segments(terms, segment_count)
+
+    start = time.perf_counter()
+    normalizer = TermNormalizer(terms)
+    compile_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = [normalizer.normalize(text) for text in segments]
+    compiled_sec = time.perf_counter() - start
+
+    # The naive loop is too slow for the full set; time a sample and scale.
+    sample = segments[:naive_limit]
+    start = time.perf_counter()
+    naive = [naive_normalize(text, terms) for text in sample]
+    naive_sec = (time.perf_counter() - start) * len(segments) / max(1, len(sample))
+
+    if naive != compiled[:len(sample)]:
+        raise AssertionError("compiled normalizer output differs from the naive loop")
+
+    return {
+        "compile_sec": compile_sec,
+        "compiled_sec": compiled_sec,
+        "naive_sec": naive_sec,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Term normalizer microbenchmark")
+    parser.add_argument("--terms", type=int, default=5000, help="Dictionary size (default: 5000)")
+    parser.add_argument("--segments", type=int, default=10000, help="Transcript segments (default: 10000)")
+    parser.add_argument(
+        "--naive-limit",
+        type=int,
+        default=20,
+        help="Segments timed with the naive loop, extrapolated to the full set (default: 20)",
+    )
+    args = parser.parse_args()
+
+    result = run(args.terms, args.segments, args.naive_limit)
+    print(f"== {args.terms} terms, {args.segments} segments")
+    print(f"   compile:        {result['compile_sec'] * 1000:8.1f} ms")
+    print(f"   compiled scan:  {result['compiled_sec'] * 1000:8.1f} ms")
+    print(f"   naive (est.):   {result['naive_sec'] * 1000:8.1f} ms")
+    print(f"   speedup:        {result['naive_sec'] / result['compiled_sec']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
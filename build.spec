@@ -8,6 +8,7 @@ a = Analysis(
     binaries=[],
     datas=[
         ('app', 'app'),
+        ('app/resources/silero_vad.onnx', 'app/resources'),
     ],
     hiddenimports=[
         'PySide6.QtCore',
@@ -17,6 +18,7 @@ a = Analysis(
         'torchvision',
         'torchaudio',
         'faster_whisper',
+        'onnxruntime',
         'numpy',
         'scipy',
         'pydub',
@@ -1,16 +1,10 @@
 import logging
 import sys
-import argparse
 import time
+import argparse
 from pathlib import Path
 
-from app.core.config import Config
-from app.core.audio import AudioConverter
-from app.core.vad import VADSegmenter
-from app.core.asr import ASREngine
-from app.core.postprocess import PostProcessor
-from app.core.minutes import MinutesGenerator
-from app.core.io import CheckpointManager
+from app.core.config import Config, DEFAULT_FORMATS, OUTPUT_FORMATS
 
 logging.basicConfig(
     level=logging.INFO,
@@ -23,185 +17,276 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-class DictationPipeline:
-    def __init__(self, config: Config):
-        self.config = config
-        self.audio_converter = AudioConverter(config)
-        self.vad_segmenter = VADSegmenter(config)
-        self.asr_engine = ASREngine(config)
-        self.post_processor = PostProcessor(config)
-        self.minutes_generator = MinutesGenerator(config)
-        self.checkpoint_manager = CheckpointManager(config.checkpoint_file)
-
-    def progress_callback(self, current: int, total: int, message: str):
-        progress = (current / total) * 100
-        logger.info(f"[{progress:.1f}%] {message}")
-
-    def run(self) -> bool:
-        start_time = time.time()
-        logger.info("=" * 50)
-        logger.info("Starting dictation pipeline")
-        logger.info("=" * 50)
-
-        try:
-            wav_path = self._convert_audio()
-            segments = self._segment_audio(wav_path)
-            transcribed = self._transcribe_segments(wav_path, segments)
-            self._post_process_and_export(transcribed)
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Offline MP3 Dictation & Meeting Minutes Generator"
+    )
 
-            elapsed = time.time() - start_time
-            logger.info("=" * 50)
-            logger.info(f"Pipeline completed in {elapsed:.1f} seconds")
-            logger.info("=" * 50)
+    parser.add_argument(
+        "--input",
+        type=str,
+        help="Input MP3 file path (required unless --serve, --input-dir or --manifest)"
+    )
 
-            self.checkpoint_manager.delete()
-            return True
+    parser.add_argument(
+        "--input-dir",
+        type=str,
+        help="Process every MP3 in this directory with one model load"
+    )
 
-        except Exception as e:
-            logger.error(f"Pipeline failed: {e}", exc_info=True)
-            return False
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        help="Process the MP3 files listed in this text file (one path per line)"
+    )
 
-    def _convert_audio(self) -> Path:
-        logger.info("Step 1/4: Converting MP3 to WAV")
-        wav_path = self.audio_converter.convert_mp3_to_wav()
+    parser.add_argument(
+        "--output",
+        type=str,
+        default="output",
+        help="Output directory (default: output)"
+    )
 
-        duration = self.audio_converter.get_audio_duration(wav_path)
-        logger.info(f"Audio duration: {duration / 60:.1f} minutes")
+    parser.add_argument(
+        "--model",
+        type=str,
+        default="large-v3",
+        choices=["large-v3", "large-v2", "medium", "small", "base"],
+        help="Whisper model size (default: large-v3)"
+    )
 
-        return wav_path
+    parser.add_argument(
+        "--asr-backend",
+        type=str,
+        default="faster-whisper",
+        choices=["faster-whisper", "fake"],
+        help="ASR runtime; fake is a deterministic stand-in without model weights for throughput tests (default: faster-whisper)"
+    )
 
-    def _segment_audio(self, wav_path: Path) -> list:
-        logger.info("Step 2/4: VAD segmentation")
-        segments = self.vad_segmenter.segment_audio(wav_path)
+    parser.add_argument(
+        "--adaptive-decoding",
+        action="store_true",
+        help="Decode greedily first and use beam search with temperature fallback only for windows that fail the thresholds below"
+    )
 
-        logger.info(f"Found {len(segments)} speech segments")
+    parser.add_argument(
+        "--fallback-min-logprob",
+        type=float,
+        default=-1.0,
+        help="Adaptive decoding: retry a window whose avg_logprob is below this (default: -1.0)"
+    )
 
-        total_speech = sum(end - start for start, end in segments)
-        logger.info(f"Total speech duration: {total_speech / 60:.1f} minutes")
+    parser.add_argument(
+        "--fallback-max-compression",
+        type=float,
+        default=2.4,
+        help="Adaptive decoding: retry a window whose compression ratio is above this (default: 2.4)"
+    )
 
-        segments_dict = self.vad_segmenter.segments_to_dict(segments)
+    parser.add_argument(
+        "--fallback-no-speech-prob",
+        type=float,
+        default=0.6,
+        help="Adaptive decoding: a low avg_logprob is accepted as silence above this no_speech_prob (default: 0.6)"
+    )
 
-        return segments_dict
+    parser.add_argument(
+        "--draft-model",
+        type=str,
+        default=None,
+        choices=["large-v2", "medium", "small", "base"],
+        help="Transcribe with this fast model first and re-decode only low-confidence windows with --model"
+    )
 
-    def _transcribe_segments(
-        self,
-        wav_path: Path,
-        segments: list,
-    ) -> list:
-        logger.info("Step 3/4: Speech-to-Text")
+    parser.add_argument(
+        "--cascade-min-word-prob",
+        type=float,
+        default=0.5,
+        help="Re-decode a draft window whose mean word probability is below this (default: 0.5)"
+    )
 
-        checkpoint_data = self.checkpoint_manager.load_segments()
+    parser.add_argument(
+        "--cascade-min-logprob",
+        type=float,
+        default=-1.0,
+        help="Re-decode a draft window whose avg_logprob is below this (default: -1.0)"
+    )
 
-        done_segments = []
-        transcribed = []
+    parser.add_argument(
+        "--cascade-max-compression",
+        type=float,
+        default=2.4,
+        help="Re-decode a draft window whose compression ratio is above this (default: 2.4)"
+    )
 
-        if checkpoint_data:
-            done_segments = checkpoint_data.get("done_segments", [])
-            transcribed = checkpoint_data.get("transcribed", [])
-            logger.info(f"Resuming from checkpoint: {len(done_segments)}/{len(segments)} segments done")
+    parser.add_argument(
+        "--compute-type",
+        type=str,
+        default="int8_float16",
+        choices=["int8_float16", "float16", "float32", "int8"],
+        help="Compute type for Whisper model (default: int8_float16)"
+    )
 
-        total_segments = len(segments)
+    parser.add_argument(
+        "--language",
+        type=str,
+        default="ko",
+        help="Language code (default: ko)"
+    )
 
-        for idx, segment in enumerate(segments):
-            if idx in done_segments:
-                continue
+    parser.add_argument(
+        "--device",
+        type=str,
+        default="cuda",
+        choices=["cuda", "cpu"],
+        help="Device to use (default: cuda)"
+    )
 
-            self.progress_callback(
-                idx,
-                total_segments,
-                f"Transcribing segment {idx + 1}/{total_segments}"
-            )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of ASR worker processes, each with its own model (default: 1)"
+    )
 
-            results = self.asr_engine.transcribe_segment(
-                wav_path,
-                segment["start"],
-                segment["end"],
-                offset_sec=segment["start"],
-            )
+    parser.add_argument(
+        "--cpu-threads",
+        type=int,
+        default=0,
+        help="Total CPU threads for ASR, split across workers (default: 0 = all cores)"
+    )
 
-            transcribed.extend(results)
-            done_segments.append(idx)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Segments decoded together per batch; 1 disables batching (default: 1)"
+    )
 
-            if idx % 5 == 0 or idx == total_segments - 1:
-                self.checkpoint_manager.save_segments(done_segments, transcribed)
+    parser.add_argument(
+        "--decode-mode",
+        type=str,
+        default="memory",
+        choices=["memory", "wav"],
+        help="Decode into memory or via a temporary WAV file (default: memory)"
+    )
 
-        return transcribed
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Overlap decoding, VAD and ASR instead of running them one after another "
+             "(single --input only; rejected with --input-dir/--manifest)"
+    )
 
-    def _post_process_and_export(self, transcribed: list):
-        logger.info("Step 4/4: Post-processing and export")
+    parser.add_argument(
+        "--vad-backend",
+        type=str,
+        default="torch",
+        choices=["torch", "onnx"],
+        help="Silero VAD runtime (default: torch)"
+    )
 
-        merged = self.post_processor.merge_segments(transcribed)
+    parser.add_argument(
+        "--vad-model",
+        type=str,
+        default=None,
+        help="Silero VAD ONNX model file for --vad-backend onnx (default: app/resources/silero_vad.onnx)"
+    )
 
-        json_path = self.config.output_dir / "transcript.json"
-        self.post_processor.export_json(merged, json_path)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the on-disk ASR result cache"
+    )
 
-        md_path = self.config.output_dir / "transcript.md"
-        self.post_processor.export_markdown(merged, md_path)
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default="cache/asr",
+        help="ASR result cache directory (default: cache/asr)"
+    )
 
-        srt_path = self.config.output_dir / "transcript.srt"
-        self.post_processor.export_srt(merged, srt_path)
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=1024,
+        help="ASR cache size limit in MB, least recently used entries are evicted (default: 1024)"
+    )
 
-        minutes_path = self.config.output_dir / "minutes.md"
-        self.minutes_generator.generate_minutes(merged, minutes_path)
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        choices=OUTPUT_FORMATS,
+        default=None,
+        help="Outputs to write (default: json md srt minutes). "
+             "Word timestamps are only computed when json or jsonl is requested"
+    )
 
-        logger.info(f"Output files saved to: {self.config.output_dir}")
+    parser.add_argument(
+        "--defer-words",
+        action="store_true",
+        help="Skip word timestamps during the run; align segments later with --align-words or the server. "
+             "Needs json in --formats"
+    )
 
+    parser.add_argument(
+        "--align-words",
+        type=int,
+        nargs="+",
+        default=None,
+        metavar="N",
+        help="Print word timestamps for these segments of a finished --input/--output run and exit"
+    )
 
-def parse_args():
-    parser = argparse.ArgumentParser(
-        description="Offline MP3 Dictation & Meeting Minutes Generator"
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Also write transcript.jsonl, one segment per line, as segments are transcribed"
     )
 
     parser.add_argument(
-        "--input",
-        type=str,
-        required=True,
-        help="Input MP3 file path"
+        "--compact-json",
+        action="store_true",
+        help="Write transcript.json without indentation"
     )
 
     parser.add_argument(
-        "--output",
+        "--metrics-textfile",
         type=str,
-        default="output",
-        help="Output directory (default: output)"
+        default=None,
+        help="Also write run metrics in Prometheus text format to this file (node_exporter textfile collector)"
     )
 
     parser.add_argument(
-        "--model",
-        type=str,
-        default="large-v3",
-        choices=["large-v3", "large-v2", "medium", "small", "base"],
-        help="Whisper model size (default: large-v3)"
+        "--no-workspace",
+        action="store_true",
+        help="Do not keep decoded audio, VAD segments and ASR results for re-runs"
     )
 
     parser.add_argument(
-        "--compute-type",
+        "--workspace-dir",
         type=str,
-        default="int8_float16",
-        choices=["int8_float16", "float16", "float32", "int8"],
-        help="Compute type for Whisper model (default: int8_float16)"
+        default="temp/workspace",
+        help="Per-input stage artifact directory (default: temp/workspace)"
     )
 
     parser.add_argument(
-        "--language",
-        type=str,
-        default="ko",
-        help="Language code (default: ko)"
+        "--workspace-keep",
+        type=int,
+        default=5,
+        help="Number of most recently used input workspaces to keep (default: 5)"
     )
 
     parser.add_argument(
-        "--device",
+        "--terms",
         type=str,
-        default="cuda",
-        choices=["cuda", "cpu"],
-        help="Device to use (default: cuda)"
+        help="Term dictionary for transcript normalization (default: app/resources/terms.tsv)"
     )
 
     parser.add_argument(
-        "--workers",
-        type=int,
-        default=1,
-        help="Number of workers (default: 1)"
+        "--minutes-rules",
+        type=str,
+        help="YAML rule pack for minutes classification (default: app/resources/minutes_rules.yaml)"
     )
 
     parser.add_argument(
@@ -234,27 +319,272 @@ def parse_args():
         help="Project name (optional)"
     )
 
-    return parser.parse_args()
+    server = parser.add_argument_group("resident server")
+
+    server.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run a local transcription server that keeps models loaded between jobs"
+    )
+
+    server.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help="Server bind address (default: 127.0.0.1)"
+    )
+
+    server.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        help="Server port (default: 8765)"
+    )
+
+    server.add_argument(
+        "--server-jobs",
+        type=int,
+        default=1,
+        help="Jobs the server runs concurrently (default: 1)"
+    )
+
+    server.add_argument(
+        "--server-url",
+        type=str,
+        help="Submit the job to a running server instead of processing locally"
+    )
+
+    server.add_argument(
+        "--priority",
+        type=int,
+        default=0,
+        help="Job priority for --server-url, higher runs first (default: 0)"
+    )
+
+    server.add_argument(
+        "--no-wait",
+        action="store_true",
+        help="With --server-url, return after submitting instead of waiting"
+    )
+
+    archive = parser.add_argument_group("transcript archive")
+
+    archive.add_argument(
+        "--archive",
+        type=str,
+        help="SQLite archive database; finished runs are added to it"
+    )
+
+    archive.add_argument(
+        "--archive-add",
+        type=str,
+        nargs="+",
+        metavar="OUTPUT_DIR",
+        help="Add existing output folders (transcript.json, minutes.md) to --archive and exit"
+    )
+
+    archive.add_argument(
+        "--search",
+        type=str,
+        help="Search the --archive for a phrase and print meetings and timestamps "
+             "(terms of 2+ characters use the index; single characters scan)"
+    )
+
+    archive.add_argument(
+        "--search-limit",
+        type=int,
+        default=20,
+        help="Maximum search hits (default: 20)"
+    )
+
+    args = parser.parse_args()
+    archive_only = args.archive_add or args.search
+    if archive_only and not args.archive:
+        parser.error("--archive-add and --search need --archive")
+    sources = [args.input, args.input_dir, args.manifest]
+    if sum(source is not None for source in sources) > 1:
+        parser.error("--input, --input-dir and --manifest are mutually exclusive")
+    if not args.serve and not archive_only and not any(sources):
+        parser.error("one of --input, --input-dir or --manifest is required")
+    if args.streaming and (args.input_dir or args.manifest):
+        parser.error("--streaming works on a single --input, not with --input-dir or --manifest")
+    if args.server_url and not args.input:
+        parser.error("--server-url submits a single --input")
+    if args.defer_words and args.formats and "json" not in args.formats:
+        parser.error("--defer-words needs json in --formats")
+    if args.align_words and not args.input:
+        parser.error("--align-words needs the --input and --output of the run")
+
+    return args
+
+
+def run_archive(args) -> bool:
+    from app.core.archive import TranscriptArchive
+    from app.core.export import format_timestamp
+
+    archive = TranscriptArchive(args.archive)
+    try:
+        for output_dir in args.archive_add or []:
+            try:
+                archive.add_output_dir(output_dir)
+            except (OSError, ValueError) as e:
+                logger.error(f"Cannot add {output_dir}: {e}")
+                return False
+
+        if args.search:
+            start = time.perf_counter()
+            hits = archive.search(args.search, limit=args.search_limit)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            for hit in hits:
+                title = hit.title or Path(hit.output_dir).name
+                date = f" ({hit.date})" if hit.date else ""
+                print(f"{title}{date} [{format_timestamp(hit.start)}] {hit.text}")
+                print(f"    {hit.output_dir}")
+            print(f"{len(hits)} hits in {elapsed_ms:.1f} ms")
+    finally:
+        archive.close()
+
+    return True
+
+
+def align_words(config: Config, indices) -> bool:
+    import json
+    from app.core.alignment import WordAligner
+
+    aligner = WordAligner(config)
+    try:
+        aligned = aligner.align(indices)
+    except (OSError, IndexError, KeyError, ValueError) as e:
+        logger.error(f"Cannot align words: {e}")
+        return False
+
+    for idx in indices:
+        print(json.dumps({"segment": idx, "words": aligned[idx]}, ensure_ascii=False))
+    return True
+
+
+def submit_to_server(args) -> bool:
+    from app.server import TranscriptionClient
+
+    client = TranscriptionClient(args.server_url)
+    job = client.submit({
+        # The server may run from another directory
+        "input": str(Path(args.input).resolve()),
+        "output": str(Path(args.output).resolve()),
+        "prompt": args.prompt,
+        "meeting_title": args.meeting_title,
+        "meeting_date": args.meeting_date,
+        "attendees": args.attendees,
+        "project": args.project,
+        "formats": args.formats,
+        "priority": args.priority,
+    })
+    logger.info(f"Submitted job {job['job_id']} to {args.server_url}")
+
+    if args.no_wait:
+        return True
+
+    job = client.wait(job["job_id"])
+    if job["status"] != "done":
+        logger.error(f"Job {job['job_id']} failed: {job['error']}")
+        return False
+
+    for output in job["outputs"]:
+        logger.info(f"Output: {output}")
+    return True
 
 
 def main():
     args = parse_args()
 
+    if args.archive_add or args.search:
+        sys.exit(0 if run_archive(args) else 1)
+
+    if args.server_url:
+        try:
+            success = submit_to_server(args)
+        except RuntimeError as e:
+            logger.error(str(e))
+            success = False
+        sys.exit(0 if success else 1)
+
     config = Config(
-        input_file=args.input,
+        input_file=args.input or "",
         output_dir=args.output,
         model_name=args.model,
+        asr_backend=args.asr_backend,
+        adaptive_decoding=args.adaptive_decoding,
+        fallback_min_logprob=args.fallback_min_logprob,
+        fallback_max_compression=args.fallback_max_compression,
+        fallback_no_speech_prob=args.fallback_no_speech_prob,
+        draft_model=args.draft_model,
+        cascade_min_word_prob=args.cascade_min_word_prob,
+        cascade_min_logprob=args.cascade_min_logprob,
+        cascade_max_compression=args.cascade_max_compression,
         compute_type=args.compute_type,
         language=args.language,
         device=args.device,
         num_workers=args.workers,
+        cpu_threads=args.cpu_threads,
+        batch_size=args.batch_size,
+        decode_mode=args.decode_mode,
+        streaming=args.streaming,
+        vad_backend=args.vad_backend,
+        vad_model_path=args.vad_model,
+        use_cache=not args.no_cache,
+        cache_dir=args.cache_dir,
+        cache_max_mb=args.cache_max_mb,
+        formats=args.formats or list(DEFAULT_FORMATS),
+        defer_word_alignment=args.defer_words,
+        export_jsonl=args.jsonl,
+        compact_json=args.compact_json,
+        archive_db=args.archive,
+        metrics_textfile=args.metrics_textfile,
+        use_workspace=not args.no_workspace,
+        workspace_dir=args.workspace_dir,
+        workspace_keep=args.workspace_keep,
         initial_prompt=args.prompt,
+        terms_file=args.terms,
+        minutes_rules_file=args.minutes_rules,
         meeting_title=args.meeting_title,
         meeting_date=args.meeting_date,
         attendees=args.attendees,
         project_name=args.project,
     )
 
+    if args.align_words:
+        sys.exit(0 if align_words(config, args.align_words) else 1)
+
+    if args.serve:
+        from app.server import TranscriptionServer
+
+        TranscriptionServer(
+            config,
+            host=args.host,
+            port=args.port,
+            max_concurrent_jobs=args.server_jobs,
+        ).serve_forever()
+        return
+
+    if args.input_dir or args.manifest:
+        from app.batch import BatchRunner, collect_inputs
+
+        inputs = collect_inputs(
+            input_dir=Path(args.input_dir) if args.input_dir else None,
+            manifest=Path(args.manifest) if args.manifest else None,
+        )
+        if not inputs:
+            logger.error("No input files found")
+            sys.exit(1)
+
+        success = BatchRunner(config, inputs).run()
+        sys.exit(0 if success else 1)
+
+    # Imported here so --help and argument errors never load numpy or the
+    # model runtimes.
+    from app.core.pipeline import DictationPipeline
+
     pipeline = DictationPipeline(config)
     success = pipeline.run()
 
@@ -0,0 +1,96 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from app.core.asr import ASREngine, FALLBACK_TEMPERATURES
+from app.core.asr_backends import FakeASRBackend
+from app.core.audio import AudioBuffer
+from app.core.config import Config
+from app.core.metrics import RunMetrics
+
+
+class RecordingBackend(FakeASRBackend):
+    def __init__(self, config: Config, **kwargs):
+        super().__init__(config, **kwargs)
+        self.requests = []
+        self.sequential = 0
+
+    def transcribe(self, samples, **options):
+        self.sequential += 1
+        return super().transcribe(samples, **options)
+
+    def transcribe_batch(self, clips, **options):
+        self.requests.append((len(clips), options))
+        return super().transcribe_batch(clips, **options)
+
+
+class TestAdaptiveDecoding(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.config = Config(
+            input_file="dummy.mp3",
+            output_dir=self.test_dir,
+            temp_dir=self.test_dir / "temp",
+            adaptive_decoding=True,
+        )
+        rng = np.random.default_rng(0)
+        self.audio = AudioBuffer(rng.integers(-8000, 8000, 16000 * 120, dtype=np.int16), 16000)
+        self.segments = [(i, {"start": i * 6.0, "end": i * 6.0 + 5.0}) for i in range(20)]
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_fallback_reason(self):
+        engine = ASREngine(self.config, backend=FakeASRBackend(self.config))
+
+        self.assertIsNone(engine.fallback_reason([{"avg_logprob": -0.3, "compression_ratio": 1.5}]))
+        self.assertEqual(engine.fallback_reason([{"avg_logprob": -0.3, "compression_ratio": 3.0}]), "compression")
+        self.assertEqual(engine.fallback_reason([{"avg_logprob": -1.5, "no_speech_prob": 0.1}]), "logprob")
+        self.assertIsNone(engine.fallback_reason([{"avg_logprob": -1.5, "no_speech_prob": 0.9}]))
+        self.assertIsNone(engine.fallback_reason([]))
+
+    def test_only_failing_windows_use_beam_search(self):
+        config = self.config.derive(batch_size=4)
+        backend = RecordingBackend(config, hard_fraction=0.3)
+        engine = ASREngine(config, backend=backend)
+        metrics = RunMetrics()
+
+        with metrics.activate():
+            results = dict(engine.iter_transcribe(self.audio, self.segments))
+
+        self.assertEqual(len(results), 20)
+        greedy = [(n, options) for n, options in backend.requests if options["beam_size"] == 1]
+        beam = [(n, options) for n, options in backend.requests if options["beam_size"] == 5]
+        self.assertEqual(sum(n for n, _ in greedy), 20)
+        retried = sum(n for n, _ in beam)
+        self.assertTrue(0 < retried < 20)
+        self.assertEqual(beam[0][1]["temperature"], FALLBACK_TEMPERATURES)
+        # The temperature fallback needs the sequential decoder.
+        self.assertTrue(all(n == 1 for n, _ in beam))
+        self.assertEqual(backend.sequential, retried)
+        self.assertEqual(metrics.counters["decode_windows"], 20)
+        self.assertEqual(metrics.counters["decode_fallback_logprob"], retried)
+
+    def test_sequential_path(self):
+        backend = RecordingBackend(self.config)
+        engine = ASREngine(self.config, backend=backend)
+
+        engine.transcribe_segment(self.audio, 0.0, 5.0)
+
+        self.assertEqual(backend.requests, [(1, {"beam_size": 1, "temperature": 0.0})])
+
+    def test_disabled_keeps_configured_decoding(self):
+        config = self.config.derive(adaptive_decoding=False)
+        backend = RecordingBackend(config, hard_fraction=1.0)
+
+        ASREngine(config, backend=backend).transcribe_segment(self.audio, 0.0, 5.0)
+
+        self.assertEqual(backend.requests, [(1, {})])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+from app.core.archive import TranscriptArchive
+from app.core.config import Config
+from app.core.postprocess import PostProcessor
+from app.core.transcript import Transcript
+
+
+class TestTranscriptArchive(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.archive = TranscriptArchive(self.test_dir / "archive.db")
+        self.segments = [
+            {"start": 95.0, "end": 99.0, "text": "FHIR 방식으로 결정했습니다.", "words": []},
+            {"start": 120.0, "end": 125.0, "text": "다음 주까지 인터페이스 명세를 공유해주세요.", "words": []},
+        ]
+
+    def tearDown(self):
+        self.archive.close()
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_search_korean_substring(self):
+        self.archive.add_meeting(self.test_dir / "m1", {"title": "주간 회의", "date": "2026-10-01"}, self.segments)
+
+        hits = self.archive.search("결정했")
+
+        self.assertEqual(len(hits), 1)
+        self.assertEqual(hits[0].title, "주간 회의")
+        self.assertEqual(hits[0].start, 95.0)
+
+    def test_short_and_multi_term_queries(self):
+        self.archive.add_meeting(self.test_dir / "m1", {}, self.segments)
+
+        self.assertEqual([hit.start for hit in self.archive.search("명세")], [120.0])
+        self.assertEqual([hit.start for hit in self.archive.search("fhir 방식으로")], [95.0])
+        self.assertEqual(self.archive.search("FHIR 명세"), [])
+        self.assertEqual(self.archive.search('"OR'), [])
+
+    def _scan(self, query: str):
+        # The unindexed LIKE path, run for every term.
+        terms = query.split()
+        where = " AND ".join("s.text LIKE ?" for _ in terms)
+        rows = self.archive.conn.execute(
+            f"SELECT s.meeting_id, s.start FROM segments s WHERE {where}",
+            ["%" + term + "%" for term in terms],
+        )
+        return sorted(rows)
+
+    def test_indexed_paths_match_scan(self):
+        self.archive.add_meeting(self.test_dir / "m1", {"date": "2026-10-01"}, self.segments)
+        self.archive.add_meeting(self.test_dir / "m2", {"date": "2026-10-08"}, [
+            {"start": 10.0, "end": 14.0, "text": "EMR 일정 검토, 명세는 다음 주에", "words": []},
+            {"start": 20.0, "end": 22.0, "text": "일정", "words": []},
+            {"start": 30.0, "end": 35.0, "text": "emr 인터페이스 결정", "words": []},
+        ])
+
+        queries = ["명세", "일정", "em", "EMR", "결정했", "결정", "주 명세", "일정 검토", "주", "R", "fhir 방식으로", "FHIR 명세"]
+        for query in queries:
+            hits = sorted((hit.meeting_id, hit.start) for hit in self.archive.search(query))
+            self.assertEqual(hits, self._scan(query), query)
+
+    def test_two_character_terms_use_index(self):
+        plan = self.archive.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT segment_id FROM segment_bigrams WHERE bigram = ?", ("명세",)
+        ).fetchall()
+
+        self.assertIn("USING PRIMARY KEY", " ".join(row[-1] for row in plan))
+
+    def test_bigrams_backfilled_for_old_archives(self):
+        self.archive.add_meeting(self.test_dir / "m1", {}, self.segments)
+        with self.archive.conn:
+            self.archive.conn.execute("DELETE FROM segment_bigrams")
+        self.archive.close()
+
+        self.archive = TranscriptArchive(self.test_dir / "archive.db")
+
+        self.assertEqual([hit.start for hit in self.archive.search("명세")], [120.0])
+
+    def test_re_adding_replaces_meeting(self):
+        output_dir = self.test_dir / "m1"
+        self.archive.add_meeting(output_dir, {}, self.segments)
+        self.archive.add_meeting(output_dir, {}, self.segments[:1])
+
+        self.assertEqual(self.archive.stats(), {"meetings": 1, "segments": 1})
+        self.assertEqual(self.archive.search("인터페이스"), [])
+        self.assertEqual(self.archive.search("명세"), [])
+
+    def test_add_output_dir(self):
+        output_dir = self.test_dir / "out"
+        config = Config(
+            input_file="dummy.mp3",
+            output_dir=str(output_dir),
+            temp_dir=str(self.test_dir / "temp"),
+            meeting_title="설계 회의",
+        )
+        PostProcessor(config).export_json(self.segments, output_dir / "transcript.json")
+
+        self.archive.add_output_dir(output_dir)
+
+        hits = self.archive.search("인터페이스")
+        self.assertEqual(hits[0].title, "설계 회의")
+        self.assertEqual(hits[0].output_dir, str(output_dir.resolve()))
+
+    def test_add_transcript(self):
+        self.archive.add_meeting(self.test_dir / "m1", {}, Transcript.from_dicts(self.segments))
+
+        self.assertEqual(self.archive.stats()["segments"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import tempfile
+import shutil
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.core.asr import ASREngine
+from app.core.asr_backends import FakeASRBackend
+from app.core.audio import AudioBuffer
+from app.core.config import Config
+
+
+class TestFakeASRBackend(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.config = Config(input_file="dummy.mp3", output_dir=self.test_dir, temp_dir=self.test_dir / "temp")
+        rng = np.random.default_rng(0)
+        self.audio = AudioBuffer(rng.integers(-8000, 8000, 16000 * 30, dtype=np.int16), 16000)
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_engine_offsets_results(self):
+        engine = ASREngine(self.config, backend=FakeASRBackend(self.config))
+
+        (idx, results), = engine.iter_transcribe(self.audio, [(3, {"start": 10.0, "end": 22.0})])
+
+        self.assertEqual(idx, 3)
+        self.assertEqual([(r["start"], r["end"]) for r in results], [(10.0, 15.0), (15.0, 20.0), (20.0, 22.0)])
+        self.assertEqual(results[0]["words"][0]["start"], 10.0)
+        self.assertEqual(results[-1]["words"][-1]["end"], 22.0)
+
+    def test_batched_output_matches_sequential(self):
+        segments = [(i, {"start": i * 3.0, "end": i * 3.0 + 1.0 + i}) for i in range(6)]
+        sequential = ASREngine(self.config, backend=FakeASRBackend(self.config))
+        batched_config = self.config.derive(batch_size=4)
+        backend = FakeASRBackend(batched_config)
+        batched = ASREngine(batched_config, backend=backend)
+
+        expected = dict(sequential.iter_transcribe(self.audio, segments))
+        actual = dict(batched.iter_transcribe(self.audio, segments))
+
+        self.assertEqual(actual, expected)
+        self.assertEqual(backend.calls, 2)
+
+    def test_text_depends_on_samples(self):
+        backend = FakeASRBackend(self.config)
+        first = backend.transcribe(self.audio.to_float32(0.0, 4.0))
+        second = backend.transcribe(self.audio.to_float32(4.0, 8.0))
+
+        self.assertEqual(first, backend.transcribe(self.audio.to_float32(0.0, 4.0)))
+        self.assertNotEqual(first[0]["text"], second[0]["text"])
+
+    def test_latency(self):
+        backend = FakeASRBackend(self.config, call_latency_sec=0.02, latency_per_audio_sec=0.01)
+
+        start = time.perf_counter()
+        backend.transcribe_batch([self.audio.to_float32(0.0, 2.0), self.audio.to_float32(2.0, 4.0)])
+
+        self.assertGreaterEqual(time.perf_counter() - start, 0.06)
+
+
+if __name__ == "__main__":
+    unittest.main()
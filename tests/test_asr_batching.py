@@ -0,0 +1,134 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from app.core.asr import ASREngine
+from app.core.asr_backends import FasterWhisperBackend
+from app.core.audio import AudioBuffer
+from app.core.config import Config
+
+
+class FakeWord:
+    def __init__(self, start: float, end: float, word: str):
+        self.start = start
+        self.end = end
+        self.word = word
+        self.probability = 0.9
+
+
+class FakeSegment:
+    def __init__(self, start: float, end: float, text: str):
+        self.start = start
+        self.end = end
+        self.text = " " + text
+        self.avg_logprob = -0.2
+        self.compression_ratio = 1.5
+        self.no_speech_prob = 0.01
+        self.words = [FakeWord(start, end, " " + text)]
+
+
+def _fake_segment(samples: np.ndarray, clip_start: float, clip_end: float) -> FakeSegment:
+    # Every test window is filled with one level; the text names it.
+    level = int(round(float(samples[0]) * 32768))
+    return FakeSegment(clip_start + 0.25, clip_end - 0.25, f"level {level}")
+
+
+class FakeWhisperModel:
+    def transcribe(self, samples, **options):
+        return [_fake_segment(samples, 0.0, len(samples) / 16000)], None
+
+
+class FakeBatchedPipeline:
+    def __init__(self):
+        self.batches = []
+
+    def transcribe(self, samples, clip_timestamps, **options):
+        self.batches.append(len(clip_timestamps))
+        segments = []
+        # As in faster-whisper: clips are sample offsets into the audio,
+        # segment times are seconds.
+        for clip in clip_timestamps:
+            chunk = samples[clip["start"]:clip["end"]]
+            segments.append(_fake_segment(chunk, clip["start"] / 16000, clip["end"] / 16000))
+        return segments, None
+
+
+class FakeWhisperBackend(FasterWhisperBackend):
+    # The real packing and offset mapping around fake models.
+    def __init__(self, config: Config):
+        self.config = config
+        self.model = FakeWhisperModel()
+        self.batched_model = FakeBatchedPipeline() if config.batch_size > 1 else None
+
+
+class TestBatchedASR(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+        # Windows of 1.0, 2.5, 0.5, 1.5 and 3.0 s, each at its own level,
+        # separated by 0.5 s of silence.
+        self.segments = []
+        samples = []
+        position = 0.0
+        for level, duration in enumerate([1.0, 2.5, 0.5, 1.5, 3.0], 1):
+            samples.append(np.zeros(8000, dtype=np.int16))
+            samples.append(np.full(int(duration * 16000), level * 100, dtype=np.int16))
+            self.segments.append({"start": position + 0.5, "end": position + 0.5 + duration})
+            position += 0.5 + duration
+        self.audio = AudioBuffer(np.concatenate(samples), 16000)
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def _engine(self, batch_size: int) -> ASREngine:
+        config = Config(
+            input_file="meeting.mp3",
+            output_dir=self.test_dir / "output",
+            temp_dir=self.test_dir / "temp",
+            batch_size=batch_size,
+        )
+        return ASREngine(config, backend=FakeWhisperBackend(config))
+
+    def _transcribe(self, engine) -> dict:
+        return dict(engine.iter_transcribe(self.audio, list(enumerate(self.segments))))
+
+    def test_batched_matches_sequential(self):
+        sequential = self._transcribe(self._engine(1))
+        batched = self._transcribe(self._engine(2))
+
+        self.assertEqual(batched, sequential)
+        for idx, segment in enumerate(self.segments):
+            result, = batched[idx]
+            self.assertEqual(result["text"], f"level {(idx + 1) * 100}")
+            self.assertEqual(result["start"], segment["start"] + 0.25)
+            self.assertEqual(result["end"], segment["end"] - 0.25)
+            self.assertEqual(result["words"][0]["start"], result["start"])
+
+    def test_batch_size_boundary(self):
+        engine = self._engine(5)
+        self._transcribe(engine)
+        self.assertEqual(engine.backend.batched_model.batches, [5])
+
+        engine = self._engine(4)
+        self._transcribe(engine)
+        self.assertEqual(engine.backend.batched_model.batches, [4, 1])
+
+    def test_batches_bucket_by_length(self):
+        batches = ASREngine._make_batches(list(enumerate(self.segments)), 2)
+
+        self.assertEqual([[idx for idx, _ in batch] for batch in batches], [[2, 0], [3, 1], [4]])
+
+    def test_no_segments(self):
+        engine = self._engine(4)
+
+        self.assertEqual(list(engine.iter_transcribe(self.audio, [])), [])
+        self.assertEqual(engine.backend.batched_model.batches, [])
+        self.assertEqual(ASREngine._make_batches([], 4), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
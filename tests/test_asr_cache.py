@@ -0,0 +1,155 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from app.core.asr import ASREngine
+from app.core.asr_backends import FakeASRBackend
+from app.core.audio import AudioBuffer
+from app.core.cache import ASRCache, CachedASREngine
+from app.core.config import Config
+
+
+class CountingEngine:
+    def __init__(self):
+        self.calls = []
+
+    def iter_transcribe(self, audio, indexed_segments, options=None):
+        for idx, seg in indexed_segments:
+            self.calls.append(idx)
+            yield idx, [{
+                "start": seg["start"] + 0.5,
+                "end": seg["end"],
+                "text": f"segment {idx}",
+                "words": [{"start": seg["start"] + 0.5, "end": seg["end"], "word": "w", "probability": 0.9}],
+            }]
+
+
+class SilentEngine(CountingEngine):
+    def iter_transcribe(self, audio, indexed_segments, options=None):
+        for idx, seg in indexed_segments:
+            self.calls.append(idx)
+            yield idx, []
+
+
+class FlakyBackend(FakeASRBackend):
+    # Raises on the first call, then decodes normally.
+    def transcribe_batch(self, clips, **options):
+        if self.calls == 0:
+            self.calls += 1
+            raise RuntimeError("CUDA out of memory")
+        return super().transcribe_batch(clips, **options)
+
+
+class TestASRCache(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.config = Config(
+            input_file="dummy.mp3",
+            output_dir=str(self.test_dir / "output"),
+            temp_dir=str(self.test_dir / "temp"),
+        )
+        self.cache = ASRCache(self.test_dir / "cache", max_bytes=1024 * 1024)
+
+        rng = np.random.default_rng(0)
+        tone = rng.integers(-1000, 1000, 16000, dtype=np.int16)
+        other = rng.integers(-1000, 1000, 16000, dtype=np.int16)
+        # the same second of audio at 0 s and 3 s, something else at 5 s
+        samples = np.zeros(16000 * 6, dtype=np.int16)
+        samples[0:16000] = tone
+        samples[48000:64000] = tone
+        samples[80000:96000] = other
+        self.audio = AudioBuffer(samples, 16000)
+        self.segments = [
+            (0, {"start": 0.0, "end": 1.0}),
+            (1, {"start": 3.0, "end": 4.0}),
+            (2, {"start": 5.0, "end": 6.0}),
+        ]
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_identical_audio_decoded_once(self):
+        engine = CountingEngine()
+        cached = CachedASREngine(engine, self.cache, self.config)
+
+        first = dict(cached.iter_transcribe(self.audio, self.segments[:1]))
+        second = dict(cached.iter_transcribe(self.audio, self.segments))
+
+        self.assertEqual(engine.calls, [0, 2])
+        self.assertEqual(sorted(second), [0, 1, 2])
+        self.assertEqual(first[0][0]["start"], 0.5)
+        self.assertEqual(self.cache.hits, 2)
+
+    def test_hit_is_shifted_to_segment_offset(self):
+        engine = CountingEngine()
+        cached = CachedASREngine(engine, self.cache, self.config)
+        list(cached.iter_transcribe(self.audio, self.segments[:1]))
+
+        results = dict(cached.iter_transcribe(self.audio, [self.segments[1]]))
+
+        self.assertEqual(engine.calls, [0])
+        self.assertAlmostEqual(results[1][0]["start"], 3.5)
+        self.assertAlmostEqual(results[1][0]["words"][0]["start"], 3.5)
+
+    def test_empty_results_cached(self):
+        engine = SilentEngine()
+        cached = CachedASREngine(engine, self.cache, self.config)
+
+        first = dict(cached.iter_transcribe(self.audio, self.segments))
+        second = dict(cached.iter_transcribe(self.audio, self.segments))
+
+        self.assertEqual(engine.calls, [0, 1, 2])
+        self.assertEqual(first, {0: [], 1: [], 2: []})
+        self.assertEqual(second, first)
+        self.assertEqual(self.cache.hits, 3)
+
+    def test_failed_decode_not_cached(self):
+        config = Config(
+            input_file="dummy.mp3",
+            output_dir=str(self.test_dir / "output"),
+            temp_dir=str(self.test_dir / "temp"),
+            asr_backend="fake",
+        )
+        engine = ASREngine(config, backend=FlakyBackend(config))
+        cached = CachedASREngine(engine, self.cache, config)
+
+        first = dict(cached.iter_transcribe(self.audio, self.segments[:1]))
+        second = dict(cached.iter_transcribe(self.audio, self.segments[:1]))
+
+        self.assertEqual(first, {0: []})
+        self.assertTrue(second[0])
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(engine.backend.calls, 2)
+
+    def test_settings_change_misses(self):
+        engine = CountingEngine()
+        list(CachedASREngine(engine, self.cache, self.config).iter_transcribe(self.audio, self.segments[:1]))
+
+        prompted = Config(
+            input_file="dummy.mp3",
+            output_dir=str(self.test_dir / "output"),
+            temp_dir=str(self.test_dir / "temp"),
+            initial_prompt="EMR, LIS",
+        )
+        list(CachedASREngine(engine, self.cache, prompted).iter_transcribe(self.audio, self.segments[:1]))
+
+        self.assertEqual(engine.calls, [0, 0])
+
+    def test_lru_eviction(self):
+        small = ASRCache(self.test_dir / "small", max_bytes=600)
+        results = [{"start": 0.0, "end": 1.0, "text": "x" * 100, "words": []}]
+        for i in range(10):
+            small.put(f"{i:02d}" + "0" * 62, results)
+
+        self.assertLessEqual(small.size_bytes, 600)
+        self.assertGreater(small.evictions, 0)
+        self.assertIsNotNone(small.get("09" + "0" * 62))
+        self.assertIsNone(small.get("00" + "0" * 62))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+from app.core.audio import AudioBuffer
+from app.core.config import Config
+from app.core.pipeline import DictationPipeline
+from app.core.vad import VADSegmenter
+from benchmarks.pipeline import EnergyVADModel, synthetic_audio
+
+# Every fast path must write byte-identical outputs to the plain sequential
+# path when the backend returns the same results for the same samples.
+OUTPUT_FILES = ("transcript.json", "transcript.jsonl", "transcript.md", "transcript.srt", "minutes.md")
+
+
+class FakeConverter:
+    def __init__(self, samples: np.ndarray):
+        self.samples = samples
+
+    def decode_pcm(self):
+        return AudioBuffer(np.array(self.samples), 16000)
+
+    def stream_pcm(self):
+        for start in range(0, len(self.samples), 16000):
+            yield np.array(self.samples[start:start + 16000])
+
+
+class TestASREquivalence(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.audio_dir = Path(tempfile.mkdtemp())
+        cls.samples = synthetic_audio(cls.audio_dir / "meeting.npy", 120.0)
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.samples
+        shutil.rmtree(cls.audio_dir, ignore_errors=True)
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.input_file = self.test_dir / "meeting.mp3"
+        self.input_file.write_bytes(b"fake mp3 payload")
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def _config(self, name: str, **overrides) -> Config:
+        values = dict(
+            input_file=self.input_file,
+            output_dir=self.test_dir / name,
+            temp_dir=self.test_dir / "temp",
+            cache_dir=self.test_dir / "cache",
+            workspace_dir=self.test_dir / "workspace",
+            asr_backend="fake",
+            meeting_title="주간 회의",
+            meeting_date="2024-03-01",
+            export_jsonl=True,
+            use_cache=False,
+            use_workspace=False,
+        )
+        values.update(overrides)
+        return Config(**values)
+
+    def _pipeline(self, config: Config) -> DictationPipeline:
+        pipeline = DictationPipeline(config, vad_segmenter=VADSegmenter(config, model=EnergyVADModel()))
+        pipeline.audio_converter = FakeConverter(self.samples)
+        pipeline.progress_callback = lambda current, total, message: None
+        return pipeline
+
+    def _outputs(self, config: Config) -> Dict[str, bytes]:
+        return {name: (config.output_dir / name).read_bytes() for name in OUTPUT_FILES}
+
+    def _run(self, config: Config) -> Dict[str, bytes]:
+        self.assertTrue(self._pipeline(config).run())
+        return self._outputs(config)
+
+    def assertEquivalent(self, outputs: Dict[str, bytes]):
+        baseline = self._run(self._config("baseline"))
+        self.assertIn("EMR".encode("utf-8"), baseline["transcript.md"])
+        for name in OUTPUT_FILES:
+            self.assertEqual(outputs[name], baseline[name], f"{name} differs from the sequential path")
+
+    def test_batched(self):
+        self.assertEquivalent(self._run(self._config("batched", batch_size=4)))
+
+    def test_streaming(self):
+        self.assertEquivalent(self._run(self._config("streaming", streaming=True)))
+
+    def test_worker_pool(self):
+        # Workers need file-backed audio, which the workspace provides.
+        self.assertEquivalent(self._run(self._config("workers", num_workers=2, use_workspace=True)))
+
+    def test_cache_hits(self):
+        self._run(self._config("cold", use_cache=True))
+        self.assertEquivalent(self._run(self._config("warm", use_cache=True)))
+
+    def test_workspace_rerun(self):
+        self._run(self._config("first", use_workspace=True))
+        self.assertEquivalent(self._run(self._config("second", use_workspace=True)))
+
+    def test_checkpoint_resume(self):
+        config = self._config("resumed")
+        pipeline = self._pipeline(config)
+        audio, segments = pipeline.prepare()
+
+        # Half the windows finished before an interruption.
+        half = list(enumerate(segments))[::2]
+        for idx, results in pipeline.asr_engine.iter_transcribe(audio, half):
+            pipeline.checkpoint_manager.append_segment(idx, results)
+        calls = pipeline.asr_engine.backend.calls
+
+        pipeline.transcribe_and_export(audio, segments)
+
+        self.assertEqual(pipeline.asr_engine.backend.calls - calls, len(segments) - len(half))
+        self.assertEquivalent(self._outputs(config))
+
+
+if __name__ == "__main__":
+    unittest.main()
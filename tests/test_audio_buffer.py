@@ -0,0 +1,131 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+from scipy.io import wavfile
+
+from app.core.audio import AudioBuffer, AudioConverter, GrowingAudioBuffer
+from app.core.config import Config
+
+
+class TestAudioBuffer(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.wav_path = self.test_dir / "audio.wav"
+
+        self.samples = (np.arange(16000 * 3) % 1000).astype(np.int16)
+        wavfile.write(str(self.wav_path), 16000, self.samples)
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_from_wav(self):
+        audio = AudioBuffer.from_wav(self.wav_path)
+
+        self.assertEqual(audio.sample_rate, 16000)
+        self.assertAlmostEqual(audio.duration, 3.0)
+
+    def test_slice_is_view(self):
+        audio = AudioBuffer.from_wav(self.wav_path)
+        segment = audio.slice(1.0, 1.5)
+
+        self.assertEqual(len(segment), 8000)
+        self.assertTrue(np.shares_memory(segment, audio.samples))
+        np.testing.assert_array_equal(segment, self.samples[16000:24000])
+
+    def test_slice_clamped(self):
+        audio = AudioBuffer.from_wav(self.wav_path)
+
+        self.assertEqual(len(audio.slice(2.5, 10.0)), 8000)
+        self.assertEqual(len(audio.slice(-1.0, 0.5)), 8000)
+
+    def test_iter_chunks(self):
+        audio = AudioBuffer.from_wav(self.wav_path)
+        chunks = list(audio.iter_chunks(20000))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [20000, 20000, 8000])
+        self.assertTrue(all(np.shares_memory(chunk, audio.samples) for chunk in chunks))
+        np.testing.assert_array_equal(np.concatenate(chunks), self.samples)
+
+    def test_to_float32(self):
+        audio = AudioBuffer.from_wav(self.wav_path)
+        segment = audio.to_float32(0.0, 1.0)
+
+        self.assertEqual(segment.dtype, np.float32)
+        self.assertAlmostEqual(float(segment[999]), 999 / 32768.0)
+
+
+class TestGrowingAudioBuffer(unittest.TestCase):
+    def test_growth_keeps_samples_and_views(self):
+        audio = GrowingAudioBuffer(16000, capacity=1000)
+        samples = (np.arange(5000) % 3000).astype(np.int16)
+
+        audio.append(samples[:600])
+        early = audio.slice(0.0, 0.02)
+        audio.append(samples[600:1500])
+        self.assertGreaterEqual(len(audio._data), 2000)
+        audio.append(samples[1500:])
+
+        self.assertEqual(len(audio.samples), 5000)
+        self.assertAlmostEqual(audio.duration, 5000 / 16000)
+        np.testing.assert_array_equal(audio.samples, samples)
+        np.testing.assert_array_equal(early, samples[:320])
+
+    def test_slice_across_growth(self):
+        audio = GrowingAudioBuffer(16000, capacity=16000)
+        samples = (np.arange(16000 * 3) % 1000).astype(np.int16)
+        for start in range(0, len(samples), 7000):
+            audio.append(samples[start:start + 7000])
+
+        np.testing.assert_array_equal(audio.slice(0.5, 2.5), samples[8000:40000])
+        self.assertEqual(len(audio.slice(2.5, 10.0)), 8000)
+        self.assertAlmostEqual(float(audio.to_float32(0.0, 1.0)[999]), 999 / 32768.0)
+
+
+class ChunkedConverter(AudioConverter):
+    # ffmpeg's output replaced by fixed chunks; decode_pcm itself is real.
+    def __init__(self, config: Config, samples: np.ndarray):
+        super().__init__(config)
+        self.samples = samples
+
+    def stream_pcm(self, mp3_path=None, chunk_samples=None):
+        for start in range(0, len(self.samples), chunk_samples):
+            yield self.samples[start:start + chunk_samples]
+
+
+class TestDecodePcm(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.config = Config(
+            input_file=self.test_dir / "meeting.mp3",
+            output_dir=self.test_dir / "output",
+            temp_dir=self.test_dir / "temp",
+        )
+        # One second of a 64 kbps stream.
+        self.config.input_file.write_bytes(b"\0" * 8000)
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_capacity_from_file_size(self):
+        samples = (np.arange(16000) % 1000).astype(np.int16)
+        audio = ChunkedConverter(self.config, samples).decode_pcm()
+
+        # The estimate plus one second of slack; nothing had to grow.
+        self.assertEqual(len(audio._data), 32000)
+        np.testing.assert_array_equal(audio.samples, samples)
+
+    def test_longer_than_estimate(self):
+        samples = (np.arange(16000 * 25) % 1000).astype(np.int16)
+        audio = ChunkedConverter(self.config, samples).decode_pcm()
+
+        self.assertAlmostEqual(audio.duration, 25.0)
+        np.testing.assert_array_equal(audio.samples, samples)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import sys
+import unittest
+import json
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+
+from app.batch import BatchRunner, collect_inputs
+from app.core.config import Config
+from main import parse_args
+
+
+class FailingBatchRunner(BatchRunner):
+    def _load_models(self):
+        return object(), object()
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.config = Config(
+            input_file="",
+            output_dir=str(self.test_dir / "output"),
+            temp_dir=str(self.test_dir / "temp"),
+        )
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_collect_from_directory(self):
+        recordings = self.test_dir / "recordings"
+        recordings.mkdir()
+        for name in ["b.mp3", "a.MP3", "notes.txt"]:
+            (recordings / name).write_bytes(b"")
+
+        inputs = collect_inputs(input_dir=recordings)
+
+        self.assertEqual([path.name for path in inputs], ["a.MP3", "b.mp3"])
+
+    def test_collect_from_manifest(self):
+        manifest = self.test_dir / "nightly.txt"
+        manifest.write_text("# nightly\nmeeting1.mp3\n\n/data/meeting2.mp3\n", encoding="utf-8")
+
+        inputs = collect_inputs(manifest=manifest)
+
+        self.assertEqual(inputs, [self.test_dir / "meeting1.mp3", Path("/data/meeting2.mp3")])
+
+    def test_failures_do_not_abort_batch(self):
+        inputs = [self.test_dir / "missing.mp3", self.test_dir / "sub" / "missing.mp3"]
+        runner = FailingBatchRunner(self.config, inputs)
+
+        self.assertFalse(runner.run())
+
+        with open(self.test_dir / "output" / "batch_summary.json", encoding="utf-8") as f:
+            summary = json.load(f)
+
+        self.assertEqual(summary["total"], 2)
+        self.assertEqual(summary["failed"], 2)
+        self.assertEqual(
+            [Path(result["output"]).name for result in summary["files"]],
+            ["missing", "missing_2"],
+        )
+        self.assertTrue(all(result["error"] for result in summary["files"]))
+
+    def test_streaming_rejected(self):
+        with self.assertRaises(ValueError):
+            BatchRunner(self.config.derive(streaming=True), [self.test_dir / "a.mp3"])
+
+        argv = ["main.py", "--input-dir", str(self.test_dir), "--streaming"]
+        with mock.patch.object(sys, "argv", argv), mock.patch("sys.stderr"), self.assertRaises(SystemExit):
+            parse_args()
+
+
+if __name__ == "__main__":
+    unittest.main()
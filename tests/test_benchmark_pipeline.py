@@ -0,0 +1,52 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.pipeline import compare, run_isolated, synthetic_audio
+
+
+class TestPipelineBenchmark(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_synthetic_audio_is_deterministic(self):
+        first = np.array(synthetic_audio(self.test_dir / "a.npy", 30.0))
+        second = np.array(synthetic_audio(self.test_dir / "b.npy", 30.0))
+
+        self.assertEqual(len(first), 30 * 16000)
+        np.testing.assert_array_equal(first, second)
+        self.assertGreater(np.count_nonzero(first), 0)
+        self.assertGreater(np.count_nonzero(first == 0), 0)
+
+    def test_run_isolated_reports_stages(self):
+        input_file = self.test_dir / "meeting.npy"
+        synthetic_audio(input_file, 60.0)
+
+        result = run_isolated(input_file)
+
+        self.assertEqual(result["audio_sec"], 60.0)
+        self.assertEqual(set(result["stages"]), {"decode", "vad", "asr", "minutes"})
+        self.assertGreater(result["windows"], 0)
+        self.assertGreater(result["segments"], 0)
+        self.assertGreater(result["peak_rss_mb"], 0)
+        self.assertAlmostEqual(result["rtf"], result["total_sec"] / 60.0, places=3)
+
+    def test_compare_flags_regressions(self):
+        baseline = {"10m": {"stages": {"vad": 1.0, "asr_export": 1.0}, "peak_rss_mb": 100}}
+        result = {"stages": {"vad": 1.1, "asr_export": 2.0}, "peak_rss_mb": 150}
+
+        regressions = compare("10m", result, baseline)
+
+        self.assertEqual(len(regressions), 2)
+        self.assertEqual(compare("1h", result, baseline), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
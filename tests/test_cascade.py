@@ -0,0 +1,114 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from app.core.asr import ASREngine
+from app.core.asr_backends import FakeASRBackend
+from app.core.audio import AudioBuffer
+from app.core.cascade import CascadeASREngine, cascade_summary, segment_confidence
+from app.core.config import Config
+from app.core.metrics import RunMetrics
+
+
+class TestCascade(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.config = Config(
+            input_file="dummy.mp3",
+            output_dir=self.test_dir,
+            temp_dir=self.test_dir / "temp",
+            asr_backend="fake",
+            draft_model="small",
+        )
+        rng = np.random.default_rng(0)
+        self.audio = AudioBuffer(rng.integers(-8000, 8000, 16000 * 120, dtype=np.int16), 16000)
+        self.segments = [(i, {"start": i * 6.0, "end": i * 6.0 + 5.0}) for i in range(20)]
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def _cascade(self, hard_fraction: float):
+        draft = FakeASRBackend(self.config, hard_fraction=hard_fraction)
+        final = FakeASRBackend(self.config, vocabulary=["정확"])
+        engine = CascadeASREngine(
+            ASREngine(self.config, backend=draft),
+            self.config,
+            final=ASREngine(self.config, backend=final),
+        )
+        return engine, draft, final
+
+    def test_segment_confidence(self):
+        results = [
+            {"start": 0.0, "end": 3.0, "avg_logprob": -0.2, "compression_ratio": 1.2,
+             "words": [{"probability": 0.9}, {"probability": 0.7}]},
+            {"start": 3.0, "end": 4.0, "avg_logprob": -1.0, "compression_ratio": 2.6, "words": []},
+        ]
+
+        score = segment_confidence(results)
+
+        self.assertAlmostEqual(score["word_probability"], 0.8)
+        self.assertAlmostEqual(score["avg_logprob"], -0.4)
+        self.assertEqual(score["compression_ratio"], 2.6)
+        self.assertEqual(segment_confidence([]), {
+            "word_probability": None, "avg_logprob": None, "compression_ratio": None,
+        })
+
+    def test_only_low_confidence_windows_are_escalated(self):
+        engine, draft, final = self._cascade(hard_fraction=0.3)
+        metrics = RunMetrics()
+
+        with metrics.activate():
+            results = dict(engine.iter_transcribe(self.audio, self.segments))
+
+        self.assertEqual(sorted(results), list(range(20)))
+        escalated = [idx for idx, res in results.items() if res[0]["text"].startswith("정확")]
+        self.assertTrue(0 < len(escalated) < 20)
+        self.assertEqual(final.calls, len(escalated))
+        self.assertEqual(metrics.counters["cascade_windows"], 20)
+        self.assertEqual(metrics.counters["cascade_escalated"], len(escalated))
+        self.assertEqual(metrics.counters["cascade_escalated_audio_seconds"], 5.0 * len(escalated))
+
+    def test_confident_draft_never_loads_final_model(self):
+        draft = FakeASRBackend(self.config)
+        engine = CascadeASREngine(ASREngine(self.config, backend=draft), self.config)
+
+        results = list(engine.iter_transcribe(self.audio, iter(self.segments)))
+
+        self.assertEqual(len(results), 20)
+        self.assertIsNone(engine._final)
+
+    def test_escalations_are_batched(self):
+        config = self.config.derive(batch_size=4)
+        final = FakeASRBackend(config, vocabulary=["정확"])
+        engine = CascadeASREngine(
+            ASREngine(config, backend=FakeASRBackend(config, probability=0.1)),
+            config,
+            final=ASREngine(config, backend=final),
+        )
+
+        results = list(engine.iter_transcribe(self.audio, self.segments))
+
+        self.assertEqual(len(results), 20)
+        self.assertEqual(final.calls, 5)
+
+    def test_summary_estimates_time_saved(self):
+        summary = cascade_summary({
+            "cascade_windows": 10,
+            "cascade_escalated": 2,
+            "cascade_audio_seconds": 100.0,
+            "cascade_escalated_audio_seconds": 20.0,
+            "cascade_draft_seconds": 5.0,
+            "cascade_final_seconds": 10.0,
+        })
+
+        self.assertAlmostEqual(summary["escalated_fraction"], 0.2)
+        self.assertAlmostEqual(summary["saved_sec"], 50.0 - 15.0)
+        self.assertIsNone(cascade_summary({}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+from app.core.io import CheckpointManager
+
+
+class TestCheckpointJournal(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.path = self.test_dir / "checkpoint.jsonl"
+        self.manager = CheckpointManager(self.path)
+
+    def tearDown(self):
+        self.manager.delete()
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def _result(self, start: float) -> dict:
+        return {"start": start, "end": start + 1.0, "text": f"segment {start}", "words": []}
+
+    def test_append_and_resume_out_of_order(self):
+        self.manager.append_segment(2, [self._result(20.0)])
+        self.manager.append_segment(0, [self._result(0.0), self._result(1.0)])
+
+        data = CheckpointManager(self.path).load_segments()
+
+        self.assertEqual(data["done_segments"], {0, 2})
+        self.assertEqual([r["start"] for r in data["transcribed"]], [0.0, 1.0, 20.0])
+
+    def test_append_is_one_line_per_segment(self):
+        for idx in range(10):
+            self.manager.append_segment(idx, [self._result(float(idx))])
+
+        lines = self.path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 10)
+
+    def test_torn_tail_is_dropped_and_compacted(self):
+        self.manager.append_segment(0, [self._result(0.0)])
+        self.manager._close()
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('{"idx": 1, "results": [{"sta')
+
+        manager = CheckpointManager(self.path)
+        data = manager.load_segments()
+        self.assertEqual(data["done_segments"], {0})
+
+        manager.append_segment(1, [self._result(1.0)])
+        manager._close()
+        self.assertEqual(set(CheckpointManager(self.path).replay()), {0, 1})
+
+    def test_duplicates_keep_latest(self):
+        self.manager.append_segment(0, [self._result(0.0)])
+        self.manager.append_segment(0, [self._result(5.0)])
+
+        data = CheckpointManager(self.path).load_segments()
+
+        self.assertEqual([r["start"] for r in data["transcribed"]], [5.0])
+        self.assertEqual(len(self.path.read_text(encoding="utf-8").splitlines()), 1)
+
+    def test_missing_checkpoint(self):
+        self.assertIsNone(self.manager.load_segments())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import sys
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+from scipy.io import wavfile
+
+from app.core.audio import AudioBuffer
+from app.core.config import Config
+from app.core.pipeline import DictationPipeline
+from app.core.vad import VADSegmenter
+from benchmarks.pipeline import EnergyVADModel
+from main import parse_args
+
+
+class RecordingConverter:
+    def __init__(self, config: Config, samples: np.ndarray):
+        self.config = config
+        self.samples = samples
+        self.calls = []
+
+    def decode_pcm(self):
+        self.calls.append("memory")
+        return AudioBuffer(self.samples, 16000)
+
+    def convert_mp3_to_wav(self):
+        self.calls.append("wav")
+        wav_path = self.config.temp_dir / "audio.wav"
+        wavfile.write(str(wav_path), 16000, self.samples)
+        return wav_path
+
+
+class TestDecodeMode(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.samples = (np.arange(16000 * 2) % 1000).astype(np.int16)
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def _parse(self, *argv):
+        with mock.patch.object(sys, "argv", ["main.py", "--input", "meeting.mp3", *argv]):
+            return parse_args()
+
+    def test_cli_flag(self):
+        self.assertEqual(self._parse().decode_mode, "memory")
+        self.assertEqual(self._parse("--decode-mode", "wav").decode_mode, "wav")
+        with mock.patch("sys.stderr"), self.assertRaises(SystemExit):
+            self._parse("--decode-mode", "mp3")
+
+    def _prepare(self, **overrides):
+        config = Config(
+            input_file="meeting.mp3",
+            output_dir=self.test_dir / "output",
+            temp_dir=self.test_dir / "temp",
+            use_workspace=False,
+            **overrides,
+        )
+        pipeline = DictationPipeline(config, vad_segmenter=VADSegmenter(config, model=EnergyVADModel()))
+        pipeline.audio_converter = RecordingConverter(config, self.samples)
+
+        audio, _ = pipeline.prepare()
+        return pipeline.audio_converter.calls, audio
+
+    def test_memory_mode(self):
+        calls, audio = self._prepare()
+
+        self.assertEqual(calls, ["memory"])
+        self.assertIsNone(audio.path)
+
+    def test_wav_mode(self):
+        calls, audio = self._prepare(decode_mode="wav")
+
+        self.assertEqual(calls, ["wav"])
+        self.assertEqual(audio.path, self.test_dir / "temp" / "audio.wav")
+        np.testing.assert_array_equal(audio.samples, self.samples)
+
+    def test_workers_need_wav(self):
+        calls, _ = self._prepare(num_workers=2)
+
+        self.assertEqual(calls, ["wav"])
+
+
+if __name__ == "__main__":
+    unittest.main()
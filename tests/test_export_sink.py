@@ -0,0 +1,91 @@
+import unittest
+import json
+import tempfile
+import shutil
+from pathlib import Path
+
+from app.core.config import Config
+from app.core.export import ExportSink
+from app.core.postprocess import PostProcessor
+
+
+class TestExportSink(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.config = Config(
+            input_file="dummy.mp3",
+            output_dir=str(self.test_dir),
+            temp_dir=str(self.test_dir / "temp"),
+            meeting_title="주간 회의",
+            export_jsonl=True,
+        )
+        self.processor = PostProcessor(self.config)
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def _segment(self, start: float, text: str = "emr 연동") -> dict:
+        return {"start": start, "end": start + 1.0, "text": text, "words": []}
+
+    def _json(self) -> dict:
+        with open(self.test_dir / "transcript.json", 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_windows_are_released_in_order(self):
+        sink = ExportSink(self.config, self.processor)
+
+        sink.add(1, [self._segment(10.0)])
+        self.assertEqual(self._json()["segments"], [])
+
+        sink.add(0, [self._segment(2.0), self._segment(0.0)])
+        sink.add(2, [])
+        transcript = sink.close()
+
+        self.assertEqual(transcript.segment_start.tolist(), [0.0, 2.0, 10.0])
+        self.assertEqual([seg["start"] for seg in self._json()["segments"]], [0.0, 2.0, 10.0])
+        self.assertEqual(transcript[0].text, "EMR 연동")
+
+    def test_partial_outputs_are_valid(self):
+        sink = ExportSink(self.config, self.processor)
+
+        for idx in range(3):
+            sink.add(idx, [self._segment(float(idx))])
+
+            data = self._json()
+            self.assertEqual(data["meeting_info"]["title"], "주간 회의")
+            self.assertEqual(len(data["segments"]), idx + 1)
+
+            lines = (self.test_dir / "transcript.jsonl").read_text(encoding="utf-8").splitlines()
+            self.assertEqual([json.loads(line)["start"] for line in lines], [0.0, 1.0, 2.0][:idx + 1])
+
+            srt = (self.test_dir / "transcript.srt").read_text(encoding="utf-8")
+            self.assertTrue(srt.endswith(f"{idx + 1}\n00:00:0{idx},000 --> 00:00:0{idx + 1},000\nEMR 연동\n\n"))
+
+        sink.close()
+
+    def test_compact_json(self):
+        config = self.config.derive(compact_json=True)
+        sink = ExportSink(config, PostProcessor(config))
+        sink.add(0, [self._segment(0.0), self._segment(1.0)])
+        sink.close()
+
+        content = (self.test_dir / "transcript.json").read_text(encoding="utf-8")
+        self.assertEqual(content.count("\n"), 1)
+        self.assertEqual(len(json.loads(content)["segments"]), 2)
+
+    def test_decoder_scores_are_not_exported(self):
+        sink = ExportSink(self.config, self.processor)
+        sink.add(0, [dict(self._segment(0.0), avg_logprob=-0.3, compression_ratio=1.2, no_speech_prob=0.01)])
+        sink.close()
+
+        self.assertEqual(set(self._json()["segments"][0]), {"start", "end", "text", "words"})
+
+    def test_empty_transcript(self):
+        ExportSink(self.config, self.processor).close()
+
+        self.assertEqual(self._json()["segments"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+import unittest
+
+from benchmarks.import_time import measure_imports, heavy_imports, SCENARIOS
+
+
+class TestImportTime(unittest.TestCase):
+    def test_cli_help_is_light(self):
+        modules, total_us = measure_imports(SCENARIOS["cli --help"])
+
+        self.assertIn("app.core.config", modules)
+        self.assertNotIn("numpy", modules)
+        self.assertEqual(heavy_imports(modules), [])
+        self.assertLess(total_us, 1_000_000)
+
+    def test_pipeline_import_defers_models(self):
+        modules, _ = measure_imports(SCENARIOS["import pipeline"])
+
+        self.assertIn("app.core.pipeline", modules)
+        self.assertEqual(heavy_imports(modules), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
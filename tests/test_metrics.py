@@ -0,0 +1,136 @@
+import unittest
+import json
+import subprocess
+import sys
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from app.core.asr import ASREngine
+from app.core.asr_backends import FakeASRBackend
+from app.core.audio import AudioBuffer
+from app.core.config import Config
+from app.core.metrics import RunMetrics, current_metrics, peak_rss_mb
+from app.core.pipeline import DictationPipeline
+
+
+class FakeConverter:
+    def decode_pcm(self):
+        return AudioBuffer(np.zeros(16000 * 10, dtype=np.int16), 16000)
+
+
+class FakeVAD:
+    def segment_audio(self, audio):
+        return [(0.0, 2.0), (4.0, 8.0)]
+
+    def segments_to_dict(self, segments):
+        return [{"start": start, "end": end} for start, end in segments]
+
+
+class TestRunMetrics(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_histogram_buckets_are_cumulative(self):
+        metrics = RunMetrics()
+        for latency in (0.05, 0.3, 0.3, 100.0):
+            metrics.observe_segment(10.0, latency)
+
+        hist = metrics.to_dict()["histograms"]["asr_segment_seconds"]
+
+        self.assertEqual(hist["count"], 4)
+        self.assertEqual(hist["buckets"]["0.1"], 1)
+        self.assertEqual(hist["buckets"]["0.5"], 3)
+        self.assertEqual(hist["buckets"]["60.0"], 3)
+
+    def test_imports_without_resource_module(self):
+        # resource does not exist on Windows, where the GUI is built.
+        code = "import sys; sys.modules['resource'] = None; import app.core.pipeline"
+        subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).resolve().parent.parent, check=True)
+
+    def test_peak_rss(self):
+        self.assertGreater(peak_rss_mb(), 0)
+        # No psapi here: the Windows path falls back to 0.
+        with mock.patch.object(sys, "platform", "win32"):
+            self.assertEqual(peak_rss_mb(), 0.0)
+
+    def test_activate_is_scoped(self):
+        metrics = RunMetrics()
+
+        self.assertIsNone(current_metrics())
+        with metrics.activate():
+            self.assertIs(current_metrics(), metrics)
+        self.assertIsNone(current_metrics())
+
+    def test_prometheus_text(self):
+        metrics = RunMetrics()
+        metrics.stages["vad"] = 1.5
+        metrics.increment("checkpoint_appends", 3)
+        metrics.observe_segment(4.0, 0.2)
+        metrics.set("audio_seconds", 60.0)
+        metrics.finish()
+
+        path = self.test_dir / "dictation.prom"
+        metrics.write_prometheus(path, labels={"input": 'a "b".mp3'})
+        lines = path.read_text(encoding="utf-8").splitlines()
+
+        self.assertIn('dictation_stage_seconds{input="a \\"b\\".mp3",stage="vad"} 1.500000', lines)
+        self.assertIn('dictation_checkpoint_appends_total{input="a \\"b\\".mp3"} 3', lines)
+        self.assertIn('dictation_asr_segment_seconds_bucket{input="a \\"b\\".mp3",le="+Inf"} 1', lines)
+        self.assertIn('dictation_audio_seconds_per_wall_second{input="a \\"b\\".mp3"} 40.000000', lines)
+        self.assertFalse((self.test_dir / "dictation.prom.tmp").exists())
+
+    def test_engine_records_segment_latency(self):
+        config = Config(input_file="dummy.mp3", output_dir=self.test_dir)
+        engine = ASREngine(config, backend=FakeASRBackend(config))
+        audio = AudioBuffer(np.zeros(16000 * 4, dtype=np.int16), 16000)
+        metrics = RunMetrics()
+
+        engine.transcribe_segment(audio, 0.0, 4.0)
+        with metrics.activate():
+            engine.transcribe_segment(audio, 0.0, 4.0)
+
+        self.assertEqual(metrics.histograms["asr_segment_seconds"].count, 1)
+        self.assertEqual(metrics.histograms["asr_segment_rtf"].count, 1)
+
+    def test_pipeline_writes_run_metrics(self):
+        config = Config(
+            input_file=self.test_dir / "meeting.mp3",
+            output_dir=self.test_dir / "output",
+            temp_dir=self.test_dir / "temp",
+            use_cache=False,
+            use_workspace=False,
+            decode_mode="memory",
+            metrics_textfile=self.test_dir / "textfile" / "dictation.prom",
+        )
+        pipeline = DictationPipeline(
+            config,
+            vad_segmenter=FakeVAD(),
+            asr_engine=ASREngine(config, backend=FakeASRBackend(config)),
+        )
+        pipeline.audio_converter = FakeConverter()
+
+        audio, segments = pipeline.prepare()
+        pipeline.transcribe_and_export(audio, segments)
+
+        with open(config.output_dir / "run_metrics.json", 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        self.assertEqual(set(data["stages"]), {"decode", "vad", "asr", "minutes"})
+        self.assertEqual(data["counters"]["checkpoint_appends"], 2)
+        self.assertEqual(data["gauges"]["audio_seconds"], 10.0)
+        self.assertEqual(data["gauges"]["speech_seconds"], 6.0)
+        self.assertGreater(data["gauges"]["peak_rss_mb"], 0)
+        self.assertEqual(data["histograms"]["asr_segment_seconds"]["count"], 2)
+        self.assertTrue((self.test_dir / "textfile" / "dictation.prom").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
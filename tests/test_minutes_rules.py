@@ -0,0 +1,72 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+from app.core.rules import RulePack
+
+
+class TestMinutesRules(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.pack = RulePack.from_file()
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def _segments(self, *texts):
+        return [{"start": float(idx * 10), "text": text} for idx, text in enumerate(texts)]
+
+    def test_default_pack_tags_segments(self):
+        found = self.pack.classify(self._segments(
+            "FHIR 방식으로 최종 결정했습니다.",
+            "담당자: 김철수, 기한: 3월 15일까지 구현해야 합니다.",
+            "인터페이스 오류가 생길 리스크가 있습니다.",
+            "이 부분은 검사실에 확인 부탁드립니다?",
+        ))
+
+        self.assertEqual([item["start"] for item in found["decisions"]], [0.0])
+        self.assertEqual([item["start"] for item in found["action_items"]], [10.0, 30.0])
+        self.assertEqual([item["start"] for item in found["issues"]], [20.0])
+        self.assertEqual([item["start"] for item in found["open_questions"]], [30.0])
+
+        action = found["action_items"][0]
+        self.assertEqual(action["assignee"], "김철수")
+        self.assertEqual(action["deadline"], "3월 15일")
+
+    def test_extractors_run_only_on_matched_categories(self):
+        found = self.pack.classify(self._segments("담당자: 김철수, 최종 결정"))
+
+        self.assertNotIn("assignee", found["decisions"][0])
+
+    def test_max_items(self):
+        found = self.pack.classify(self._segments(*["확인?"] * 8))
+
+        self.assertEqual(len(found["open_questions"]), 5)
+
+    def test_custom_pack_from_yaml(self):
+        path = self.test_dir / "rules.yaml"
+        path.write_text(
+            "ignore_case: true\n"
+            "categories:\n"
+            "  followups:\n"
+            "    keywords: ['follow up']\n"
+            "    extract: [owner]\n"
+            "extractors:\n"
+            "  owner: '@(\\w+)'\n",
+            encoding="utf-8",
+        )
+        pack = RulePack.from_file(path)
+
+        found = pack.classify(self._segments("Follow up with @kim", "nothing here"))
+
+        self.assertEqual(found, {"followups": [{"text": "Follow up with @kim", "start": 0.0, "owner": "kim"}]})
+
+    def test_unknown_extractor_is_rejected(self):
+        with self.assertRaises(ValueError):
+            RulePack.from_dict({"categories": {"x": {"patterns": ["a"], "extract": ["missing"]}}})
+
+
+if __name__ == "__main__":
+    unittest.main()
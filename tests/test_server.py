@@ -0,0 +1,133 @@
+import unittest
+import json
+import tempfile
+import shutil
+import threading
+import time
+from pathlib import Path
+from http.server import ThreadingHTTPServer
+from unittest import mock
+
+from app.core.config import Config
+from app.core.vad import VADSegmenter
+from app.core.workers import ASRWorkerPool
+from app.server import TranscriptionServer, TranscriptionClient, _make_handler
+from benchmarks.pipeline import EnergyVADModel, synthetic_audio
+from tests.test_asr_equivalence import FakeConverter
+
+
+class TestTranscriptionServer(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.config = Config(
+            input_file="",
+            output_dir=str(self.test_dir / "output"),
+            temp_dir=str(self.test_dir / "temp"),
+        )
+        self.server = TranscriptionServer(self.config)
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_priority_order(self):
+        low = self.server.submit({"input": "a.mp3"})
+        high = self.server.submit({"input": "b.mp3", "priority": 5})
+        low_again = self.server.submit({"input": "c.mp3"})
+
+        order = [self.server.job_queue.get()[2] for _ in range(3)]
+
+        self.assertEqual(order, [high.job_id, low.job_id, low_again.job_id])
+
+    def test_job_config(self):
+        job = self.server.submit({"input": "meeting.mp3", "meeting_title": "주간 회의"})
+
+        self.assertEqual(job.config.input_file, Path("meeting.mp3"))
+        self.assertEqual(job.config.output_dir, self.test_dir / "output" / "meeting")
+        self.assertEqual(job.config.checkpoint_file, job.config.output_dir / "checkpoint.jsonl")
+        self.assertEqual(job.config.meeting_title, "주간 회의")
+        self.assertEqual(job.config.model_name, self.config.model_name)
+
+    def test_http_roundtrip(self):
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(self.server))
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            client = TranscriptionClient(f"http://127.0.0.1:{httpd.server_address[1]}")
+
+            job = client.submit({"input": "meeting.mp3"})
+            self.assertEqual(job["status"], "queued")
+            self.assertEqual(client.status(job["job_id"])["input"], "meeting.mp3")
+
+            with self.assertRaises(RuntimeError):
+                client.status("missing")
+            with self.assertRaises(RuntimeError):
+                client.submit({})
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+
+    def _run_job(self, server, samples, request):
+        # Runs one job through the server's worker loop on the fake backend.
+        with mock.patch("app.core.vad.VADSegmenter", lambda config: VADSegmenter(config, model=EnergyVADModel())), \
+                mock.patch("app.core.pipeline.AudioConverter", lambda config: FakeConverter(samples)):
+            server.load_models()
+
+            worker = threading.Thread(target=server._worker_loop, args=(server.vad_segmenters[0],), daemon=True)
+            worker.start()
+            try:
+                job = server.submit(request)
+                deadline = time.time() + 30
+                while job.status not in ("done", "failed") and time.time() < deadline:
+                    time.sleep(0.05)
+            finally:
+                server.shutdown()
+                worker.join(timeout=5)
+
+        self.assertEqual(job.status, "done", job.error)
+        return job
+
+    def test_job_prompt_reaches_backend(self):
+        config = self.config.derive(asr_backend="fake", use_cache=False, use_workspace=False)
+        server = TranscriptionServer(config)
+        samples = synthetic_audio(self.test_dir / "meeting.npy", 10.0)
+        (self.test_dir / "meeting.mp3").write_bytes(b"fake mp3 payload")
+
+        self._run_job(server, samples, {"input": str(self.test_dir / "meeting.mp3"), "prompt": "EMR, LIS"})
+
+        self.assertEqual(server.asr_engine.backend.last_options["initial_prompt"], "EMR, LIS")
+
+    def test_job_formats_set_word_timestamps(self):
+        config = self.config.derive(asr_backend="fake", use_cache=False, use_workspace=False, formats=["md"])
+        server = TranscriptionServer(config)
+        samples = synthetic_audio(self.test_dir / "meeting.npy", 10.0)
+        (self.test_dir / "meeting.mp3").write_bytes(b"fake mp3 payload")
+
+        job = self._run_job(server, samples, {"input": str(self.test_dir / "meeting.mp3"), "formats": ["json"]})
+
+        with open(job.config.output_dir / "transcript.json", 'r', encoding='utf-8') as f:
+            segments = json.load(f)["segments"]
+        self.assertTrue(segments)
+        self.assertTrue(all(segment["words"] for segment in segments))
+
+    def test_streaming_with_workers(self):
+        config = self.config.derive(
+            streaming=True,
+            num_workers=2,
+            asr_backend="fake",
+            use_cache=False,
+            use_workspace=False,
+        )
+        server = TranscriptionServer(config)
+        samples = synthetic_audio(self.test_dir / "meeting.npy", 30.0)
+        (self.test_dir / "meeting.mp3").write_bytes(b"fake mp3 payload")
+
+        job = self._run_job(server, samples, {"input": str(self.test_dir / "meeting.mp3")})
+
+        self.assertNotIsInstance(server.asr_engine, ASRWorkerPool)
+        self.assertIn(str(job.config.output_dir / "transcript.json"), job.outputs)
+
+
+if __name__ == "__main__":
+    unittest.main()
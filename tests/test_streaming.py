@@ -0,0 +1,132 @@
+import json
+import unittest
+import tempfile
+import shutil
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from app.core.audio import GrowingAudioBuffer
+from app.core.config import Config
+from app.core.io import CheckpointManager
+from app.core.pipeline import DictationPipeline
+from app.core.streaming import StageThread
+from app.core.vad import VADSegmenter
+
+
+class TestStageThread(unittest.TestCase):
+    def setUp(self):
+        self.stop_event = threading.Event()
+
+    def tearDown(self):
+        self.stop_event.set()
+
+    def test_chained_stages(self):
+        source = StageThread("source", lambda: iter(range(100)), 2, self.stop_event)
+        doubled = StageThread(
+            "double",
+            lambda: (item * 2 for item in source),
+            2,
+            self.stop_event,
+        )
+        source.start()
+        doubled.start()
+
+        self.assertEqual(list(doubled), [item * 2 for item in range(100)])
+
+    def test_error_propagates(self):
+        def produce():
+            yield 1
+            raise ValueError("decoder crashed")
+
+        stage = StageThread("failing", produce, 4, self.stop_event)
+        stage.start()
+
+        items = []
+        with self.assertRaises(RuntimeError):
+            for item in stage:
+                items.append(item)
+        self.assertEqual(items, [1])
+
+    def test_stop_unblocks_producer(self):
+        stage = StageThread("blocked", lambda: iter(range(100)), 1, self.stop_event)
+        stage.start()
+
+        self.stop_event.set()
+        stage.join(timeout=2)
+        self.assertFalse(stage.is_alive())
+
+
+class TestGrowingAudioBuffer(unittest.TestCase):
+    def test_append_grows(self):
+        audio = GrowingAudioBuffer(16000, capacity=10)
+        chunks = [np.arange(i * 7, (i + 1) * 7, dtype=np.int16) for i in range(10)]
+
+        view = None
+        for idx, chunk in enumerate(chunks):
+            audio.append(chunk)
+            if idx == 0:
+                view = audio.slice(0.0, 1.0)
+
+        np.testing.assert_array_equal(audio.samples, np.arange(70, dtype=np.int16))
+        np.testing.assert_array_equal(view, np.arange(7, dtype=np.int16))
+        self.assertAlmostEqual(audio.duration, 70 / 16000)
+
+
+class RecordingEngine:
+    def __init__(self):
+        self.indices = []
+
+    def iter_transcribe(self, audio, indexed_segments, options=None):
+        for idx, segment in indexed_segments:
+            self.indices.append(idx)
+            yield idx, [{"start": segment["start"], "end": segment["end"], "text": f"live {idx}", "words": []}]
+
+
+class TestStreamingResume(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.stop_event = threading.Event()
+
+    def tearDown(self):
+        self.stop_event.set()
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_resume_from_vad_stream(self):
+        config = Config(
+            input_file="meeting.mp3",
+            output_dir=self.test_dir / "output",
+            temp_dir=self.test_dir / "temp",
+            streaming=True,
+            use_cache=False,
+            use_workspace=False,
+        )
+        segments = [{"start": float(idx), "end": idx + 0.5} for idx in range(4)]
+        restored = [{"start": 0.0, "end": 0.5, "text": "restored 0", "words": []}]
+        CheckpointManager(config.checkpoint_file).append_segment(0, restored)
+
+        # The segments come from the stream below; the VAD model is never called.
+        pipeline = DictationPipeline(
+            config,
+            vad_segmenter=VADSegmenter(config, model=object()),
+            asr_engine=RecordingEngine(),
+        )
+        pipeline.progress_callback = lambda current, total, message: None
+
+        stream = StageThread("vad", lambda: iter(segments), 2, self.stop_event)
+        stream.start()
+        pipeline._export(lambda sink: pipeline._transcribe_segments(GrowingAudioBuffer(16000), stream, sink))
+
+        with open(config.output_dir / "transcript.json", 'r', encoding='utf-8') as f:
+            transcript = json.load(f)
+        self.assertEqual(pipeline.asr_engine.indices, [1, 2, 3])
+        self.assertEqual(
+            [seg["text"] for seg in transcript["segments"]],
+            ["restored 0", "live 1", "live 2", "live 3"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+from app.core.terms import TermNormalizer, load_terms
+from benchmarks.term_normalizer import naive_normalize, synthetic_segments, synthetic_terms
+
+
+class TestTermNormalizer(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_load_terms_file(self):
+        path = self.test_dir / "terms.tsv"
+        path.write_text("# lab terms\nHbA1c\n\nhemoglobin a1c\tHbA1c\n", encoding="utf-8")
+
+        self.assertEqual(load_terms(path), {"hba1c": "HbA1c", "hemoglobin a1c": "HbA1c"})
+
+    def test_malformed_line_is_reported(self):
+        path = self.test_dir / "terms.tsv"
+        path.write_text("a\tb\tc\n", encoding="utf-8")
+
+        with self.assertRaises(ValueError):
+            load_terms(path)
+
+    def test_longest_term_wins(self):
+        normalizer = TermNormalizer({"pcr": "PCR", "pcr test": "PCR-Test", "maldi-tof": "MALDI-TOF"})
+
+        self.assertEqual(
+            normalizer.normalize("pcr test and pcr tests on maldi-tof"),
+            "PCR-Test and PCR tests on MALDI-TOF",
+        )
+
+    def test_word_boundaries(self):
+        normalizer = TermNormalizer({"alt": "ALT"})
+
+        self.assertEqual(normalizer.normalize("alt altitude salt Alt"), "ALT altitude salt ALT")
+
+    def test_default_dictionary(self):
+        normalizer = TermNormalizer.from_file()
+
+        self.assertEqual(normalizer.normalize("lis emr qc hba1c"), "LIS EMR QC HbA1c")
+
+    def test_matches_per_term_loop(self):
+        terms = synthetic_terms(300)
+        normalizer = TermNormalizer(terms)
+
+        for text in synthetic_segments(terms, 50):
+            self.assertEqual(normalizer.normalize(text), naive_normalize(text, terms))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+import json
+import tempfile
+import shutil
+from pathlib import Path
+
+from app.core.config import Config
+from app.core.postprocess import PostProcessor
+from app.core.transcript import Transcript, SegmentView
+
+
+class TestTranscript(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.segments = [
+            {
+                "start": 0.5,
+                "end": 2.0,
+                "text": "EMR 연동 결정",
+                "words": [
+                    {"start": 0.5, "end": 1.0, "word": " EMR", "probability": 0.875},
+                    {"start": 1.0, "end": 1.5, "word": " 연동", "probability": 0.5},
+                    {"start": 1.5, "end": 2.0, "word": " 결정", "probability": 0.25},
+                ],
+            },
+            {"start": 3.0, "end": 4.0, "text": "", "words": []},
+            {
+                "start": 5.0,
+                "end": 6.0,
+                "text": "QC",
+                "words": [{"start": 5.0, "end": 6.0, "word": " QC", "probability": 1.0}],
+            },
+        ]
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_round_trip_to_dicts(self):
+        transcript = Transcript.from_dicts(self.segments)
+
+        self.assertEqual(len(transcript), 3)
+        self.assertEqual(transcript.word_count, 4)
+        self.assertEqual(transcript.to_dicts(), self.segments)
+
+    def test_views(self):
+        transcript = Transcript.from_dicts(self.segments)
+        segment = transcript[-1]
+
+        self.assertIsInstance(segment, SegmentView)
+        self.assertFalse(hasattr(segment, "__dict__"))
+        self.assertEqual(segment.text, "QC")
+        self.assertEqual(segment["start"], 5.0)
+        self.assertEqual(transcript[0].words[1].word, " 연동")
+        self.assertEqual(transcript[0].words[2]["probability"], 0.25)
+        with self.assertRaises(IndexError):
+            transcript[3]
+
+    def test_npz_round_trip(self):
+        path = self.test_dir / "transcript.npz"
+        Transcript.from_dicts(self.segments).save(path)
+
+        self.assertEqual(Transcript.load(path).to_dicts(), self.segments)
+
+    def test_probabilities_round_trip_exactly(self):
+        # Not representable in float32; must come back as the same float.
+        segment = {
+            "start": 0.1,
+            "end": 0.7,
+            "text": "검토",
+            "words": [{"start": 0.1, "end": 0.7, "word": " 검토", "probability": 0.9123}],
+        }
+        transcript = Transcript.from_dicts([segment])
+
+        self.assertEqual(transcript.to_dicts(), [segment])
+        self.assertEqual(transcript[0].to_dict(), segment)
+        self.assertEqual(json.dumps(transcript[0].words[0].to_dict()), json.dumps(segment["words"][0]))
+
+        path = self.test_dir / "transcript.npz"
+        transcript.save(path)
+        self.assertEqual(Transcript.load(path).to_dicts(), [segment])
+
+    def test_exporters_accept_transcript(self):
+        config = Config(input_file="dummy.mp3", output_dir=str(self.test_dir), temp_dir=str(self.test_dir / "temp"))
+        json_path = self.test_dir / "transcript.json"
+
+        PostProcessor(config).export_json(Transcript.from_dicts(self.segments), json_path)
+
+        with open(json_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)["segments"], self.segments)
+
+    def test_empty(self):
+        transcript = Transcript.from_dicts([])
+
+        self.assertEqual(len(transcript), 0)
+        self.assertEqual(transcript.to_dicts(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
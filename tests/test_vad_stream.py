@@ -0,0 +1,80 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from app.core.audio import AudioBuffer
+from app.core.config import Config
+from app.core.vad import VADSegmenter
+from app.core.vad_backends import DEFAULT_VAD_MODEL
+
+
+class EnergyModel:
+    def __call__(self, frame: np.ndarray) -> float:
+        return 1.0 if np.abs(frame).mean() > 0.05 else 0.0
+
+    def reset_states(self):
+        pass
+
+
+class TestVADModelPath(unittest.TestCase):
+    def test_default_model_ships_with_app(self):
+        # Resolved from the package, not the working directory.
+        root = Path(__file__).resolve().parent.parent
+        self.assertEqual(DEFAULT_VAD_MODEL, root / "app" / "resources" / "silero_vad.onnx")
+
+        spec = (root / "build.spec").read_text(encoding="utf-8")
+        self.assertIn("('app/resources/silero_vad.onnx', 'app/resources')", spec)
+
+
+class TestVADStream(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.config = Config(
+            input_file="dummy.mp3",
+            output_dir=str(self.test_dir / "output"),
+            temp_dir=str(self.test_dir / "temp"),
+            min_silence_duration_ms=500,
+            max_merge_gap_ms=1000,
+        )
+        self.segmenter = VADSegmenter(self.config, model=EnergyModel())
+
+        # speech at 1-3 s, 3.5-4 s and 8-9 s
+        samples = np.zeros(16000 * 10, dtype=np.int16)
+        for start, end in [(1.0, 3.0), (3.5, 4.0), (8.0, 9.0)]:
+            samples[int(start * 16000):int(end * 16000)] = 8000
+        self.audio = AudioBuffer(samples, 16000)
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_segment_audio(self):
+        segments = self.segmenter.segment_audio(self.audio)
+
+        self.assertEqual(len(segments), 2)
+        self.assertAlmostEqual(segments[0][0], 1.0, delta=0.1)
+        self.assertAlmostEqual(segments[0][1], 4.0, delta=0.1)
+        self.assertAlmostEqual(segments[1][0], 8.0, delta=0.1)
+        self.assertAlmostEqual(segments[1][1], 9.0, delta=0.1)
+
+    def test_chunking_does_not_change_result(self):
+        expected = self.segmenter.segment_audio(self.audio)
+        streamed = list(self.segmenter.segment_stream(self.audio.iter_chunks(777)))
+
+        self.assertEqual(streamed, expected)
+
+    def test_trailing_speech_is_closed(self):
+        samples = np.zeros(16000 * 2, dtype=np.int16)
+        samples[16000:] = 8000
+
+        segments = self.segmenter.segment_audio(AudioBuffer(samples, 16000))
+
+        self.assertEqual(len(segments), 1)
+        self.assertAlmostEqual(segments[0][1], 2.0, delta=0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+
+from app.core.packing import WindowPacker
+
+SR = 16000
+
+
+def region(start_sec: float, end_sec: float, probs=None) -> dict:
+    data = {"start": int(start_sec * SR), "end": int(end_sec * SR)}
+    if probs is not None:
+        data["probs"] = probs
+        data["probs_start"] = data["start"]
+    return data
+
+
+class TestWindowPacker(unittest.TestCase):
+    def setUp(self):
+        self.packer = WindowPacker(SR, max_window_ms=10000, max_gap_ms=2000, frame_size=512)
+
+    def test_short_regions_fill_one_window(self):
+        windows = list(self.packer.pack([
+            region(0.0, 2.0),
+            region(3.0, 5.0),
+            region(6.0, 9.0),
+        ]))
+
+        self.assertEqual(windows, [(0.0, 9.0)])
+        self.assertEqual(self.packer.stats()["windows"], 1)
+        self.assertAlmostEqual(self.packer.stats()["fill_ratio"], 0.9)
+
+    def test_window_never_exceeds_maximum(self):
+        windows = list(self.packer.pack([
+            region(0.0, 4.0),
+            region(5.0, 8.0),
+            region(9.0, 12.0),
+        ]))
+
+        self.assertEqual(windows, [(0.0, 8.0), (9.0, 12.0)])
+
+    def test_long_silence_is_not_crossed(self):
+        windows = list(self.packer.pack([region(0.0, 1.0), region(4.0, 5.0)]))
+
+        self.assertEqual(windows, [(0.0, 1.0), (4.0, 5.0)])
+
+    def test_long_region_is_split_at_lowest_probability(self):
+        # 25 s of speech with a dip at 7 s and another at 16 s.
+        frames = int(25.0 * SR) // 512
+        probs = np.ones(frames, dtype=np.float32)
+        for dip_sec in (7.0, 16.0):
+            probs[int(dip_sec * SR) // 512] = 0.1
+
+        windows = list(self.packer.pack([region(0.0, 25.0, probs)]))
+
+        self.assertEqual(len(windows), 3)
+        self.assertAlmostEqual(windows[0][1], 7.0, delta=0.05)
+        self.assertAlmostEqual(windows[1][1], 16.0, delta=0.05)
+        self.assertTrue(all(end - start <= 10.0 for start, end in windows))
+        self.assertEqual(self.packer.stats()["splits"], 2)
+
+    def test_long_region_without_probabilities_is_cut_at_maximum(self):
+        windows = list(self.packer.pack([region(0.0, 25.0)]))
+
+        self.assertEqual(windows, [(0.0, 10.0), (10.0, 20.0), (20.0, 25.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
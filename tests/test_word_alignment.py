@@ -0,0 +1,215 @@
+import json
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from app.core.alignment import WordAligner, WORDS_FILE
+from app.core.asr import ASREngine
+from app.core.asr_backends import FakeASRBackend
+from app.core.cache import decode_params
+from app.core.config import Config
+from app.core.pipeline import DictationPipeline
+from app.core.vad import VADSegmenter
+from app.core.workers import ASRWorkerPool
+from app.server import MAX_ALIGNERS, TranscriptionServer
+from benchmarks.pipeline import EnergyVADModel, synthetic_audio
+from tests.test_asr_equivalence import FakeConverter
+
+
+class TestWordTimestampConfig(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def _config(self, **overrides) -> Config:
+        return Config(
+            input_file="meeting.mp3",
+            output_dir=self.test_dir / "output",
+            temp_dir=self.test_dir / "temp",
+            **overrides,
+        )
+
+    def test_word_timestamps_follow_formats(self):
+        self.assertTrue(self._config().word_timestamps)
+        self.assertTrue(self._config(formats=["jsonl"]).word_timestamps)
+        self.assertFalse(self._config(formats=["md", "srt", "minutes"]).word_timestamps)
+        self.assertTrue(self._config(formats=["md"], export_jsonl=True).word_timestamps)
+        self.assertFalse(self._config(defer_word_alignment=True).word_timestamps)
+
+    def test_deferred_words_need_json(self):
+        with self.assertRaises(ValueError):
+            self._config(formats=["md", "jsonl"], defer_word_alignment=True)
+        self.assertTrue(self._config(formats=["json"], defer_word_alignment=True).defer_word_alignment)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            self._config(formats=["json", "docx"])
+
+    def test_decode_params_unchanged_with_words(self):
+        # Caches from before --formats stay valid for the default outputs.
+        self.assertNotIn("word_timestamps", decode_params(self._config()))
+        self.assertFalse(decode_params(self._config(formats=["srt"]))["word_timestamps"])
+
+    def test_fake_backend_skips_words(self):
+        samples = np.random.default_rng(0).normal(0, 0.1, 16000 * 3).astype(np.float32)
+        with_words = FakeASRBackend(self._config()).transcribe(samples)
+        without_words = FakeASRBackend(self._config(formats=["srt"])).transcribe(samples)
+
+        self.assertTrue(with_words[0]["words"])
+        self.assertEqual([result["words"] for result in without_words], [[]])
+        self.assertEqual(
+            [result["text"] for result in without_words],
+            [result["text"] for result in with_words],
+        )
+
+
+class TestWordAlignment(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.audio_dir = Path(tempfile.mkdtemp())
+        cls.samples = synthetic_audio(cls.audio_dir / "meeting.npy", 60.0)
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.samples
+        shutil.rmtree(cls.audio_dir, ignore_errors=True)
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.input_file = self.test_dir / "meeting.mp3"
+        self.input_file.write_bytes(b"fake mp3 payload")
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def _run(self, name: str, **overrides) -> Config:
+        values = dict(
+            input_file=self.input_file,
+            output_dir=self.test_dir / name,
+            temp_dir=self.test_dir / "temp",
+            cache_dir=self.test_dir / "cache",
+            workspace_dir=self.test_dir / "workspace",
+            asr_backend="fake",
+            use_cache=False,
+        )
+        values.update(overrides)
+        config = Config(**values)
+
+        pipeline = DictationPipeline(config, vad_segmenter=VADSegmenter(config, model=EnergyVADModel()))
+        pipeline.audio_converter = FakeConverter(self.samples)
+        pipeline.progress_callback = lambda current, total, message: None
+        self.assertTrue(pipeline.run())
+        return config
+
+    def _segments(self, config: Config):
+        with open(config.output_dir / "transcript.json", 'r', encoding='utf-8') as f:
+            return json.load(f)["segments"]
+
+    def test_only_requested_outputs(self):
+        config = self._run("subtitles", formats=["md"])
+
+        self.assertTrue((config.output_dir / "transcript.md").exists())
+        for name in ("transcript.json", "transcript.jsonl", "transcript.srt", "minutes.md"):
+            self.assertFalse((config.output_dir / name).exists(), name)
+
+    def test_deferred_alignment(self):
+        config = self._run("deferred", defer_word_alignment=True)
+        segments = self._segments(config)
+        self.assertTrue(segments)
+        self.assertTrue(all(segment["words"] == [] for segment in segments))
+
+        engine = ASREngine(config)
+        aligner = WordAligner(config, engine)
+        words = aligner.align([1])[1]
+
+        self.assertTrue(words)
+        self.assertEqual(engine.backend.calls, 1)
+        self.assertGreaterEqual(words[0]["start"], segments[1]["start"])
+        self.assertLessEqual(words[-1]["end"], segments[1]["end"] + 0.01)
+        self.assertIn(words[0]["word"].strip(), segments[1]["text"])
+
+        # Aligned segments come from words.jsonl, also for a new aligner.
+        self.assertEqual(aligner.align([1]), {1: words})
+        restored = WordAligner(config, engine)
+        self.assertEqual(restored.align([1]), {1: words})
+        self.assertEqual(engine.backend.calls, 1)
+        self.assertEqual(len((config.output_dir / WORDS_FILE).read_text(encoding="utf-8").splitlines()), 1)
+
+        with self.assertRaises(IndexError):
+            aligner.align([len(segments)])
+
+    def test_aligned_run_reuses_words(self):
+        config = self._run("aligned")
+        engine = ASREngine(config)
+
+        words = WordAligner(config, engine).align([0])[0]
+
+        self.assertEqual(words, self._segments(config)[0]["words"])
+        self.assertEqual(engine.backend.calls, 0)
+
+    def test_server_segment_words(self):
+        config = self._run("served", defer_word_alignment=True)
+        server = TranscriptionServer(config)
+        server.asr_engine = ASREngine(config)
+        job = server.submit({"input": str(self.input_file), "output": str(config.output_dir)})
+
+        with self.assertRaises(ValueError):
+            server.segment_words(job.job_id, 0)
+        with self.assertRaises(KeyError):
+            server.segment_words("missing", 0)
+
+        job.status = "done"
+        self.assertTrue(server.segment_words(job.job_id, 0))
+        self.assertTrue(server.segment_words(job.job_id, 0))
+        self.assertEqual(server.asr_engine.backend.calls, 1)
+
+    def test_server_shares_engine_behind_worker_pool(self):
+        config = self._run("pooled", defer_word_alignment=True)
+        server = TranscriptionServer(config.derive(num_workers=2))
+        server.asr_engine = ASRWorkerPool(server.config)
+        jobs = [
+            server.submit({"input": str(self.input_file), "output": str(config.output_dir)})
+            for _ in range(2)
+        ]
+        for job in jobs:
+            job.status = "done"
+            self.assertTrue(server.segment_words(job.job_id, 0))
+
+        first, second = (server.aligners[job.job_id].engine for job in jobs)
+        self.assertIsInstance(first, ASREngine)
+        self.assertIs(first, second)
+        self.assertIsNone(server.asr_engine.executor)
+
+    def test_server_caps_aligners(self):
+        config = self._run("capped", defer_word_alignment=True)
+        server = TranscriptionServer(config)
+        server.asr_engine = ASREngine(config)
+        jobs = [
+            server.submit({"input": str(self.input_file), "output": str(config.output_dir)})
+            for _ in range(MAX_ALIGNERS + 1)
+        ]
+        for job in jobs:
+            job.status = "done"
+
+        for job in jobs[:MAX_ALIGNERS]:
+            server.segment_words(job.job_id, 0)
+        server.segment_words(jobs[0].job_id, 0)
+        server.segment_words(jobs[-1].job_id, 0)
+
+        self.assertEqual(len(server.aligners), MAX_ALIGNERS)
+        self.assertNotIn(jobs[1].job_id, server.aligners)
+        self.assertIn(jobs[0].job_id, server.aligners)
+        # A re-created aligner reads the words back instead of decoding.
+        self.assertTrue(server.segment_words(jobs[1].job_id, 0))
+        self.assertEqual(server.asr_engine.backend.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
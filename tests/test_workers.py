@@ -0,0 +1,135 @@
+import unittest
+import tempfile
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from scipy.io import wavfile
+
+from app.core import workers
+from app.core.asr import ASREngine
+from app.core.asr_backends import FakeASRBackend
+from app.core.audio import AudioBuffer
+from app.core.config import Config
+from app.core.metrics import RunMetrics
+from app.core.workers import ASRWorkerPool
+
+
+class SlowEngine:
+    # Stands in for the per-process ASREngine; the pool runs on threads so
+    # the test controls which batch finishes first.
+    def __init__(self, config, delays):
+        self.config = config
+        self.delays = delays
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def iter_transcribe(self, audio, batch, options=None):
+        time.sleep(max(self.delays.get(idx, 0.0) for idx, _ in batch))
+        with self.lock:
+            self.calls.append([idx for idx, _ in batch])
+        for idx, segment in batch:
+            yield idx, [{"start": segment["start"], "end": segment["end"], "text": str(idx), "words": []}]
+
+
+class TestASRWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.wav_path = self.test_dir / "audio.wav"
+        wavfile.write(str(self.wav_path), 16000, np.zeros(16000 * 10, dtype=np.int16))
+        self.audio = AudioBuffer.from_wav(self.wav_path)
+        # Window i lasts i + 1 seconds.
+        self.segments = [(idx, {"start": float(idx), "end": 2.0 * idx + 1}) for idx in range(4)]
+
+    def tearDown(self):
+        workers._worker_engine = None
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def _pool(self, max_workers: int, **overrides) -> ASRWorkerPool:
+        values = dict(
+            input_file="meeting.mp3",
+            output_dir=self.test_dir / "output",
+            temp_dir=self.test_dir / "temp",
+            num_workers=max_workers,
+        )
+        values.update(overrides)
+        pool = ASRWorkerPool(Config(**values))
+        pool.executor = ThreadPoolExecutor(max_workers=max_workers)
+        return pool
+
+    def test_worker_config_splits_threads(self):
+        pool = ASRWorkerPool(Config(
+            input_file="meeting.mp3",
+            output_dir=self.test_dir / "output",
+            temp_dir=self.test_dir / "temp",
+            num_workers=3,
+            cpu_threads=8,
+        ))
+        worker_config = pool._worker_config()
+
+        self.assertEqual(worker_config.cpu_threads, 2)
+        self.assertEqual(worker_config.num_workers, 1)
+        self.assertEqual(pool.config.cpu_threads, 8)
+
+        pool.config.cpu_threads = 2
+        pool.num_workers = 4
+        self.assertEqual(pool._worker_config().cpu_threads, 1)
+
+    def test_needs_file_backed_audio(self):
+        pool = ASRWorkerPool(Config(
+            input_file="meeting.mp3",
+            output_dir=self.test_dir / "output",
+            temp_dir=self.test_dir / "temp",
+            num_workers=2,
+        ))
+
+        with self.assertRaises(ValueError):
+            next(pool.iter_transcribe(AudioBuffer(np.zeros(16000, dtype=np.int16), 16000), self.segments))
+        self.assertIsNone(pool.executor)
+
+    def test_yields_in_completion_order(self):
+        # The longest window is handed out first but finishes last.
+        pool = self._pool(2)
+        workers._worker_engine = SlowEngine(pool.config, {3: 0.3})
+        try:
+            completed = [idx for idx, _ in pool.iter_transcribe(self.audio, self.segments)]
+        finally:
+            pool.close()
+
+        self.assertEqual(sorted(completed), [0, 1, 2, 3])
+        self.assertEqual(completed[-1], 3)
+        self.assertEqual(workers._worker_engine.calls[0], [2])
+
+    def test_worker_metrics_reach_the_job(self):
+        pool = self._pool(2, asr_backend="fake", adaptive_decoding=True)
+        workers._worker_engine = ASREngine(pool.config, backend=FakeASRBackend(pool.config))
+        metrics = RunMetrics()
+        try:
+            with metrics.activate():
+                list(pool.iter_transcribe(self.audio, self.segments))
+        finally:
+            pool.close()
+
+        self.assertEqual(metrics.counters["decode_windows"], len(self.segments))
+        self.assertEqual(metrics.histograms["asr_segment_seconds"].count, len(self.segments))
+        self.assertEqual(sum(metrics.histograms["asr_segment_rtf"].counts), len(self.segments))
+
+    def test_close_cancels_pending_batches(self):
+        pool = self._pool(1)
+        workers._worker_engine = SlowEngine(pool.config, {idx: 0.1 for idx in range(4)})
+
+        results = pool.iter_transcribe(self.audio, self.segments)
+        idx, _ = next(results)
+        results.close()
+        pool.close()
+
+        self.assertEqual(idx, 3)
+        self.assertLess(len(workers._worker_engine.calls), len(self.segments))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from app.core.audio import AudioBuffer
+from app.core.cache import FailedDecode
+from app.core.config import Config
+from app.core.pipeline import DictationPipeline
+from app.core.workspace import Workspace
+
+
+class FakeConverter:
+    def __init__(self):
+        self.calls = 0
+
+    def decode_pcm(self):
+        self.calls += 1
+        return AudioBuffer(np.arange(16000 * 4, dtype=np.int16), 16000)
+
+
+class FakeVAD:
+    def __init__(self):
+        self.calls = 0
+
+    def segment_audio(self, audio):
+        self.calls += 1
+        return [(0.0, 1.0), (2.0, 3.0)]
+
+    def segments_to_dict(self, segments):
+        return [{"start": start, "end": end} for start, end in segments]
+
+
+class FakeEngine:
+    def __init__(self):
+        self.calls = []
+
+    def iter_transcribe(self, audio, indexed_segments, options=None):
+        for idx, segment in indexed_segments:
+            self.calls.append(idx)
+            yield idx, [{
+                "start": segment["start"],
+                "end": segment["end"],
+                "text": f"segment {idx}",
+                "words": [],
+            }]
+
+
+class FailingEngine(FakeEngine):
+    def __init__(self, failing):
+        super().__init__()
+        self.failing = failing
+
+    def iter_transcribe(self, audio, indexed_segments, options=None):
+        for idx, results in super().iter_transcribe(audio, indexed_segments, options):
+            yield idx, FailedDecode() if idx in self.failing else results
+
+
+class TestWorkspace(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.input_file = self.test_dir / "meeting.mp3"
+        self.input_file.write_bytes(b"fake mp3 payload")
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def _config(self, **overrides) -> Config:
+        values = dict(
+            input_file=self.input_file,
+            output_dir=self.test_dir / "output",
+            temp_dir=self.test_dir / "temp",
+            workspace_dir=self.test_dir / "workspace",
+            use_cache=False,
+        )
+        values.update(overrides)
+        return Config(**values)
+
+    def _run(self, config: Config, engine=None):
+        vad, converter = FakeVAD(), FakeConverter()
+        engine = engine or FakeEngine()
+        pipeline = DictationPipeline(config, vad_segmenter=vad, asr_engine=engine)
+        pipeline.audio_converter = converter
+        audio, segments = pipeline.prepare()
+        pipeline.transcribe_and_export(audio, segments)
+        return converter.calls, vad.calls, engine.calls
+
+    def test_stage_keys_chain(self):
+        base = Workspace(self._config())
+        vad_changed = Workspace(self._config(vad_threshold=0.6))
+        asr_changed = Workspace(self._config(beam_size=1))
+
+        self.assertEqual(base.root, vad_changed.root)
+        self.assertEqual(base.pcm_key, vad_changed.pcm_key)
+        self.assertNotEqual(base.segments_key, vad_changed.segments_key)
+        self.assertNotEqual(base.asr_key, vad_changed.asr_key)
+
+        self.assertEqual(base.segments_key, asr_changed.segments_key)
+        self.assertNotEqual(base.asr_key, asr_changed.asr_key)
+
+    def test_pcm_round_trip_is_mapped(self):
+        workspace = Workspace(self._config())
+        samples = np.arange(1000, dtype=np.int16)
+
+        audio = workspace.save_pcm(AudioBuffer(samples, 16000))
+
+        self.assertIsInstance(audio.samples, np.memmap)
+        self.assertEqual(audio.path, workspace.pcm_path)
+        np.testing.assert_array_equal(workspace.load_pcm().samples, samples)
+        np.testing.assert_array_equal(AudioBuffer.load(audio.path).samples, samples)
+
+    def test_rerun_reuses_all_stages(self):
+        self.assertEqual(self._run(self._config()), (1, 1, [0, 1]))
+        self.assertEqual(self._run(self._config()), (0, 0, []))
+        self.assertTrue((self.test_dir / "output" / "transcript.json").exists())
+
+    def test_failed_segment_decoded_again(self):
+        self.assertEqual(self._run(self._config(), FailingEngine({1})), (1, 1, [0, 1]))
+
+        self.assertEqual(self._run(self._config()), (0, 0, [1]))
+        self.assertEqual(self._run(self._config()), (0, 0, []))
+
+    def test_changed_vad_setting_reuses_pcm_only(self):
+        self._run(self._config())
+
+        self.assertEqual(self._run(self._config(min_silence_duration_ms=500)), (0, 1, [0, 1]))
+
+    def test_prune_keeps_recent_workspaces(self):
+        for idx in range(3):
+            other = self.test_dir / f"other{idx}.mp3"
+            other.write_bytes(f"payload {idx}".encode())
+            Workspace(self._config(input_file=other))
+
+        workspace = Workspace(self._config())
+        workspace.prune(2)
+
+        remaining = list((self.test_dir / "workspace").iterdir())
+        self.assertEqual(len(remaining), 2)
+        self.assertIn(workspace.root, remaining)
+
+
+if __name__ == "__main__":
+    unittest.main()